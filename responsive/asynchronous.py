@@ -0,0 +1,279 @@
+"""Module asynchronous.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import asyncio
+import inspect
+import threading
+from collections import deque
+from collections.abc import Coroutine
+from typing import Any
+
+from responsive.constants import OverflowPolicy
+from responsive.event import ChangeEvent
+from responsive.observer import Observer
+from responsive.subject import ChangeQueue, Subject
+
+
+class AsyncObserver(Observer):
+    """Observer with a coroutine being awaited for each notification (see `update_async`)."""
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> Coroutine:
+        """Called when related subject has changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+
+        Returns:
+            coroutine of `update_async` (awaited by the subject).
+        """
+        return self.update_async(subject, *args, **kwargs)
+
+    async def update_async(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when related subject has changed (awaited).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        raise NotImplementedError()
+
+
+class AsyncSubject(Subject, Observer):
+    """Subject delivering its notifications from a task of an asyncio event loop.
+
+    A notification is put into a queue only; the task delivers the notifications
+    in order awaiting the observers of one notification concurrently. Observers
+    can be instances of `AsyncObserver` or of `Observer`. Register the subject as
+    observer of a responsive object to get its changes delivered asynchronously.
+    Notifications can be done from any thread. Old and new dictionaries, lists
+    and classes of a change are copied when queued (see `get_snapshot`).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        max_errors: int = 100,
+    ):
+        """Initialize subject with empty queue.
+
+        Args:
+            maxsize (int): maximum number of queued notifications (0 means no limit)
+            policy (OverflowPolicy): what to do when the queue is full
+            max_errors (int): number of the last exceptions of observers being kept
+        """
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__policy = policy
+        self.__queue = ChangeQueue(coalesce=False)
+        self.__condition = threading.Condition()
+        self.__loop = None
+        self.__task = None
+        self.__wakeup = None
+        self.__idle = None
+        self.__count_dropped = 0
+        self.__errors: deque[Exception] = deque(maxlen=max_errors)
+
+    def start(self) -> None:
+        """Start task delivering the notifications (must be called with a running loop)."""
+        self.__loop = asyncio.get_running_loop()
+        self.__wakeup = asyncio.Event()
+        self.__idle = asyncio.Event()
+        self.__task = self.__loop.create_task(self.__run())
+        self.__wake()
+
+    async def join(self) -> None:
+        """Wait until all queued notifications have been delivered (none before `start`)."""
+        if self.__task is None:
+            return
+
+        while True:
+            await self.__idle.wait()
+            with self.__condition:
+                if len(self.__queue) == 0:  # pylint: disable=compare-to-zero
+                    return
+            await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        """Deliver all queued notifications and stop the task (nothing before `start`)."""
+        if self.__task is None:
+            return
+
+        await self.join()
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    def dispatch(self, *args: Any, **kwargs: Any) -> None:
+        """Putting notification into the queue.
+
+        Args:
+            *args (Any): not supported (notifications must be key/value arguments)
+            **kwargs (Any): key/value arguments of the notification
+
+        Raises:
+            ValueError: when positional arguments are given
+        """
+        if len(args) > 0:
+            raise ValueError("AsyncSubject does support key/value arguments only")
+
+        self.__enqueue(kwargs)
+
+    def dispatch_change(self, event: ChangeEvent) -> None:
+        """Putting change into the queue.
+
+        Args:
+            event (ChangeEvent): the change
+
+        Raises:
+            RuntimeError: when the queue is full (policy BLOCK) and waiting would deadlock
+        """
+        self.__enqueue(event)
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when related subject has changed (notification is queued).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        self.notify(*args, **kwargs)
+
+    def on_change(self, subject: object, event: ChangeEvent) -> None:
+        """Called when related subject has changed (change is queued).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+        """
+        self.notify_change(event)
+
+    def __enqueue(self, kwargs: dict[str, Any] | ChangeEvent) -> None:
+        """Putting notification or change into the queue and wake up the task."""
+        with self.__condition:
+            if not self.__coalesce(kwargs):
+                while 0 < self.__maxsize <= len(self.__queue) and not self.__make_space():
+                    self.__condition.wait()
+                self.__queue.add(kwargs)
+
+        if self.__loop is not None:
+            if self.__is_loop_thread():
+                self.__wake()
+            else:
+                self.__loop.call_soon_threadsafe(self.__wake)
+
+    def get_queue_size(self) -> int:
+        """Get number of queued notifications."""
+        with self.__condition:
+            return len(self.__queue)
+
+    def get_count_dropped(self) -> int:
+        """Get number of notifications dropped because the queue was full."""
+        return self.__count_dropped
+
+    def get_errors(self) -> list[Exception]:
+        """Get the last exceptions raised by observers while being notified."""
+        return list(self.__errors)
+
+    def __coalesce(self, kwargs: dict[str, Any] | ChangeEvent) -> bool:
+        """Replace queued change of same value in full queue with policy COALESCE (lock held).
+
+        Returns:
+            true when the change has replaced a queued one.
+        """
+        return (
+            self.__policy == OverflowPolicy.COALESCE
+            and 0 < self.__maxsize <= len(self.__queue)
+            and self.__queue.replace(kwargs)
+        )
+
+    def __make_space(self) -> bool:
+        """Make space in full queue depending on policy (lock must be held).
+
+        Returns:
+            true when the notification can be queued now.
+
+        Raises:
+            RuntimeError: when waiting for space would deadlock.
+        """
+        if self.__policy == OverflowPolicy.BLOCK:
+            if self.__loop is None or self.__is_loop_thread():
+                raise RuntimeError("queue of notifications is full")
+            return False
+
+        self.__queue.pop()
+        self.__count_dropped += 1
+        return True
+
+    def __is_loop_thread(self) -> bool:
+        """Checking current thread to be the one of the event loop."""
+        try:
+            return asyncio.get_running_loop() is self.__loop
+        except RuntimeError:
+            return False
+
+    def __wake(self) -> None:
+        """Signal the task that there are queued notifications (called in loop)."""
+        self.__idle.clear()
+        self.__wakeup.set()
+
+    async def __run(self) -> None:
+        """Delivering queued notifications until the task is cancelled."""
+        while True:
+            await self.__wakeup.wait()
+            self.__wakeup.clear()
+            while True:
+                with self.__condition:
+                    if len(self.__queue) == 0:  # pylint: disable=compare-to-zero
+                        self.__idle.set()
+                        break
+                    kwargs = self.__queue.pop()
+                    self.__condition.notify_all()
+                await self.__deliver(kwargs)
+
+    async def __deliver(self, kwargs: dict[str, Any] | ChangeEvent) -> None:
+        """Delivering one notification awaiting the observers concurrently."""
+        awaitables = []
+        for observer in self.get_interested_observers(kwargs):
+            try:
+                if isinstance(kwargs, ChangeEvent):
+                    result = observer.on_change(self, kwargs)
+                else:
+                    result = observer.on_notify(self, **kwargs)
+            except Exception as exception:  # pylint: disable=broad-except
+                self.__errors.append(exception)
+                continue
+            if inspect.isawaitable(result):
+                awaitables.append(result)
+
+        for result in await asyncio.gather(*awaitables, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.__errors.append(result)
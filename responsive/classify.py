@@ -0,0 +1,283 @@
+"""Module classify.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import dataclasses
+from collections.abc import Callable, Iterator, MutableMapping
+from enum import Enum
+from typing import Any
+
+from responsive.constants import ValueKind
+
+
+class SlotFields(MutableMapping):
+    """Fields of an object with `__slots__` as mapping (only the slots being set)."""
+
+    __slots__ = ("obj", "names", "with_dict")
+
+    def __init__(self, obj: object, names: tuple[str, ...], with_dict: bool = False):
+        """Initialize mapping.
+
+        Args:
+            obj (object): the object
+            names (tuple[str, ...]): names of the slots
+            with_dict (bool): when true the object has an instance dictionary too
+        """
+        self.obj = obj
+        self.names = names
+        self.with_dict = with_dict
+
+    def __getitem__(self, key: str) -> Any:
+        """Get value of a field (KeyError when it is not set)."""
+        if key not in self.names:
+            if self.with_dict:
+                return self.obj.__dict__[key]
+            raise KeyError(key)
+        try:
+            return getattr(self.obj, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Change value of a field (AttributeError for a field the object can't have)."""
+        setattr(self.obj, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove value of a field (KeyError when it is not set)."""
+        if key not in self:
+            raise KeyError(key)
+        delattr(self.obj, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterating over the names of the fields being set."""
+        for name in self.names:
+            if hasattr(self.obj, name):
+                yield name
+        if self.with_dict:
+            yield from list(self.obj.__dict__)
+
+    def __len__(self) -> int:
+        """Get number of fields being set."""
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        """Checking field to be set."""
+        if key in self.names:
+            return hasattr(self.obj, key)
+        return self.with_dict and key in self.obj.__dict__
+
+
+KINDS: dict[type, ValueKind] = {}
+"""Kind of each type that has been classified."""
+
+FIELDS: dict[type, Callable[[Any], MutableMapping]] = {}
+"""Function getting the fields of an object of each classified dictionary or class type."""
+
+VALUE_TYPES: set[type] = set()
+"""Types that have been classified as values (for a fast check)."""
+
+HANDLERS: dict[type, tuple[ValueKind, Callable[[Any], MutableMapping] | None]] = {}
+"""Types registered by `register_type`."""
+
+CACHES: list[dict | set] = [KINDS, FIELDS, VALUE_TYPES]
+"""Caches depending on the classification (cleared by `register_type`)."""
+
+
+def register_type(
+    cls: type, kind: ValueKind, get_fields: Callable[[Any], MutableMapping] = None
+) -> None:
+    """Define how objects of a type (and of derived types) are made responsive.
+
+    Args:
+        cls (type): the type
+        kind (ValueKind): VALUE (never wrapped) or CLASS (lists and dictionaries are
+                          detected by their base class)
+        get_fields (Callable[[Any], MutableMapping]): function getting the fields of an object
+                                                      as mutable mapping (for CLASS)
+
+    Raises:
+        ValueError: when the kind is not supported or the function for the fields is missing
+
+    >>> class Money:
+    ...     def __init__(self, amount):
+    ...         self.amount = amount
+    >>> register_type(Money, ValueKind.VALUE)
+    >>> get_kind(Money(1))
+    <ValueKind.VALUE: 1>
+    """
+    if kind not in (ValueKind.VALUE, ValueKind.CLASS):
+        raise ValueError("only values and classes can be registered")
+    if kind == ValueKind.CLASS and get_fields is None:
+        raise ValueError("function for the fields of a class is required")
+
+    HANDLERS[cls] = (kind, get_fields)
+    for cache in CACHES:
+        cache.clear()
+
+
+def get_kind(value: Any) -> ValueKind:
+    """Get how a value is made responsive (classifying its type once).
+
+    Args:
+        value (Any): the value
+
+    Returns:
+        kind of the value.
+
+    >>> get_kind(1), get_kind({}), get_kind([])
+    (<ValueKind.VALUE: 1>, <ValueKind.DICTIONARY: 2>, <ValueKind.LIST: 3>)
+    """
+    kind = KINDS.get(type(value))
+    if kind is None:
+        kind = classify(type(value))
+    return kind
+
+
+def is_value(value: Any) -> bool:
+    """Checking a value not to be wrapped (fast check for types classified before).
+
+    Args:
+        value (Any): the value
+
+    Returns:
+        true when the value is not wrapped.
+    """
+    value_type = type(value)
+    if value_type in VALUE_TYPES:
+        return True
+    if value_type in KINDS:
+        return False
+    return classify(value_type) == ValueKind.VALUE
+
+
+def get_fields(obj: object) -> MutableMapping:
+    """Get fields of a dictionary or of an object with fields as mutable mapping.
+
+    Args:
+        obj (object): dictionary or object with fields
+
+    Returns:
+        the dictionary, the instance dictionary or a mapping of the slots.
+
+    Raises:
+        TypeError: when the object has no fields
+    """
+    function = FIELDS.get(type(obj))
+    if function is None:
+        classify(type(obj))
+        function = FIELDS.get(type(obj))
+        if function is None:
+            raise TypeError(f"object of type {type(obj).__name__} has no fields")
+    return function(obj)
+
+
+def classify(cls: type) -> ValueKind:
+    """Classify a type (the result is cached).
+
+    The rules in order: registered types (see `register_type`), dictionaries,
+    lists, built-in types, tuples (named tuples), enums and frozen dataclasses
+    are values, classes with `__slots__` (unless they define `__hash__` like
+    `uuid.UUID` or `fractions.Fraction`) or an instance dictionary have
+    fields, other types are values.
+
+    Args:
+        cls (type): the type
+
+    Returns:
+        kind of the values of the type.
+    """
+    kind, get_fields_function = __classify(cls)
+    if get_fields_function is not None:
+        FIELDS[cls] = get_fields_function
+    if kind == ValueKind.VALUE:
+        VALUE_TYPES.add(cls)
+    KINDS[cls] = kind
+    return kind
+
+
+def __classify(cls: type) -> tuple[ValueKind, Callable[[Any], MutableMapping] | None]:
+    """Get kind and function getting the fields for a type."""
+    for base in cls.__mro__:
+        if base in HANDLERS:
+            return HANDLERS[base]
+
+    if issubclass(cls, dict):
+        return ValueKind.DICTIONARY, lambda obj: obj
+    if issubclass(cls, list):
+        return ValueKind.LIST, None
+    if cls.__module__ == "builtins" or issubclass(cls, (tuple, Enum, type)):
+        return ValueKind.VALUE, None
+    if dataclasses.is_dataclass(cls) and cls.__dataclass_params__.frozen:
+        return ValueKind.VALUE, None
+    return __classify_fields(cls)
+
+
+def __classify_fields(cls: type) -> tuple[ValueKind, Callable[[Any], MutableMapping] | None]:
+    """Get kind and function getting the fields for a type with slots or instance dictionary."""
+    names = get_slot_names(cls)
+    with_dict = getattr(cls, "__dictoffset__", 0) != 0
+    if len(names) > 0 and not with_dict and is_hashable(cls):
+        return ValueKind.VALUE, None
+    if len(names) > 0:
+        return ValueKind.CLASS, lambda obj: SlotFields(obj, names, with_dict)
+    if with_dict:
+        return ValueKind.CLASS, vars
+    return ValueKind.VALUE, None
+
+
+def is_hashable(cls: type) -> bool:
+    """Checking a class to define its own hash (as immutable values like `uuid.UUID` do).
+
+    Args:
+        cls (type): the class
+
+    Returns:
+        true when the class (or a base class other than object) defines `__hash__`.
+
+    >>> from fractions import Fraction
+    >>> is_hashable(Fraction), is_hashable(object)
+    (True, False)
+    """
+    return cls.__hash__ is not None and cls.__hash__ is not object.__hash__
+
+
+def get_slot_names(cls: type) -> tuple[str, ...]:
+    """Get names of the slots of a class (and of its base classes).
+
+    Args:
+        cls (type): the class
+
+    Returns:
+        names of the slots (private names are mangled).
+    """
+    names = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{base.__name__.lstrip('_')}{name}"
+            if name not in names:
+                names.append(name)
+    return tuple(names)
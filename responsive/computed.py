@@ -0,0 +1,145 @@
+"""Module computed.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+from collections.abc import Callable
+from typing import Any
+
+from responsive.constants import Context
+from responsive.event import UNSET, ChangeEvent
+from responsive.observer import ChangeObserver, get_changes
+from responsive.subject import Subject
+from responsive.wrapper import READS
+
+
+class Computed(ChangeObserver):
+    """Value computed from responsive data (cached until a value it has read changes).
+
+    While computing, the reads of the function through the wrappers are
+    recorded: values of a dictionary (or class) by key, lists and the keys of
+    a dictionary (iterating, `len`) as a whole. A change of the responsive
+    object invalidates the cached value only when it changes one of those;
+    the value is computed again on next access. Reading another computed
+    value adds its dependencies.
+
+    >>> from responsive.data import make_responsive
+    >>> data = make_responsive({"items": [1, 2], "label": "a"})
+    >>> total = Computed(data, lambda: sum(data["items"]))
+    >>> total.get_value()
+    3
+    >>> data.label = "b"
+    >>> total.is_valid()
+    True
+    >>> data["items"].append(3)
+    >>> total.is_valid(), total.get_value()
+    (False, 6)
+    """
+
+    def __init__(self, root: Subject, function: Callable[[], Any]):
+        """Register at responsive object.
+
+        Args:
+            root (Subject): responsive object (root) the function reads from
+            function (Callable[[], Any]): function computing the value
+        """
+        super().__init__()
+        self.__root = root
+        self.__function = function
+        self.__value = UNSET
+        self.__dependencies: set[tuple[int, Any]] = set()
+        self.__ids: set[int] = set()
+        self.__count_computations = 0
+        root.add_observer(self)
+
+    def get_value(self) -> Any:
+        """Get the value (computing it when not valid).
+
+        Returns:
+            computed value.
+        """
+        if self.__value is UNSET:
+            self.__compute()
+
+        if READS:
+            READS[-1].update(self.__dependencies)
+        return self.__value
+
+    def is_valid(self) -> bool:
+        """Checking value to be cached."""
+        return self.__value is not UNSET
+
+    def invalidate(self) -> None:
+        """Forget cached value (and dependencies)."""
+        self.__value = UNSET
+        self.__dependencies = set()
+        self.__ids = set()
+
+    def get_count_computations(self) -> int:
+        """Get number of computations."""
+        return self.__count_computations
+
+    def close(self) -> None:
+        """Stop observing the responsive object."""
+        self.__root.remove_observer(self)
+        self.invalidate()
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when the responsive object has been changed (invalidating the value).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        if self.__value is UNSET:
+            return
+
+        if any(self.__depends_on(change) for change in get_changes(event)):
+            self.invalidate()
+
+    def __compute(self) -> None:
+        """Compute value recording the reads as dependencies."""
+        READS.append(set())
+        try:
+            value = self.__function()
+        finally:
+            dependencies = READS.pop()
+
+        self.__value = value
+        self.__dependencies = dependencies
+        self.__ids = {wrapper_id for wrapper_id, _ in dependencies}
+        self.__count_computations += 1
+
+    def __depends_on(self, event: dict[str, Any] | ChangeEvent) -> bool:
+        """Checking change to modify a value that has been read."""
+        wrapper_id = event.get("id")
+        if wrapper_id not in self.__ids:
+            return False
+
+        if (wrapper_id, UNSET) in self.__dependencies or event["context"] == Context.LIST:
+            return True
+
+        if "count" in event:
+            keys = set(event.get("old", {})) | set(event.get("new", {}))
+            return any((wrapper_id, key) in self.__dependencies for key in keys)
+
+        return (wrapper_id, event["name"]) in self.__dependencies
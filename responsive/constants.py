@@ -38,6 +38,9 @@ class Operation(Enum):
     VALUE_REMOVED = 3
     """ Values has been removed."""
 
+    BATCH = 4
+    """ Several changes delivered at once (see `Subject.batch`)."""
+
 
 @unique
 class Context(Enum):
@@ -51,3 +54,48 @@ class Context(Enum):
 
     LIST = 3
     """ List context. """
+
+
+@unique
+class OverflowPolicy(Enum):
+    """Constants for what to do when a bounded queue of notifications is full."""
+
+    BLOCK = 1
+    """ Wait until there is space in the queue. """
+
+    DROP_OLDEST = 2
+    """ Remove the oldest notification from the queue. """
+
+    COALESCE = 3
+    """ Replace queued change of same value (otherwise remove the oldest notification). """
+
+
+@unique
+class FsyncPolicy(Enum):
+    """Constants for when a change log is written through to the disk."""
+
+    NEVER = 1
+    """ The operating system decides (fastest, changes can be lost on a crash of the system). """
+
+    INTERVAL = 2
+    """ At most once per interval when changes are written. """
+
+    ALWAYS = 3
+    """ Each time changes are written (slowest, nothing written can be lost). """
+
+
+@unique
+class ValueKind(Enum):
+    """Constants for how a value is made responsive (see `responsive.classify`)."""
+
+    VALUE = 1
+    """ Value which is not wrapped (e.g. numbers, strings, tuples, frozen dataclasses)."""
+
+    DICTIONARY = 2
+    """ Dictionary (wrapped by a `DictWrapper`)."""
+
+    LIST = 3
+    """ List (wrapped by a `ListWrapper`)."""
+
+    CLASS = 4
+    """ Object with fields (wrapped by a `DictWrapper`)."""
@@ -23,82 +23,143 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 # pylint: disable=too-few-public-methods
+from responsive.classify import VALUE_TYPES, get_fields, is_value
+from responsive.proxy import get_proxy_class
 from responsive.subject import Subject
-from responsive.wrapper import DictWrapper, ListWrapper
+from responsive.wrapper import DictWrapper, ListWrapper, get_options
 
+SCALAR_TYPES = frozenset({str, int, float, bool, type(None), bytes, complex})
+"""Types of values which are never wrapped (returned by `to_plain` as they are)."""
 
-def __make_responsive_for_list(root: object, parent: list) -> None:
+
+def __make_responsive_for_list(root: object, parent: ListWrapper) -> None:
     """Modify recursive object to be responsive.
 
     Args:
         root (object): the main object that should be responsive
-        parent (object): the current parent in the hierachy
+        parent (ListWrapper): the current parent in the hierachy
     """
-    for index, value in enumerate(parent):
-        current_type = type(value)
-        if not current_type.__module__ == "builtins" or isinstance(value, dict):
-            wrapped_value = DictWrapper(value, make_responsive, root=root)
-            __make_responsive_for_dict(root, value)
-            wrapped_value.add_observer(root)
-            parent[index] = wrapped_value
-        elif isinstance(value, list):
-            wrapped_value = ListWrapper(value, make_responsive, root=root)
-            __make_responsive_for_list(root, value)
-            wrapped_value.add_observer(root)
-            parent[index] = wrapped_value
-
-
-def __make_responsive_for_dict(root: object, parent: object) -> None:
+    the_list = parent.obj
+    for index, value in enumerate(the_list):
+        if type(value) not in VALUE_TYPES and not is_value(value):
+            the_list[index] = __make_responsive_for_value(root, parent, index, value)
+
+
+def __make_responsive_for_dict(root: object, parent: DictWrapper) -> None:
     """Modify recursive object to be responsive.
 
     Args:
         root (object): the main object that should be responsive
-        parent (object): the current parent in the hierachy
+        parent (DictWrapper): the current parent in the hierachy
     """
-    the_dict = parent if isinstance(parent, dict) else parent.__dict__
+    the_dict = parent.obj if type(parent.obj) is dict else get_fields(parent.obj)
 
     for key, value in the_dict.items():
-        current_type = type(value)
-        if not current_type.__module__ == "builtins" or isinstance(value, dict):
-            wrapped_value = DictWrapper(value, make_responsive, root=root)
-            __make_responsive_for_dict(root, value)
-            wrapped_value.add_observer(root)
-            the_dict[key] = wrapped_value
-        elif isinstance(value, list):
-            wrapped_value = ListWrapper(value, make_responsive, root=root)
-            __make_responsive_for_list(root, value)
-            wrapped_value.add_observer(root)
-            the_dict[key] = wrapped_value
-
-
-def __is_class(obj):
-    """Checking an object to be a user defined class."""
-    current_type = type(obj)
-    return str(current_type).startswith("<class") and not current_type.__module__ == "builtins"
-
-
-def make_responsive(obj: object, root: Subject = None) -> object:
+        if type(value) not in VALUE_TYPES and not is_value(value):
+            the_dict[key] = __make_responsive_for_value(root, parent, key, value)
+
+
+def __make_responsive_for_value(
+    root: object, parent: DictWrapper | ListWrapper, key: object, value: object
+) -> DictWrapper | ListWrapper:
+    """Wrap a nested dictionary, list or class (and its nested values).
+
+    Args:
+        root (object): the main object that should be responsive
+        parent (DictWrapper | ListWrapper): the current parent in the hierachy
+        key (object): name or index of the value in the parent
+        value (object): the value to wrap (dictionary, list or class)
+
+    Returns:
+        the wrapper.
+    """
+    if isinstance(value, list):
+        wrapped_value = ListWrapper(
+            value, root=root, parent=parent, key=key, options=parent.options
+        )
+        __make_responsive_for_list(root, wrapped_value)
+    else:
+        wrapper_class = get_proxy_class(type(value)) if parent.options.proxy else DictWrapper
+        wrapped_value = wrapper_class(
+            value, root=root, parent=parent, key=key, options=parent.options
+        )
+        __make_responsive_for_dict(root, wrapped_value)
+    wrapped_value.add_observer(root)
+    return wrapped_value
+
+
+def make_responsive(
+    obj: object,
+    root: Subject = None,
+    lazy: bool = False,
+    reconcile: bool = False,
+    proxy: bool = False,
+) -> object:
     """Modify object to be responsive.
 
     Args:
         obj (object): the object to modify
         root (Subject): another root
+        lazy (bool): when true nested containers are wrapped on first access only
+        reconcile (bool): when true assigning a dictionary, list or class changes the
+                          existing one in place notifying the changed values only
+        proxy (bool): when true classes are wrapped by a proxy class generated once per
+                      class with its declared fields as attributes (see `responsive.proxy`)
 
     Returns:
         Modified object.
     """
+    options = get_options(lazy, reconcile, proxy)
     if isinstance(obj, list):
-        wrapped_list = ListWrapper(obj, make_responsive, root=root)
-        __make_responsive_for_list(root if root is not None else wrapped_list, obj)
+        wrapped_list = ListWrapper(obj, root=root, options=options)
+        if not lazy:
+            __make_responsive_for_list(root if root is not None else wrapped_list, wrapped_list)
         if root is not None:
             wrapped_list.add_observer(root)
         return wrapped_list
 
-    if isinstance(obj, dict) or __is_class(obj):
-        wrapped_dict_or_class = DictWrapper(obj, make_responsive, root=root)
-        __make_responsive_for_dict(root if root is not None else wrapped_dict_or_class, obj)
+    if not is_value(obj):
+        wrapper_class = get_proxy_class(type(obj)) if proxy else DictWrapper
+        wrapped_dict_or_class = wrapper_class(obj, root=root, options=options)
+        if not lazy:
+            __make_responsive_for_dict(
+                root if root is not None else wrapped_dict_or_class, wrapped_dict_or_class
+            )
         if root is not None:
             wrapped_dict_or_class.add_observer(root)
         return wrapped_dict_or_class
 
     return obj
+
+
+def to_plain(obj: object) -> object:
+    """Get plain data (dictionaries, lists and values) of a responsive object.
+
+    Args:
+        obj (object): responsive object (or plain data)
+
+    Returns:
+        copy of the data without wrappers (classes are converted into dictionaries).
+
+    Example:
+
+        >>> to_plain(make_responsive({"a": [1, {"b": 2}]}))
+        {'a': [1, {'b': 2}]}
+    """
+    if type(obj) in SCALAR_TYPES:
+        return obj
+
+    if isinstance(obj, (DictWrapper, ListWrapper)):
+        obj = obj.obj
+
+    if isinstance(obj, list):
+        return [value if type(value) in SCALAR_TYPES else to_plain(value) for value in obj]
+
+    if not is_value(obj):
+        the_dict = get_fields(obj)
+        return {
+            key: value if type(value) in SCALAR_TYPES else to_plain(value)
+            for key, value in the_dict.items()
+        }
+
+    return obj
@@ -0,0 +1,193 @@
+"""Module event.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+# pylint: disable=redefined-builtin,too-many-arguments,too-many-instance-attributes
+from collections.abc import Iterator
+from typing import Any
+
+
+class Unset:
+    """Type of the marker for a field of a change event that is not set."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Get string representation of the marker."""
+        return "UNSET"
+
+
+UNSET = Unset()
+"""Marker for a field of a change event that is not set."""
+
+
+class ChangeEvent:
+    """One change of a responsive object.
+
+    The event is created once for a change and passed by reference to all
+    subjects and observers. Fields which are not set are `UNSET`; they are not
+    included when iterating the event or converting it into key/value
+    arguments (as observers not handling events get them).
+
+    Example:
+
+        >>> event = ChangeEvent(id=1, name="a", old=1, new=2)
+        >>> event["name"], "index" in event, event.get("index")
+        ('a', False, None)
+        >>> event.to_kwargs()
+        {'id': 1, 'name': 'a', 'old': 1, 'new': 2}
+    """
+
+    __slots__ = (
+        "id",
+        "context",
+        "path",
+        "name",
+        "index",
+        "count",
+        "old",
+        "new",
+        "operation",
+        "events",
+    )
+
+    def __init__(
+        self,
+        id: int = UNSET,
+        context: Any = UNSET,
+        path: tuple = UNSET,
+        name: str = UNSET,
+        index: int = UNSET,
+        count: int = UNSET,
+        old: Any = UNSET,
+        new: Any = UNSET,
+        operation: Any = UNSET,
+        events: list = UNSET,
+    ):
+        """Initialize change event.
+
+        Args:
+            id (int): id of the changed wrapper
+            context (Context): dictionary, class or list
+            path (tuple): names and indices from the root to the changed value
+            name (str): name of the changed field
+            index (int): index of the changed value (first index of a range)
+            count (int): number of changed values (set for a range only)
+            old (Any): old value
+            new (Any): new value
+            operation (Operation): kind of change
+            events (list): changes of a batch (see `Subject.batch`)
+        """
+        self.id = id
+        self.context = context
+        self.path = path
+        self.name = name
+        self.index = index
+        self.count = count
+        self.old = old
+        self.new = new
+        self.operation = operation
+        self.events = events
+
+    def __repr__(self) -> str:
+        """Get string representation of the event."""
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"ChangeEvent({fields})"
+
+    def __contains__(self, key: str) -> bool:
+        """Checking field to be set.
+
+        Args:
+            key (str): name of the field
+
+        Returns:
+            true when the field is set.
+        """
+        return getattr(self, key, UNSET) is not UNSET
+
+    def __getitem__(self, key: str) -> Any:
+        """Get value of a field.
+
+        Args:
+            key (str): name of the field
+
+        Returns:
+            value of the field.
+
+        Raises:
+            KeyError: when the field is not set
+        """
+        value = getattr(self, key, UNSET)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get value of a field.
+
+        Args:
+            key (str): name of the field
+            default (Any): value when the field is not set
+
+        Returns:
+            value of the field or the default.
+        """
+        value = getattr(self, key, UNSET)
+        return default if value is UNSET else value
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Get names and values of the fields being set.
+
+        Yields:
+            name and value of a field.
+        """
+        for key in self.__slots__:
+            value = getattr(self, key)
+            if value is not UNSET:
+                yield key, value
+
+    def replace(self, **fields: Any) -> "ChangeEvent":
+        """Get copy of the event with other values for given fields.
+
+        Args:
+            **fields (Any): fields to change
+
+        Returns:
+            new event.
+        """
+        return ChangeEvent(**{**dict(self.items()), **fields})
+
+    def to_kwargs(self) -> dict[str, Any]:
+        """Get fields being set as key/value arguments.
+
+        Returns:
+            dictionary with fields being set (events of a batch are converted as well).
+        """
+        kwargs = dict(self.items())
+        if "events" in kwargs:
+            kwargs["events"] = [
+                event.to_kwargs() if isinstance(event, ChangeEvent) else event
+                for event in kwargs["events"]
+            ]
+        return kwargs
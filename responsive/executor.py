@@ -0,0 +1,191 @@
+"""Module executor.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any
+
+from responsive.event import ChangeEvent
+from responsive.observer import Observer
+from responsive.subject import Subject, get_snapshot
+
+
+class Lane:
+    """Notifications queued for one observer (delivered in order)."""
+
+    def __init__(self, observer: Observer):
+        """Initialize empty lane.
+
+        Args:
+            observer (Observer): the observer to deliver the notifications to
+        """
+        self.observer = observer
+        self.queue = deque()
+        self.running = False
+
+
+class ExecutorSubject(Subject, Observer):
+    """Subject delivering its notifications using a thread pool.
+
+    Each observer has its own lane: the notifications for one observer are
+    delivered in order of the notifications while different observers (and
+    the thread doing the notification) run in parallel. Register the subject
+    as observer of a responsive object to get its changes delivered that way.
+    Old and new dictionaries, lists and classes of a change are copied when
+    queued (see `get_snapshot`).
+    """
+
+    def __init__(self, executor: Executor = None, max_workers: int = None, max_errors: int = 100):
+        """Initialize subject.
+
+        Args:
+            executor (Executor): executor to use (default: an own thread pool)
+            max_workers (int): number of threads of the own thread pool
+            max_errors (int): number of the last exceptions of observers being kept
+        """
+        super().__init__()
+        self.__own_executor = executor is None
+        self.__executor = ThreadPoolExecutor(max_workers) if executor is None else executor
+        self.__lanes: dict[int, Lane] = {}
+        self.__condition = threading.Condition()
+        self.__queue_depth = 0
+        self.__max_queue_depth = 0
+        self.__errors: deque[Exception] = deque(maxlen=max_errors)
+
+    def dispatch(self, *args: Any, **kwargs: Any) -> None:
+        """Putting notification into the lanes of the interested observers.
+
+        Args:
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        kwargs = get_snapshot(kwargs)
+        self.__enqueue((args, kwargs), kwargs)
+
+    def dispatch_change(self, event: ChangeEvent) -> None:
+        """Putting change into the lanes of the interested observers.
+
+        Args:
+            event (ChangeEvent): the change
+        """
+        event = get_snapshot(event)
+        self.__enqueue(event, event)
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when related subject has changed (notification is queued).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        self.notify(*args, **kwargs)
+
+    def on_change(self, subject: object, event: ChangeEvent) -> None:
+        """Called when related subject has changed (change is queued).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+        """
+        self.notify_change(event)
+
+    def __enqueue(self, item: tuple | ChangeEvent, kwargs: dict[str, Any] | ChangeEvent) -> None:
+        """Putting notification or change into the lanes of the interested observers."""
+        for observer in self.get_interested_observers(kwargs):
+            with self.__condition:
+                lane = self.__lanes.get(id(observer))
+                if lane is None:
+                    lane = self.__lanes[id(observer)] = Lane(observer)
+                lane.queue.append(item)
+                self.__queue_depth += 1
+                self.__max_queue_depth = max(self.__max_queue_depth, self.__queue_depth)
+                if lane.running:
+                    continue
+                lane.running = True
+            self.__executor.submit(self.__drain, lane)
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until all queued notifications have been delivered.
+
+        Args:
+            timeout (float): maximum time in seconds to wait (default: no limit)
+
+        Returns:
+            true when all notifications have been delivered.
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: len(self.__lanes) == 0, timeout  # pylint: disable=compare-to-zero
+            )
+
+    def close(self) -> None:
+        """Deliver all queued notifications and shutdown the own thread pool."""
+        self.flush()
+        if self.__own_executor:
+            self.__executor.shutdown()
+
+    def get_queue_depth(self, observer: Observer = None) -> int:
+        """Get number of queued notifications.
+
+        Args:
+            observer (Observer): observer to get the number for (default: all observers)
+
+        Returns:
+            number of notifications not yet delivered.
+        """
+        with self.__condition:
+            if observer is None:
+                return self.__queue_depth
+            lane = self.__lanes.get(id(observer))
+            return 0 if lane is None else len(lane.queue)
+
+    def get_max_queue_depth(self) -> int:
+        """Get highest number of queued notifications so far."""
+        return self.__max_queue_depth
+
+    def get_errors(self) -> list[Exception]:
+        """Get the last exceptions raised by observers while being notified."""
+        return list(self.__errors)
+
+    def __drain(self, lane: Lane) -> None:
+        """Delivering notifications of one lane until it is empty."""
+        while True:
+            with self.__condition:
+                if len(lane.queue) == 0:  # pylint: disable=compare-to-zero
+                    lane.running = False
+                    del self.__lanes[id(lane.observer)]
+                    self.__condition.notify_all()
+                    return
+                item = lane.queue.popleft()
+                self.__queue_depth -= 1
+
+            try:
+                if isinstance(item, ChangeEvent):
+                    lane.observer.on_change(self, item)
+                else:
+                    lane.observer.on_notify(self, *item[0], **item[1])
+            except Exception as exception:  # pylint: disable=broad-except
+                self.__errors.append(exception)
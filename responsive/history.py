@@ -0,0 +1,242 @@
+"""Module history.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import sys
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from responsive.constants import Context, Operation
+from responsive.data import to_plain
+from responsive.event import ChangeEvent
+from responsive.observer import ChangeObserver, get_changes
+from responsive.replication import apply_change
+from responsive.subject import Subject
+
+MESSAGE_SIZE = 120
+"""Estimated bytes of an inverse change without its value."""
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate bytes of plain data (dictionaries, lists and values).
+
+    Args:
+        value (Any): plain data
+
+    Returns:
+        estimated bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    elif isinstance(value, list):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+def get_inverse_changes(event: dict[str, Any] | ChangeEvent) -> list[tuple]:
+    """Get changes reverting a change of responsive data.
+
+    The changes are messages as sent by a `ReplicationObserver` (see
+    `responsive.replication.apply_change`); replaced and removed values are
+    kept as plain data.
+
+    Args:
+        event (dict[str, Any] | ChangeEvent): the change (key/value arguments or event)
+
+    Returns:
+        inverse changes (empty when the change has no path).
+    """
+    path = event.get("path")
+    if path is None:
+        return []
+
+    operation, old = event["operation"], to_plain(event.get("old"))
+    if "count" in event and event["context"] != Context.LIST:
+        added = [key for key in event.get("new", {}) if key not in old]
+        return [(0, Operation.VALUE_REMOVED.value, path, key, None, None) for key in added] + (
+            [(0, Operation.VALUE_CHANGED.value, path, None, old, len(old))] if len(old) > 0 else []
+        )
+
+    path, key = path[:-1], path[-1]
+    if "count" not in event:
+        inverse = {
+            Operation.VALUE_CHANGED: Operation.VALUE_CHANGED,
+            Operation.VALUE_ADDED: Operation.VALUE_REMOVED,
+            Operation.VALUE_REMOVED: Operation.VALUE_ADDED,
+        }[operation]
+        return [(0, inverse.value, path, key, old, None)]
+
+    if operation == Operation.VALUE_ADDED:
+        return [(0, Operation.VALUE_REMOVED.value, path, key, None, event["count"])]
+    if operation == Operation.VALUE_REMOVED:
+        return [(0, Operation.VALUE_ADDED.value, path, key, old, len(old))]
+    return [(0, Operation.VALUE_CHANGED.value, path, key, old, len(event["new"]))]
+
+
+class History(ChangeObserver):
+    """Undo and redo of the changes of a responsive object.
+
+    Each notification of the responsive object is one step (a batch of the
+    responsive object is one notification); use `step` to group several
+    notifications. For a step only the changes reverting it are kept (with
+    plain copies of replaced and removed values, not of the whole data).
+    The oldest steps are dropped when there are more than `max_steps` or
+    when the estimated bytes of all steps exceed `max_bytes`. Undo and redo
+    of a step are applied in one batch (one notification).
+    """
+
+    def __init__(self, root: Subject, max_steps: int = 100, max_bytes: int = None):
+        """Register at responsive object.
+
+        Args:
+            root (Subject): responsive object (root)
+            max_steps (int): maximum number of steps to undo
+            max_bytes (int): maximum of estimated bytes of all steps (default: no limit)
+        """
+        super().__init__()
+        self.__root = root
+        self.__max_steps = max_steps
+        self.__max_bytes = max_bytes
+        self.__undo: deque[tuple[list[tuple], int]] = deque()
+        self.__redo: deque[tuple[list[tuple], int]] = deque()
+        self.__size = 0
+        self.__step: list[tuple] | None = None
+        self.__depth = 0
+        self.__applying: deque | None = None
+        root.add_observer(self)
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when the responsive object has been changed (recording a step).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        changes = [change for each in get_changes(event) for change in get_inverse_changes(each)]
+        if len(changes) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        if self.__step is not None:
+            self.__step.extend(changes)
+        else:
+            self.__record(changes)
+
+    @contextmanager
+    def step(self) -> Iterator["History"]:
+        """Record the changes until the (outermost) step is closed as one step.
+
+        Yields:
+            the history itself.
+        """
+        if self.__depth == 0:  # pylint: disable=compare-to-zero
+            self.__step = []
+
+        self.__depth += 1
+        try:
+            yield self
+        finally:
+            self.__depth -= 1
+            if self.__depth == 0:  # pylint: disable=compare-to-zero
+                changes, self.__step = self.__step, None
+                if len(changes) > 0:
+                    self.__record(changes)
+
+    def can_undo(self) -> bool:
+        """Checking for a step to undo."""
+        return len(self.__undo) > 0
+
+    def can_redo(self) -> bool:
+        """Checking for a step to redo."""
+        return len(self.__redo) > 0
+
+    def undo(self) -> bool:
+        """Revert the last step.
+
+        Returns:
+            true when a step has been reverted.
+        """
+        return self.__apply(self.__undo, self.__redo)
+
+    def redo(self) -> bool:
+        """Apply the last reverted step again.
+
+        Returns:
+            true when a step has been applied.
+        """
+        return self.__apply(self.__redo, self.__undo)
+
+    def get_count_steps(self) -> tuple[int, int]:
+        """Get number of steps to undo and to redo."""
+        return len(self.__undo), len(self.__redo)
+
+    def get_size(self) -> int:
+        """Get estimated bytes of all steps."""
+        return self.__size
+
+    def clear(self) -> None:
+        """Forget all steps."""
+        self.__undo.clear()
+        self.__redo.clear()
+        self.__size = 0
+
+    def close(self) -> None:
+        """Stop recording changes."""
+        self.__root.remove_observer(self)
+
+    def __apply(self, source: deque, target: deque) -> bool:
+        """Apply inverse changes of the last step of source recording its inverse in target."""
+        if len(source) == 0:  # pylint: disable=compare-to-zero
+            return False
+
+        changes, size = source.pop()
+        self.__size -= size
+        self.__applying = target
+        try:
+            with self.__root.batch():
+                for change in reversed(changes):
+                    apply_change(self.__root, change)
+        finally:
+            self.__applying = None
+        return True
+
+    def __record(self, changes: list[tuple]) -> None:
+        """Add step dropping the oldest steps when a limit is exceeded."""
+        size = sum(MESSAGE_SIZE + estimate_size(change[4]) for change in changes)
+        if self.__applying is not None:
+            self.__applying.append((changes, size))
+        else:
+            self.__undo.append((changes, size))
+            self.__size -= sum(size for _, size in self.__redo)
+            self.__redo.clear()
+        self.__size += size
+
+        while len(self.__undo) > self.__max_steps or (
+            self.__max_bytes is not None and self.__size > self.__max_bytes
+        ):
+            oldest = self.__undo if len(self.__undo) > 0 else self.__redo
+            if len(oldest) == 0:  # pylint: disable=compare-to-zero
+                break
+            self.__size -= oldest.popleft()[1]
@@ -0,0 +1,112 @@
+"""Module ingest.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import json
+import os
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from responsive.wrapper import ListWrapper
+
+
+def read_ndjson(source: str | os.PathLike | Iterable[str | bytes]) -> Iterator[Any]:
+    """Read records of newline delimited JSON one by one (empty lines are skipped).
+
+    Args:
+        source (str | os.PathLike | Iterable[str | bytes]): path of a file, open file or lines
+
+    Yields:
+        the records.
+
+    Raises:
+        ValueError: when a line isn't valid JSON
+
+    >>> list(read_ndjson(['{"a": 1}', '', '[2]']))
+    [{'a': 1}, [2]]
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from read_ndjson(file)
+        return
+
+    for number, line in enumerate(source, 1):
+        if len(line.strip()) == 0:  # pylint: disable=compare-to-zero
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"invalid JSON in line {number}: {error.msg}") from error
+
+
+def ingest(target: ListWrapper, records: Iterable[Any], chunk_size: int = 1000) -> Iterator[range]:
+    """Append records read incrementally to a responsive list in chunks.
+
+    The records are taken from the iterable chunk by chunk, wrapped and
+    appended with one notification per chunk, so only one chunk of records
+    is held besides the list. The generator yields after each chunk, so the
+    appended records can be processed while reading the next ones.
+
+    Args:
+        target (ListWrapper): the responsive list
+        records (Iterable[Any]): records (e.g. from `read_ndjson`)
+        chunk_size (int): number of records per notification
+
+    Yields:
+        indices of the appended records of a chunk.
+
+    Raises:
+        ValueError: when the chunk size is not positive
+
+    >>> from responsive.data import make_responsive
+    >>> data = make_responsive({"events": []})
+    >>> list(ingest(data["events"], ({"id": id} for id in range(5)), chunk_size=2))
+    [range(0, 2), range(2, 4), range(4, 5)]
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk size must be positive")
+
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if len(chunk) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        start = len(target)
+        target.extend(chunk)
+        yield range(start, start + len(chunk))
+
+
+def ingest_all(target: ListWrapper, records: Iterable[Any], chunk_size: int = 1000) -> int:
+    """Append all records to a responsive list in chunks (see `ingest`).
+
+    Args:
+        target (ListWrapper): the responsive list
+        records (Iterable[Any]): records (e.g. from `read_ndjson`)
+        chunk_size (int): number of records per notification
+
+    Returns:
+        number of appended records.
+    """
+    return sum(len(indices) for indices in ingest(target, records, chunk_size))
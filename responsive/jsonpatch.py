@@ -0,0 +1,358 @@
+"""Module jsonpatch.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import json
+from collections.abc import Callable
+from copy import deepcopy
+from typing import Any, TextIO
+
+from responsive.constants import Context, Operation
+from responsive.data import to_plain
+from responsive.event import ChangeEvent
+from responsive.observer import ChangeObserver, get_changes
+from responsive.wrapper import ListWrapper
+
+
+def to_json_pointer(path: tuple) -> str:
+    """Get JSON pointer (RFC 6901) for a path of a change.
+
+    Args:
+        path (tuple): names and indices
+
+    Returns:
+        JSON pointer.
+
+    Example:
+
+        >>> to_json_pointer(("orders", 5, "a/b"))
+        '/orders/5/a~1b'
+    """
+    return "".join("/" + str(segment).replace("~", "~0").replace("/", "~1") for segment in path)
+
+
+def parse_json_pointer(pointer: str) -> tuple[str, ...]:
+    """Get segments of a JSON pointer (RFC 6901).
+
+    Args:
+        pointer (str): JSON pointer
+
+    Returns:
+        names (indices are names too, `get_key` converts them).
+
+    Raises:
+        ValueError: when the pointer is not empty and does not start with a slash.
+
+    Example:
+
+        >>> parse_json_pointer("/orders/5/a~1b")
+        ('orders', '5', 'a/b')
+    """
+    if len(pointer) == 0:  # pylint: disable=compare-to-zero
+        return ()
+
+    if not pointer.startswith("/"):
+        raise ValueError(f"invalid JSON pointer: {pointer!r}")
+
+    return tuple(
+        segment.replace("~1", "/").replace("~0", "~") for segment in pointer[1:].split("/")
+    )
+
+
+def get_key(container: object, segment: str, insert: bool = False) -> Any:
+    """Get key or index for a segment of a JSON pointer.
+
+    Args:
+        container (object): responsive dictionary, class or list
+        segment (str): segment of a JSON pointer
+        insert (bool): when true the index can be the length (or `-`) of the list
+
+    Returns:
+        name or index.
+
+    Raises:
+        ValueError: when the segment is not a valid index of a list.
+    """
+    if not isinstance(container, ListWrapper):
+        return segment
+
+    if insert and segment == "-":
+        return len(container)
+
+    limit = len(container) + 1 if insert else len(container)
+    if not segment.isdigit() or int(segment) >= limit or segment != str(int(segment)):
+        raise ValueError(f"invalid index {segment!r} for a list with {len(container)} values")
+    return int(segment)
+
+
+def get_patch_operations(event: dict[str, Any] | ChangeEvent) -> list[dict[str, Any]]:
+    """Get JSON patch operations (RFC 6902) for a change of responsive data.
+
+    Changes of a range of values of a list are converted into one operation per value.
+
+    Args:
+        event (dict[str, Any] | ChangeEvent): the change (key/value arguments or event)
+
+    Returns:
+        list of operations (empty when the change has no path).
+    """
+    if event.get("operation") == Operation.BATCH:
+        return [
+            operation for change in get_changes(event) for operation in get_patch_operations(change)
+        ]
+
+    path = event.get("path")
+    if path is None:
+        return []
+
+    if "count" not in event:
+        return [__get_operation(event["operation"], path, event.get("new"))]
+
+    if event["context"] == Context.LIST:
+        return __get_range_operations(event, path[:-1], path[-1])
+
+    return __get_keys_operations(event, path)
+
+
+def __get_operation(operation: Operation, path: tuple, value: Any) -> dict[str, Any]:
+    """Get one JSON patch operation."""
+    if operation == Operation.VALUE_REMOVED:
+        return {"op": "remove", "path": to_json_pointer(path)}
+
+    name = "add" if operation == Operation.VALUE_ADDED else "replace"
+    return {"op": name, "path": to_json_pointer(path), "value": to_plain(value)}
+
+
+def __get_range_operations(
+    event: dict[str, Any] | ChangeEvent, path: tuple, start: int
+) -> list[dict[str, Any]]:
+    """Get JSON patch operations for a change of a range of values of a list."""
+    count, values = event["count"], event.get("new", [])
+    if event["operation"] == Operation.VALUE_CHANGED and count == len(values):
+        return [
+            __get_operation(Operation.VALUE_CHANGED, path + (start + offset,), value)
+            for offset, value in enumerate(values)
+        ]
+
+    operations = []
+    if event["operation"] != Operation.VALUE_ADDED:
+        operations.extend(
+            __get_operation(Operation.VALUE_REMOVED, path + (start,), None) for _ in range(count)
+        )
+    if event["operation"] != Operation.VALUE_REMOVED:
+        operations.extend(
+            __get_operation(Operation.VALUE_ADDED, path + (start + offset,), value)
+            for offset, value in enumerate(values)
+        )
+    return operations
+
+
+def __get_keys_operations(event: dict[str, Any] | ChangeEvent, path: tuple) -> list[dict[str, Any]]:
+    """Get JSON patch operations for a change of many keys of a dictionary."""
+    if event["operation"] == Operation.VALUE_REMOVED:
+        return [
+            __get_operation(Operation.VALUE_REMOVED, path + (key,), None) for key in event["old"]
+        ]
+
+    return [
+        __get_operation(
+            Operation.VALUE_CHANGED if key in event["old"] else Operation.VALUE_ADDED,
+            path + (key,),
+            value,
+        )
+        for key, value in event["new"].items()
+    ]
+
+
+def apply_patch(data: object, patch: list[dict[str, Any]]) -> None:
+    """Apply JSON patch operations (RFC 6902) to responsive data.
+
+    All operations are applied in one batch: the observers get one
+    notification. When an operation fails the operations before have
+    been applied (and are notified).
+
+    Args:
+        data (object): responsive data (root)
+        patch (list[dict[str, Any]]): list of operations
+
+    Raises:
+        ValueError: when an operation is invalid, a path does not exist or a test fails.
+    """
+    with data.batch():
+        for operation in patch:
+            __apply_operation(data, operation)
+
+
+def __resolve(data: object, pointer: str, insert: bool = False) -> tuple[object, Any]:
+    """Get container and key for a JSON pointer (the root can't be changed)."""
+    segments = parse_json_pointer(pointer)
+    if len(segments) == 0:  # pylint: disable=compare-to-zero
+        raise ValueError("the root can't be added, removed or replaced")
+
+    container = data
+    try:
+        for segment in segments[:-1]:
+            container = container[get_key(container, segment)]
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"path {pointer!r} does not exist") from error
+    return container, get_key(container, segments[-1], insert)
+
+
+def __get_value(data: object, pointer: str) -> Any:
+    """Get value for a JSON pointer."""
+    if len(pointer) == 0:  # pylint: disable=compare-to-zero
+        return data
+
+    container, key = __resolve(data, pointer)
+    if not isinstance(container, ListWrapper) and key not in container:
+        raise ValueError(f"path {pointer!r} does not exist")
+    return container[key]
+
+
+def __get_required_value(operation: dict[str, Any]) -> Any:
+    """Get value of an operation."""
+    if "value" not in operation:
+        raise ValueError(f"operation {operation['op']!r} requires a value")
+    return operation["value"]
+
+
+def __add(data: object, operation: dict[str, Any]) -> None:
+    """Add value (inserting it into a list)."""
+    value = __get_required_value(operation)
+    container, key = __resolve(data, operation["path"], insert=True)
+    if isinstance(container, ListWrapper):
+        container.insert(key, value)
+    else:
+        container[key] = value
+
+
+def __remove(data: object, operation: dict[str, Any]) -> None:
+    """Remove value."""
+    container, key = __resolve(data, operation["path"])
+    if not isinstance(container, ListWrapper) and key not in container:
+        raise ValueError(f"path {operation['path']!r} does not exist")
+    del container[key]
+
+
+def __replace(data: object, operation: dict[str, Any]) -> None:
+    """Replace existing value."""
+    value = __get_required_value(operation)
+    container, key = __resolve(data, operation["path"])
+    if not isinstance(container, ListWrapper) and key not in container:
+        raise ValueError(f"path {operation['path']!r} does not exist")
+    container[key] = value
+
+
+def __move(data: object, operation: dict[str, Any]) -> None:
+    """Move value to another path."""
+    value = deepcopy(to_plain(__get_value(data, operation["from"])))
+    __remove(data, {"path": operation["from"]})
+    __add(data, {"op": "move", "path": operation["path"], "value": value})
+
+
+def __copy(data: object, operation: dict[str, Any]) -> None:
+    """Copy value to another path."""
+    value = deepcopy(to_plain(__get_value(data, operation["from"])))
+    __add(data, {"op": "copy", "path": operation["path"], "value": value})
+
+
+def __test(data: object, operation: dict[str, Any]) -> None:
+    """Check value to be equal to the one of the operation."""
+    if to_plain(__get_value(data, operation["path"])) != __get_required_value(operation):
+        raise ValueError(f"test of path {operation['path']!r} failed")
+
+
+OPERATIONS = {
+    "add": __add,
+    "remove": __remove,
+    "replace": __replace,
+    "move": __move,
+    "copy": __copy,
+    "test": __test,
+}
+"""Functions applying the JSON patch operations."""
+
+
+def __apply_operation(data: object, operation: dict[str, Any]) -> None:
+    """Apply one JSON patch operation."""
+    function = OPERATIONS.get(operation.get("op"))
+    if function is None:
+        raise ValueError(f"unknown operation {operation.get('op')!r}")
+    if "path" not in operation or (operation["op"] in ("move", "copy") and "from" not in operation):
+        raise ValueError(f"operation {operation['op']!r} requires a path")
+    function(data, operation)
+
+
+class JsonPatchObserver(ChangeObserver):
+    """Converting changes of responsive data into JSON patch operations (RFC 6902).
+
+    The operations are collected and passed on as one patch (list of
+    operations) when at least `batch_size` operations have been collected
+    (and on `flush`): to a callback or as one line of JSON to a stream.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[dict[str, Any]]], None] = None,
+        stream: TextIO = None,
+        batch_size: int = 1,
+    ):
+        """Initialize observer without collected operations.
+
+        Args:
+            callback (Callable[[list[dict[str, Any]]], None]): function getting a patch
+            stream (TextIO): stream to write a patch (one line of JSON each)
+            batch_size (int): minimum number of operations of a patch
+
+        Raises:
+            ValueError: when neither a callback nor a stream is given.
+        """
+        if callback is None and stream is None:
+            raise ValueError("either a callback or a stream is required")
+
+        self.__callback = callback
+        self.__stream = stream
+        self.__batch_size = batch_size
+        self.__operations: list[dict[str, Any]] = []
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when the responsive data has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        self.__operations.extend(get_patch_operations(event))
+        if len(self.__operations) >= self.__batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Pass on the collected operations as one patch (if any)."""
+        if len(self.__operations) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        patch, self.__operations = self.__operations, []
+        if self.__callback is not None:
+            self.__callback(patch)
+        if self.__stream is not None:
+            self.__stream.write(json.dumps(patch) + "\n")
@@ -23,13 +23,21 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 # pylint: disable=too-few-public-methods
-from collections.abc import Callable
+import weakref
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterator
 from typing import Any
 
+from responsive.constants import Operation
+from responsive.event import ChangeEvent
+
 
 class Observer:
     """Observer from the subject/observer pattern."""
 
+    __slots__ = ()
+
     def update(self, subject: object, *args: Any, **kwargs: Any):
         """Called when related subject has changed.
 
@@ -40,12 +48,45 @@ class Observer:
         """
         raise NotImplementedError()
 
+    def on_notify(self, subject: object, *args: Any, **kwargs: Any) -> Any:
+        """Called by a subject for a notification (see `Subject.notify`).
+
+        The default calls `update`; a responsive object (which has an `update`
+        of its own) overrides it to forward the notification.
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+
+        Returns:
+            result of `update`.
+        """
+        return self.update(subject, *args, **kwargs)
+
+    def on_change(self, subject: object, event: ChangeEvent) -> Any:
+        """Called when a responsive object has changed.
+
+        The default calls `update` with the fields of the event as key/value
+        arguments; override it to get the event itself (no conversion).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+
+        Returns:
+            result of `update`.
+        """
+        return self.update(subject, **event.to_kwargs())
+
     def get_interests(self) -> dict[str, Callable[[Any], bool]]:  # pylint: disable=no-self-use
         """Telling a subject the interest. When providing {} then all changes
         are of interest (default) otherwise the interest is related to a name
         and a function for the value telling - when the name is related to the
         change - whether the value is of interest. If not interest does not
-        match the notification (updated) is not done.
+        match the notification (updated) is not done. Instead of a function
+        you can provide a value; then the interest is given when the value is
+        equal (fastest variant since the subject can do a hashed lookup).
 
         Returns:
             dictionary with names and functions (idea: `is_relevant(value)`)
@@ -53,6 +94,48 @@ class Observer:
         return {}
 
 
+def get_changes(event: dict[str, Any] | ChangeEvent) -> list | tuple:
+    """Get the single changes of a change (the changes of a batch or the change itself).
+
+    Args:
+        event (dict[str, Any] | ChangeEvent): the change (key/value arguments or event)
+
+    Returns:
+        changes in the order they have been done.
+    """
+    return event["events"] if event.get("operation") == Operation.BATCH else (event,)
+
+
+class ChangeObserver(Observer):
+    """Base class of the observers handling the changes of responsive data.
+
+    A subject passes the change as event to `on_change`; a notification with
+    key/value arguments (e.g. by an adapter) is passed on by `update` as
+    dictionary of the same fields. Use `get_changes` for the changes of a batch.
+    """
+
+    __slots__ = ()
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when the responsive data has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        self.on_change(subject, kwargs)
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when the responsive data has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        raise NotImplementedError()
+
+
 class DefaultObserver(Observer):
     """A simple observer class."""
 
@@ -101,6 +184,184 @@ class DefaultObserver(Observer):
         return len(self.__updates)
 
 
+class RingBufferObserver(DefaultObserver):
+    """Observer keeping the last updates only (drop-in alternative to `DefaultObserver`).
+
+    The updates are stored in a ring buffer of fixed capacity: recording an
+    update is O(1) and the oldest update is dropped when the buffer is full,
+    so the memory does not grow in a long running process.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize empty ring buffer.
+
+        Args:
+            capacity (int): maximum number of updates to keep
+
+        Raises:
+            ValueError: when the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        super().__init__()
+        self.__updates = deque(maxlen=capacity)
+        self.__count_total = 0
+        self.__count_dropped = 0
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when the subject has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        if len(self.__updates) == self.__updates.maxlen:
+            self.__count_dropped += 1
+        self.__updates.append((subject, args, kwargs))
+        self.__count_total += 1
+
+    def __iter__(self):
+        """Allows iterating over the kept updates of this observer (oldest first)."""
+        return iter(self.__updates)
+
+    def get_last(self, count: int) -> list[tuple[object, tuple, dict[str, Any]]]:
+        """Get last updates.
+
+        Args:
+            count (int): maximum number of updates
+
+        Returns:
+            list of last updates (oldest first).
+        """
+        count = max(0, min(count, len(self.__updates)))
+        return [self.__updates[-count + offset] for offset in range(count)]
+
+    def clear(self):
+        """Delete all kept updates (the counters are not reset)."""
+        self.__updates.clear()
+
+    def get_count_updates(self):
+        """Provide number of kept updates."""
+        return len(self.__updates)
+
+    def get_count_total(self) -> int:
+        """Provide number of all updates (including dropped ones)."""
+        return self.__count_total
+
+    def get_count_dropped(self) -> int:
+        """Provide number of updates dropped because the buffer was full."""
+        return self.__count_dropped
+
+    def get_capacity(self) -> int:
+        """Provide maximum number of updates to keep."""
+        return self.__updates.maxlen
+
+
+class ScalarRingBufferObserver(ChangeObserver, DefaultObserver):
+    """Observer keeping one numeric field of the last changes in an array (e.g. for metrics).
+
+    Other than `RingBufferObserver` no subjects, events or old values are
+    kept; the memory is allocated once (`capacity` times the item size of
+    the array type). Changes without a number for the field are ignored
+    (they are counted). The changes of a batch are recorded one by one.
+    """
+
+    def __init__(self, capacity: int = 1000, name: str = "new", typecode: str = "d"):
+        """Initialize ring buffer with zeros.
+
+        Args:
+            capacity (int): maximum number of values to keep
+            name (str): field of the change to record (default: new value)
+            typecode (str): type of the values (see module `array`, default: double)
+
+        Raises:
+            ValueError: when the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        super().__init__()
+        self.__values = array(typecode, [0]) * capacity
+        self.__name = name
+        self.__count_kept = 0
+        self.__count_total = 0
+        self.__count_dropped = 0
+        self.__count_ignored = 0
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when a responsive object has changed (recording the field).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        for change in get_changes(event):
+            self.__record(change.get(self.__name))
+
+    def __iter__(self) -> Iterator[int | float]:
+        """Allows iterating over the kept values (oldest first)."""
+        start = self.__count_total - self.__count_kept
+        return (
+            self.__values[index % len(self.__values)] for index in range(start, self.__count_total)
+        )
+
+    def get_last(self, count: int) -> list[int | float]:
+        """Get last values.
+
+        Args:
+            count (int): maximum number of values
+
+        Returns:
+            list of last values (oldest first).
+        """
+        start = self.__count_kept - max(0, min(count, self.__count_kept))
+        return list(self)[start:]
+
+    def clear(self):
+        """Delete all kept values (the counters are not reset)."""
+        self.__count_kept = 0
+
+    def get_count_updates(self) -> int:
+        """Provide number of kept values."""
+        return self.__count_kept
+
+    def get_count_total(self) -> int:
+        """Provide number of all recorded values (including dropped ones)."""
+        return self.__count_total
+
+    def get_count_dropped(self) -> int:
+        """Provide number of values dropped because the buffer was full."""
+        return self.__count_dropped
+
+    def get_count_ignored(self) -> int:
+        """Provide number of changes without a number for the field."""
+        return self.__count_ignored
+
+    def get_capacity(self) -> int:
+        """Provide maximum number of values to keep."""
+        return len(self.__values)
+
+    def __record(self, value: Any) -> None:
+        """Store value overwriting the oldest one when the buffer is full."""
+        if not isinstance(value, (int, float)):
+            self.__count_ignored += 1
+            return
+
+        try:
+            self.__values[self.__count_total % len(self.__values)] = value
+        except (OverflowError, TypeError):
+            self.__count_ignored += 1
+            return
+
+        self.__count_total += 1
+        if self.__count_kept == len(self.__values):
+            self.__count_dropped += 1
+        else:
+            self.__count_kept += 1
+
+
 class DoNothingObserver(Observer):
     """Does nothing (more of a test)."""
 
@@ -113,6 +374,14 @@ class DoNothingObserver(Observer):
             **kwargs (Any): optional key/value arguments
         """
 
+    def on_change(self, subject: object, event: ChangeEvent) -> None:
+        """Called when a responsive object has changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+        """
+
 
 class OutputObserver(Observer):
     """Output a line for each update. Default output function is `print`."""
@@ -132,3 +401,80 @@ class OutputObserver(Observer):
         self.__output_function(
             f"subject with id {id(subject)} has notified with {args} and {kwargs}"
         )
+
+
+class WeakObserver(Observer):
+    """Observer forwarding to another observer without keeping it alive.
+
+    Register it instead of the observer when the subject should not keep the
+    observer alive: once the observer has been garbage collected the weak
+    observer removes itself from the subject on the next notification. The
+    interests are the ones of the observer.
+    """
+
+    __slots__ = ("__observer",)
+
+    def __init__(self, observer: Observer):
+        """Initialize observer.
+
+        Args:
+            observer (Observer): the observer to forward the notifications to
+        """
+        self.__observer = weakref.ref(observer)
+
+    def get_observer(self) -> Observer | None:
+        """Get the observer (None when it has been garbage collected)."""
+        return self.__observer()
+
+    def get_interests(self) -> dict[str, Callable[[Any], bool]]:
+        """Telling a subject the interests of the observer."""
+        observer = self.__observer()
+        return {} if observer is None else observer.get_interests()
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> Any:
+        """Called when the subject has been changed (forwarding it).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+
+        Returns:
+            result of `update` of the observer.
+        """
+        observer = self.__get_observer(subject)
+        return None if observer is None else observer.update(subject, *args, **kwargs)
+
+    def on_notify(self, subject: object, *args: Any, **kwargs: Any) -> Any:
+        """Called by a subject for a notification (forwarding it).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+
+        Returns:
+            result of `on_notify` of the observer.
+        """
+        observer = self.__get_observer(subject)
+        return None if observer is None else observer.on_notify(subject, *args, **kwargs)
+
+    def on_change(self, subject: object, event: ChangeEvent) -> Any:
+        """Called when a responsive object has changed (forwarding it).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+
+        Returns:
+            result of `on_change` of the observer.
+        """
+        observer = self.__get_observer(subject)
+        return None if observer is None else observer.on_change(subject, event)
+
+    def __get_observer(self, subject: object) -> Observer | None:
+        """Get observer (removing this one from the subject when it has been collected)."""
+        observer = self.__observer()
+        if observer is None and subject.has_observer(self):
+            subject.remove_observer(self)
+        return observer
@@ -0,0 +1,260 @@
+"""Module path.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pylint: disable=too-few-public-methods
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from responsive.observer import Observer
+
+WILDCARD = "*"
+"""Segment of a pattern matching any name or index."""
+
+RECURSIVE_WILDCARD = "**"
+"""Segment of a pattern matching any number of names and indices (a subtree)."""
+
+PATTERN = re.compile(r"(?:[^.\[\]]+|\[[^\[\]]*\])(?:\.[^.\[\]]+|\[[^\[\]]*\])*")
+"""Syntax of a pattern: names separated by dots and indices in brackets."""
+
+SEGMENT = re.compile(r"([^.\[\]]+)|\[([^\[\]]*)\]")
+"""One name or one index of a pattern."""
+
+
+def parse_segment(index: str) -> Any:
+    """Get segment for the text in brackets of a pattern.
+
+    Args:
+        index (str): text in brackets
+
+    Returns:
+        integer for digits, text without quotes otherwise.
+    """
+    if index.isdigit():
+        return int(index)
+    if len(index) >= 2 and index[0] == index[-1] and index[0] in "'\"":
+        return index[1:-1]
+    return index
+
+
+def parse_pattern(pattern: str | tuple) -> tuple:
+    """Get names and indices of a path pattern.
+
+    A pattern is a tuple of names and indices (as the path of a change event)
+    or a text like `orders[*].status`; `*` matches any name or index, `**` any
+    number of names and indices. An empty pattern matches the root only.
+
+    Args:
+        pattern (str | tuple): pattern as text or tuple
+
+    Returns:
+        tuple of names, indices and wildcards.
+
+    Raises:
+        ValueError: when the text is not a valid pattern.
+
+    Example:
+
+        >>> parse_pattern("orders[*].status")
+        ('orders', '*', 'status')
+        >>> parse_pattern("matrix[1][2].**")
+        ('matrix', 1, 2, '**')
+    """
+    if isinstance(pattern, tuple):
+        return pattern
+
+    if len(pattern) == 0:  # pylint: disable=compare-to-zero
+        return ()
+
+    if PATTERN.fullmatch(pattern) is None:
+        raise ValueError(f"invalid path pattern: {pattern!r}")
+
+    return tuple(
+        name if index is None else parse_segment(index)
+        for name, index in ((match.group(1), match.group(2)) for match in SEGMENT.finditer(pattern))
+    )
+
+
+class PathNode:
+    """Node of a `PathTrie` for one segment of the registered patterns."""
+
+    __slots__ = ("children", "observers", "recursive")
+
+    def __init__(self, recursive: bool = False):
+        """Initialize node without children and observers.
+
+        Args:
+            recursive (bool): true for a `**` segment
+        """
+        self.children: dict[Any, PathNode] = {}
+        self.observers: dict[int, Observer] = {}
+        self.recursive = recursive
+
+
+class PathTrie:
+    """Observers registered for path patterns organized as a trie.
+
+    Finding the observers for the path of a change walks the trie segment by
+    segment, so the cost depends on the depth of the path (and the wildcards
+    on the way) but not on the number of registered patterns. A change of a
+    value does change the values below it as well, so the observers with a
+    pattern below the path of a change are matched too (e.g. `orders[*].status`
+    for replacing `orders`) unless the path is matched by a `**` only.
+    """
+
+    __slots__ = ("root", "count")
+
+    def __init__(self):
+        """Initialize empty trie."""
+        self.root = PathNode()
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Get number of registered patterns."""
+        return self.count
+
+    def add(self, pattern: tuple, position: int, observer: Observer) -> None:
+        """Adding observer for a pattern (once only).
+
+        Args:
+            pattern (tuple): names, indices and wildcards (see `parse_pattern`)
+            position (int): position of registration (order of notification)
+            observer (Observer): object that will be notified
+        """
+        node = self.root
+        for segment in pattern:
+            if segment not in node.children:
+                node.children[segment] = PathNode(recursive=segment == RECURSIVE_WILDCARD)
+            node = node.children[segment]
+
+        if any(registered is observer for registered in node.observers.values()):
+            return
+
+        node.observers[position] = observer
+        self.count += 1
+
+    def remove(self, pattern: tuple, observer: Observer) -> None:
+        """Removing observer for a pattern.
+
+        Args:
+            pattern (tuple): names, indices and wildcards (see `parse_pattern`)
+            observer (Observer): object that don't want to get updated anymore
+
+        Raises:
+            ValueError: when the observer is not registered for the pattern.
+        """
+        nodes = [self.root]
+        for segment in pattern:
+            node = nodes[-1].children.get(segment)
+            if node is None:
+                raise ValueError("observer is not registered for the pattern")
+            nodes.append(node)
+
+        for position, registered in nodes[-1].observers.items():
+            if registered is observer:
+                del nodes[-1].observers[position]
+                break
+        else:
+            raise ValueError("observer is not registered for the pattern")
+
+        self.count -= 1
+        for segment, parent, node in zip(reversed(pattern), reversed(nodes[:-1]), reversed(nodes)):
+            if len(node.children) > 0 or len(node.observers) > 0:
+                break
+            del parent.children[segment]
+
+    def match(self, path: tuple, shifted: bool = False) -> dict[int, Observer]:
+        """Get observers with a pattern matching given path (or below it).
+
+        Args:
+            path (tuple): names and indices of a change
+            shifted (bool): true when the values of a list from the last index of
+                the path on have changed (a range of values, or values moved by
+                adding or removing one); then any index from there on matches
+
+        Returns:
+            observers by position of registration.
+        """
+        nodes = self.__expand((self.root,))
+        for position, segment in enumerate(path):
+            if shifted and position == len(path) - 1:
+                nodes = self.__expand(self.__step_from(nodes, segment))
+            else:
+                nodes = self.__expand(self.__step(nodes, segment))
+            if len(nodes) == 0:  # pylint: disable=compare-to-zero
+                return {}
+
+        matched: dict[int, Observer] = {}
+        for node in nodes:
+            if node.recursive:
+                # a subtree pattern like `**.status` does not match all changes
+                matched.update(node.observers)
+            else:
+                self.__collect(node, matched)
+        return matched
+
+    @staticmethod
+    def __step(nodes: Iterable[PathNode], segment: Any) -> list[PathNode]:
+        """Get nodes matching one more segment of a path."""
+        next_nodes = []
+        for node in nodes:
+            child = node.children.get(segment)
+            if child is not None:
+                next_nodes.append(child)
+            child = node.children.get(WILDCARD)
+            if child is not None:
+                next_nodes.append(child)
+            if node.recursive:
+                next_nodes.append(node)
+        return next_nodes
+
+    @staticmethod
+    def __step_from(nodes: Iterable[PathNode], start: int) -> list[PathNode]:
+        """Get nodes matching an index of a list from given one on."""
+        next_nodes = []
+        for node in nodes:
+            next_nodes.extend(
+                child
+                for segment, child in node.children.items()
+                if segment == WILDCARD or (type(segment) is int and segment >= start)
+            )
+            if node.recursive:
+                next_nodes.append(node)
+        return next_nodes
+
+    @staticmethod
+    def __expand(nodes: Iterable[PathNode]) -> list[PathNode]:
+        """Add nodes of `**` matching no segment."""
+        expanded = []
+        for node in nodes:
+            while node is not None:
+                expanded.append(node)
+                node = node.children.get(RECURSIVE_WILDCARD)
+        return expanded
+
+    def __collect(self, node: PathNode, matched: dict[int, Observer]) -> None:
+        """Add observers of a node and of all nodes below it."""
+        matched.update(node.observers)
+        for child in node.children.values():
+            self.__collect(child, matched)
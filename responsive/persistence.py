@@ -0,0 +1,247 @@
+"""Module persistence.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import os
+
+# snapshot and log are written by a ChangeLog and loaded from trusted directories only
+import pickle  # nosec B403
+import struct
+import time
+import uuid
+from typing import Any, BinaryIO
+
+from responsive.constants import FsyncPolicy
+from responsive.data import make_responsive
+from responsive.event import ChangeEvent
+from responsive.observer import ChangeObserver
+from responsive.replication import SNAPSHOT, ReplicationObserver, apply_change
+from responsive.subject import Subject
+
+SNAPSHOT_FILENAME = "snapshot.pickle"
+"""Name of the file with the last snapshot (generation, sequence number and plain data)."""
+
+LOG_FILENAME = "changes.log"
+"""Name of the file with the changes since the last snapshot."""
+
+RECORD_HEADER = struct.Struct("<I")
+"""Header of a record of the change log (length of the pickled generation and messages)."""
+
+
+def read_records(file: BinaryIO, generation: str) -> list[tuple]:
+    """Read the messages of all complete records of a change log for a snapshot.
+
+    An incomplete record at the end (crash while writing) is ignored as well as
+    records written before the snapshot (crash before the log was truncated).
+
+    Args:
+        file (BinaryIO): change log opened for reading
+        generation (str): generation of the snapshot
+
+    Returns:
+        messages of a `ReplicationObserver` in order.
+    """
+    messages = []
+    while True:
+        header = file.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return messages
+
+        size = RECORD_HEADER.unpack(header)[0]
+        payload = file.read(size)
+        if len(payload) < size:
+            return messages
+
+        # the log is trusted (written by a ChangeLog in a directory owned by the application)
+        record_generation, record_messages = pickle.loads(payload)  # nosec B301
+        if record_generation == generation:
+            messages.extend(record_messages)
+
+
+def load_plain(directory: str) -> tuple[int, Any] | None:
+    """Rebuild plain data from the snapshot and the change log of a directory.
+
+    Args:
+        directory (str): directory of a `ChangeLog`
+
+    Returns:
+        sequence number of the last change and plain data (None when there is no snapshot).
+    """
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILENAME)
+    if not os.path.exists(snapshot_path):
+        return None
+
+    with open(snapshot_path, "rb") as file:
+        # the snapshot is trusted (written by a ChangeLog in a directory owned by the application)
+        generation, sequence, data = pickle.load(file)  # nosec B301
+
+    log_path = os.path.join(directory, LOG_FILENAME)
+    if os.path.exists(log_path):
+        with open(log_path, "rb") as file:
+            for message in read_records(file, generation):
+                if message[0] > sequence:
+                    apply_change(data, message)
+                    sequence = message[0]
+    return sequence, data
+
+
+def recover(directory: str, lazy: bool = False) -> object | None:
+    """Rebuild responsive data from the snapshot and the change log of a directory.
+
+    The changes are applied to the plain data (no notifications) which is made
+    responsive afterwards.
+
+    Args:
+        directory (str): directory of a `ChangeLog`
+        lazy (bool): when true nested containers are wrapped on first access only
+
+    Returns:
+        responsive data (None when there is no snapshot).
+    """
+    loaded = load_plain(directory)
+    return None if loaded is None else make_responsive(loaded[1], lazy=lazy)
+
+
+class ChangeLog(ChangeObserver):
+    """Append-only log of the changes of a responsive object (write-ahead log).
+
+    The changes are encoded as messages of a `ReplicationObserver`. They are
+    collected and written as one record (group commit) when `group_size`
+    messages have been collected, when `commit` is called or when the log is
+    closed; whether the operating system is told to write through to the
+    disk depends on the `FsyncPolicy`. A snapshot of the whole data is
+    written when the log is opened and after `snapshot_interval` changes;
+    then the log starts from scratch. Use `recover` to rebuild the data.
+
+    Snapshot and log are pickled: recover from a directory written by a
+    `ChangeLog` of the application only (never from untrusted files).
+    """
+
+    def __init__(
+        self,
+        root: Subject,
+        directory: str,
+        fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL,
+        fsync_interval: float = 1.0,
+        group_size: int = 100,
+        snapshot_interval: int = 100000,
+    ):
+        """Open log writing a snapshot of the data.
+
+        Args:
+            root (Subject): responsive object to log
+            directory (str): directory for the snapshot and the change log
+            fsync_policy (FsyncPolicy): when to write through to the disk
+            fsync_interval (float): seconds between writes through to the disk (INTERVAL)
+            group_size (int): number of changes written at once
+            snapshot_interval (int): number of changes after which a new snapshot is written
+        """
+        super().__init__()
+        os.makedirs(directory, exist_ok=True)
+        self.__root = root
+        self.__directory = directory
+        self.__fsync_policy = fsync_policy
+        self.__fsync_interval = fsync_interval
+        self.__group_size = group_size
+        self.__snapshot_interval = snapshot_interval
+        self.__messages: list[tuple] = []
+        self.__generation = ""
+        self.__count_changes = 0
+        self.__last_fsync = time.monotonic()
+        self.__file = open(  # pylint: disable=consider-using-with
+            os.path.join(directory, LOG_FILENAME), "ab"
+        )
+        self.__replication = ReplicationObserver(root, self.__append)
+        root.add_observer(self)
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called after the change has been encoded (commit or snapshot when due).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        if self.__count_changes >= self.__snapshot_interval:
+            self.snapshot()
+        elif len(self.__messages) >= self.__group_size:
+            self.commit()
+
+    def commit(self) -> None:
+        """Write collected changes to the log."""
+        if len(self.__messages) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        payload = pickle.dumps(
+            (self.__generation, self.__messages), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self.__messages = []
+        self.__file.write(RECORD_HEADER.pack(len(payload)) + payload)
+        self.__file.flush()
+        if self.__fsync_policy == FsyncPolicy.ALWAYS or (
+            self.__fsync_policy == FsyncPolicy.INTERVAL
+            and time.monotonic() - self.__last_fsync >= self.__fsync_interval
+        ):
+            self.__fsync(self.__file)
+
+    def snapshot(self) -> None:
+        """Write snapshot of the whole data starting a new log."""
+        self.__replication.resync()
+
+    def close(self) -> None:
+        """Write collected changes and stop logging."""
+        self.commit()
+        if self.__fsync_policy != FsyncPolicy.NEVER:
+            self.__fsync(self.__file)
+        self.__file.close()
+        self.__root.remove_observer(self.__replication)
+        self.__root.remove_observer(self)
+
+    def __append(self, message: tuple) -> None:
+        """Collect message of the replication (writing a snapshot immediately)."""
+        if message[1] == SNAPSHOT:
+            self.__write_snapshot(message[0], message[4])
+        else:
+            self.__messages.append(message)
+            self.__count_changes += 1
+
+    def __write_snapshot(self, sequence: int, data: Any) -> None:
+        """Replace snapshot (atomically) and truncate the log."""
+        generation = uuid.uuid4().hex
+        path = os.path.join(self.__directory, SNAPSHOT_FILENAME)
+        with open(path + ".tmp", "wb") as file:
+            pickle.dump((generation, sequence, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            if self.__fsync_policy != FsyncPolicy.NEVER:
+                self.__fsync(file)
+        os.replace(path + ".tmp", path)
+
+        # changes until now are part of the snapshot
+        self.__generation = generation
+        self.__messages = []
+        self.__count_changes = 0
+        self.__file.truncate(0)
+
+    def __fsync(self, file: BinaryIO) -> None:
+        """Write file through to the disk."""
+        os.fsync(file.fileno())
+        self.__last_fsync = time.monotonic()
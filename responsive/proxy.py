@@ -0,0 +1,267 @@
+"""Module proxy.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import dataclasses
+import inspect
+from typing import Any, ClassVar, get_origin
+
+from responsive.classify import CACHES, HANDLERS, VALUE_TYPES, get_slot_names
+from responsive.constants import Context, Operation
+from responsive.event import UNSET, ChangeEvent
+from responsive.wrapper import PRIVATE_ATTRIBUTES, READS, DictWrapper, Wrapper
+
+
+class Field:
+    """Descriptor of a field of the wrapped class (attribute of a proxy class).
+
+    Reading a field (when not in lazy mode and no computed value tracks the
+    reads) gets the value from the wrapped object directly. Changing a field
+    which is a value to another value (when not reconciling) is done directly
+    too; other changes and removing a field are done by the dictionary wrapper
+    (see `ClassProxy`).
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, slot: bool):
+        """Initialize descriptor.
+
+        Args:
+            name (str): name of the field
+            slot (bool): true when the field is a slot (otherwise in the instance dictionary)
+        """
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, wrapper: DictWrapper | None, _owner: type = None) -> Any:
+        """Get value of the field (the descriptor itself when accessed on the class).
+
+        Args:
+            wrapper (DictWrapper | None): the proxy
+            _owner (type): the proxy class
+
+        Returns:
+            value of the field.
+
+        Raises:
+            AttributeError: when the field is not set
+        """
+        if wrapper is None:
+            return self
+        try:
+            if READS or wrapper.options.lazy:
+                return wrapper[self.name]
+            if self.slot:
+                return getattr(wrapper.obj, self.name)
+            return wrapper.obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, wrapper: DictWrapper, value: Any) -> None:
+        """Change value of the field.
+
+        Args:
+            wrapper (DictWrapper): the proxy
+            value (Any): new value
+        """
+        obj = wrapper.obj
+        name = self.name
+        old_value = getattr(obj, name, UNSET) if self.slot else obj.__dict__.get(name, UNSET)
+        if (
+            old_value is UNSET
+            or isinstance(old_value, Wrapper)
+            or type(value) not in VALUE_TYPES
+            or wrapper.options.reconcile
+        ):
+            wrapper[name] = value
+            return
+
+        if self.slot:
+            setattr(obj, name, value)
+        else:
+            obj.__dict__[name] = value
+        wrapper.notify_change(
+            ChangeEvent(
+                id=id(wrapper),
+                context=Context.CLASS,
+                path=wrapper.get_path(name),
+                name=name,
+                old=old_value,
+                new=value,
+                operation=Operation.VALUE_CHANGED,
+            )
+        )
+
+
+class ClassProxy(DictWrapper):
+    """Base class of the generated proxy classes (see `get_proxy_class`).
+
+    The fields declared by the wrapped class are attributes of the proxy
+    class; changing other names raises AttributeError instead of adding a
+    field, reading them falls back to the fields of the wrapped object. Fields
+    which are named like an attribute of the wrapper (e.g. `root` or `items`)
+    are changed as attributes too but are read as items (`data["items"]`).
+    """
+
+    __slots__ = ()
+
+    FIELDS: dict[str, Field | None] = {}
+    """Descriptor of each field declared by the wrapped class (of each proxy class; None
+    for a field named like an attribute of the wrapper)."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Changing a declared field (or setting a private attribute of the wrapper).
+
+        Args:
+            name (str): name of the field
+            value (Any): new value
+
+        Raises:
+            AttributeError: when the name is not a declared field
+        """
+        field = self.FIELDS.get(name)
+        if field is not None:
+            field.__set__(self, value)
+        elif name in self.FIELDS:
+            self[name] = value
+        elif name in PRIVATE_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{type(self.obj).__name__!r} object has no field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """Removing a declared field.
+
+        Args:
+            name (str): name of the field
+
+        Raises:
+            AttributeError: when the name is not a declared field or the field is not set
+        """
+        if name not in self.FIELDS:
+            raise AttributeError(f"{type(self.obj).__name__!r} object has no field {name!r}")
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getattr__(self, name: str) -> Any:
+        """Get value of a field which is not declared by the wrapped class.
+
+        Args:
+            name (str): name of the field
+
+        Returns:
+            value of the field.
+
+        Raises:
+            AttributeError: when the wrapped object has no such field
+        """
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self.obj).__name__!r} object has no field {name!r}"
+            ) from None
+
+
+PROXY_CLASSES: dict[type, type[DictWrapper]] = {}
+"""Proxy class (or DictWrapper when there is none) for each wrapped type."""
+
+CACHES.append(PROXY_CLASSES)
+
+
+def get_proxy_class(cls: type) -> type[DictWrapper]:
+    """Get wrapper class for a dictionary or class type (generated once per type).
+
+    Args:
+        cls (type): type of the wrapped object
+
+    Returns:
+        the proxy class or DictWrapper (for dictionaries, registered types and
+        classes without declared fields).
+    """
+    proxy_class = PROXY_CLASSES.get(cls)
+    if proxy_class is None:
+        proxy_class = PROXY_CLASSES[cls] = create_proxy_class(cls)
+    return proxy_class
+
+
+def create_proxy_class(cls: type) -> type[DictWrapper]:
+    """Create proxy class with a descriptor for each field declared by a class.
+
+    Args:
+        cls (type): the wrapped class
+
+    Returns:
+        the proxy class or DictWrapper (for dictionaries, registered types and
+        classes without declared fields).
+    """
+    if issubclass(cls, dict) or any(base in HANDLERS for base in cls.__mro__):
+        return DictWrapper
+
+    names = get_field_names(cls)
+    if len(names) == 0:  # pylint: disable=compare-to-zero
+        return DictWrapper
+
+    fields = {
+        name: None if hasattr(ClassProxy, name) else Field(name, slot)
+        for name, slot in names.items()
+    }
+    descriptors = {name: field for name, field in fields.items() if field is not None}
+    return type(
+        f"{cls.__name__}Proxy",
+        (ClassProxy,),
+        {"__slots__": (), "__module__": __name__, "FIELDS": fields, **descriptors},
+    )
+
+
+def get_field_names(cls: type) -> dict[str, bool]:
+    """Get names of the fields declared by a class.
+
+    The fields are the slots and, for a class with an instance dictionary,
+    the fields of a dataclass or the annotated names (without class variables).
+
+    Args:
+        cls (type): the class
+
+    Returns:
+        dictionary with the names of the fields (true for a slot).
+    """
+    names = dict.fromkeys(get_slot_names(cls), True)
+    if getattr(cls, "__dictoffset__", 0) == 0:
+        return names
+
+    if dataclasses.is_dataclass(cls):
+        declared = [field.name for field in dataclasses.fields(cls)]
+    else:
+        declared = [
+            name
+            for base in reversed(cls.__mro__)
+            for name, annotation in inspect.get_annotations(base).items()
+            if annotation is not ClassVar and get_origin(annotation) is not ClassVar
+        ]
+    for name in declared:
+        names.setdefault(name, False)
+    return names
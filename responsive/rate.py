@@ -0,0 +1,416 @@
+"""Module rate.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import heapq
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from responsive.event import ChangeEvent
+from responsive.observer import ChangeObserver, Observer, get_changes
+from responsive.subject import get_change_key
+
+
+def deliver(observer: Observer, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+    """Deliver a change to an observer (`on_change` for an event, else `on_notify`).
+
+    Args:
+        observer (Observer): the observer to notify
+        subject (object): the one who did the notification
+        event (dict[str, Any] | ChangeEvent): the change
+    """
+    if isinstance(event, ChangeEvent):
+        observer.on_change(subject, event)
+    else:
+        observer.on_notify(subject, **event)
+
+
+class Scheduler:
+    """One thread running callbacks at given times (shared by many observers).
+
+    The clock can be replaced (e.g. for tests); without a thread the due
+    callbacks run when calling `run_pending`.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        threaded: bool = True,
+        max_errors: int = 100,
+    ):
+        """Initialize scheduler (the thread is started with the first callback).
+
+        Args:
+            clock (Callable[[], float]): function returning the current time in seconds
+            threaded (bool): when false no thread is used
+            max_errors (int): number of the last exceptions of callbacks being kept
+        """
+        self.clock = clock
+        self.__threaded = threaded
+        self.__heap: list[tuple[float, int, Callable[[], None]]] = []
+        self.__counter = 0
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__closed = False
+        self.__errors: deque[Exception] = deque(maxlen=max_errors)
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> None:
+        """Run callback at given time.
+
+        Args:
+            when (float): time (of the clock) to run the callback
+            callback (Callable[[], None]): function to call
+        """
+        with self.__condition:
+            heapq.heappush(self.__heap, (when, self.__counter, callback))
+            self.__counter += 1
+            if self.__threaded and self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def run_pending(self) -> int:
+        """Run the callbacks being due.
+
+        Returns:
+            number of callbacks that have been run.
+        """
+        count = 0
+        while True:
+            with self.__condition:
+                if len(self.__heap) == 0 or self.__heap[0][0] > self.clock():
+                    return count
+                callback = heapq.heappop(self.__heap)[2]
+
+            try:
+                callback()
+            except Exception as error:  # pylint: disable=broad-except
+                self.__errors.append(error)
+            count += 1
+
+    def get_count_pending(self) -> int:
+        """Get number of callbacks waiting to run."""
+        return len(self.__heap)
+
+    def get_errors(self) -> list[Exception]:
+        """Get the last exceptions raised by callbacks."""
+        return list(self.__errors)
+
+    def close(self) -> None:
+        """Stop the thread (callbacks not being due are not run)."""
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __run(self) -> None:
+        """Wait for the next callback being due and run it (thread function)."""
+        while True:
+            with self.__condition:
+                while not self.__closed and (
+                    len(self.__heap) == 0 or self.__heap[0][0] > self.clock()
+                ):
+                    timeout = self.__heap[0][0] - self.clock() if len(self.__heap) > 0 else None
+                    self.__condition.wait(timeout)
+                if self.__closed:
+                    return
+            self.run_pending()
+
+
+SCHEDULER = Scheduler()
+"""Scheduler shared by all observers not getting an own one (thread started on first use)."""
+
+MIN_PRUNE_SIZE = 1024
+"""Number of delivery times a throttle keeps at least before forgetting the expired ones."""
+
+
+class PendingChanges:
+    """Changes waiting for delivery, one per changed value (first old, last new value)."""
+
+    def __init__(self):
+        """Initialize without changes."""
+        self.changes: dict[tuple, tuple[object, dict[str, Any] | ChangeEvent]] = {}
+        self.lock = threading.Lock()
+
+    def add(self, key: tuple, subject: object, event: dict[str, Any] | ChangeEvent) -> bool:
+        """Adding change replacing the pending change of same value.
+
+        Args:
+            key (tuple): key of the changed value (see `responsive.subject.get_change_key`)
+            subject (object): the one who did the notification
+            event (dict[str, Any] | ChangeEvent): the change
+
+        Returns:
+            true when there has been no pending change of the value.
+        """
+        previous = self.changes.get(key)
+        if previous is not None and "old" in previous[1]:
+            if isinstance(event, ChangeEvent):
+                event = event.replace(old=previous[1]["old"])
+            else:
+                event = {**event, "old": previous[1]["old"]}
+        self.changes[key] = (subject, event)
+        return previous is None
+
+    def pop_all(self) -> list[tuple[object, dict[str, Any] | ChangeEvent]]:
+        """Removing all pending changes.
+
+        Returns:
+            list of subject and change in order of the first change of each value.
+        """
+        changes = list(self.changes.values())
+        self.changes.clear()
+        return changes
+
+
+class RateLimitedObserver(ChangeObserver):
+    """Base class of the observers delivering changes of the same value at a bounded rate.
+
+    A notification of many changes (batch) is handled change by change.
+    Changes which can't be combined (adding or removing values, ranges) are
+    delivered at once after the pending changes (keeping the order).
+    """
+
+    def __init__(self, observer: Observer):
+        """Initialize observer.
+
+        Args:
+            observer (Observer): the observer to deliver the changes to
+        """
+        super().__init__()
+        self.observer = observer
+        self.pending = PendingChanges()
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when related subject has changed (limiting the rate of delivery).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        for change in get_changes(event):
+            key = get_change_key(change)
+            if key is None:
+                self.flush()
+                deliver(self.observer, subject, change)
+            else:
+                self.on_value_change(key, subject, change)
+
+    def on_value_change(
+        self, key: tuple, subject: object, event: dict[str, Any] | ChangeEvent
+    ) -> None:
+        """Called for a change of a value.
+
+        Args:
+            key (tuple): key of the changed value
+            subject (object): the one who did the notification
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        raise NotImplementedError()
+
+    def flush(self) -> None:
+        """Deliver all pending changes now."""
+        with self.pending.lock:
+            changes = self.pending.pop_all()
+        for subject, event in changes:
+            deliver(self.observer, subject, event)
+
+    def get_interests(self) -> dict[str, Callable[[Any], bool]]:
+        """Telling a subject the interests of the observer the changes are delivered to."""
+        return self.observer.get_interests()
+
+    def get_count_pending(self) -> int:
+        """Get number of changes waiting for delivery."""
+        return len(self.pending.changes)
+
+    def get_count_keys(self) -> int:
+        """Get number of values the observer keeps a state for (e.g. a pending change)."""
+        return len(self.pending.changes)
+
+    def deliver_pending(self, key: tuple) -> None:
+        """Deliver pending change of a value (nothing when there is none).
+
+        Args:
+            key (tuple): key of the changed value
+        """
+        with self.pending.lock:
+            change = self.pending.changes.pop(key, None)
+        if change is not None:
+            deliver(self.observer, *change)
+
+
+class DebounceObserver(RateLimitedObserver):
+    """Delivering the change of a value when it hasn't changed for a quiet period."""
+
+    def __init__(self, observer: Observer, delay: float, scheduler: Scheduler = None):
+        """Initialize observer.
+
+        Args:
+            observer (Observer): the observer to deliver the changes to
+            delay (float): quiet period in seconds
+            scheduler (Scheduler): scheduler to use (default: the shared one)
+        """
+        super().__init__(observer)
+        self.__delay = delay
+        self.__scheduler = SCHEDULER if scheduler is None else scheduler
+        self.__deadlines: dict[tuple, float] = {}
+
+    def on_value_change(
+        self, key: tuple, subject: object, event: dict[str, Any] | ChangeEvent
+    ) -> None:
+        """Called for a change of a value (moving its delivery to the end of the quiet period).
+
+        Args:
+            key (tuple): key of the changed value
+            subject (object): the one who did the notification
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        deadline = self.__scheduler.clock() + self.__delay
+        with self.pending.lock:
+            self.__deadlines[key] = deadline
+            first = self.pending.add(key, subject, event)
+        if first:
+            self.__scheduler.call_at(deadline, lambda: self.__expire(key))
+
+    def __expire(self, key: tuple) -> None:
+        """Deliver change when the quiet period has passed (otherwise wait again)."""
+        with self.pending.lock:
+            deadline = self.__deadlines.pop(key, None)
+            if deadline is not None and deadline > self.__scheduler.clock():
+                self.__deadlines[key] = deadline
+                self.__scheduler.call_at(deadline, lambda: self.__expire(key))
+                return
+        self.deliver_pending(key)
+
+
+class ThrottleObserver(RateLimitedObserver):
+    """Delivering at most one change of a value per interval (the latest one)."""
+
+    def __init__(self, observer: Observer, interval: float, scheduler: Scheduler = None):
+        """Initialize observer.
+
+        Args:
+            observer (Observer): the observer to deliver the changes to
+            interval (float): minimum time in seconds between deliveries for a value
+            scheduler (Scheduler): scheduler to use (default: the shared one)
+        """
+        super().__init__(observer)
+        self.__interval = interval
+        self.__scheduler = SCHEDULER if scheduler is None else scheduler
+        self.__delivered: dict[tuple, float] = {}
+        self.__prune_size = MIN_PRUNE_SIZE
+
+    def on_value_change(
+        self, key: tuple, subject: object, event: dict[str, Any] | ChangeEvent
+    ) -> None:
+        """Called for a change of a value (delivered at once when the interval has passed).
+
+        Args:
+            key (tuple): key of the changed value
+            subject (object): the one who did the notification
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        now = self.__scheduler.clock()
+        with self.pending.lock:
+            if key in self.pending.changes:
+                self.pending.add(key, subject, event)
+                return
+
+            delivered = self.__delivered.get(key)
+            if delivered is not None and now - delivered < self.__interval:
+                self.pending.add(key, subject, event)
+                self.__scheduler.call_at(delivered + self.__interval, lambda: self.__expire(key))
+                return
+
+            self.__delivered[key] = now
+            if len(self.__delivered) > self.__prune_size:
+                self.__prune(now)
+        deliver(self.observer, subject, event)
+
+    def get_count_keys(self) -> int:
+        """Get number of values the observer keeps a state for (pending change or delivery time)."""
+        return len(self.__delivered.keys() | self.pending.changes.keys())
+
+    def __prune(self, now: float) -> None:
+        """Forget delivery times of values whose interval has passed (without pending change)."""
+        self.__delivered = {
+            key: delivered
+            for key, delivered in self.__delivered.items()
+            if now - delivered < self.__interval or key in self.pending.changes
+        }
+        self.__prune_size = max(MIN_PRUNE_SIZE, 2 * len(self.__delivered))
+
+    def __expire(self, key: tuple) -> None:
+        """Deliver pending change at the end of the interval."""
+        with self.pending.lock:
+            self.__delivered[key] = self.__scheduler.clock()
+        self.deliver_pending(key)
+
+
+class SamplingObserver(RateLimitedObserver):
+    """Delivering every n-th change of a value (the others are combined into it)."""
+
+    def __init__(self, observer: Observer, every: int):
+        """Initialize observer.
+
+        Args:
+            observer (Observer): the observer to deliver the changes to
+            every (int): number of changes of a value per delivery
+
+        Raises:
+            ValueError: when the number is not positive
+        """
+        if every <= 0:
+            raise ValueError("number of changes per delivery must be positive")
+
+        super().__init__(observer)
+        self.__every = every
+        self.__counts: dict[tuple, int] = {}
+
+    def on_value_change(
+        self, key: tuple, subject: object, event: dict[str, Any] | ChangeEvent
+    ) -> None:
+        """Called for a change of a value (delivered when it's the n-th one).
+
+        Args:
+            key (tuple): key of the changed value
+            subject (object): the one who did the notification
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        with self.pending.lock:
+            count = self.__counts.pop(key, 0) + 1
+            if count < self.__every:
+                self.__counts[key] = count
+            self.pending.add(key, subject, event)
+        if count == self.__every:
+            self.deliver_pending(key)
+
+    def flush(self) -> None:
+        """Deliver all pending changes now (counting the changes of each value from scratch)."""
+        with self.pending.lock:
+            self.__counts.clear()
+        super().flush()
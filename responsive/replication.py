@@ -0,0 +1,227 @@
+"""Module replication.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+from collections.abc import Callable
+from typing import Any
+
+from responsive.constants import Context, Operation
+from responsive.data import make_responsive, to_plain
+from responsive.event import ChangeEvent
+from responsive.observer import ChangeObserver, Observer, get_changes
+from responsive.subject import Subject
+from responsive.wrapper import DictWrapper, ListWrapper
+
+SNAPSHOT = 0
+"""Operation code of a message with the whole data."""
+
+
+def apply_change(data: object, message: tuple) -> None:
+    """Apply change message of a `ReplicationObserver` to responsive or plain data.
+
+    Args:
+        data (object): responsive data or plain data (dictionaries and lists)
+        message (tuple): message of a `ReplicationObserver` (not a snapshot)
+    """
+    _, operation, path, key, value, count = message
+    container = data
+    for name_or_index in path:
+        container = container[name_or_index]
+
+    if count is None:
+        __apply_single_change(container, Operation(operation), key, value)
+    elif isinstance(container, (DictWrapper, dict)):
+        __apply_keys(container, Operation(operation), value)
+    else:
+        __apply_range(container, Operation(operation), key, value, count)
+
+
+def __apply_single_change(container: object, operation: Operation, key: Any, value: Any) -> None:
+    """Apply one change to a dictionary, class or list."""
+    if operation == Operation.VALUE_REMOVED:
+        del container[key]
+    elif operation == Operation.VALUE_ADDED and isinstance(container, (ListWrapper, list)):
+        container.insert(key, value)
+    else:
+        container[key] = value
+
+
+def __apply_keys(container: DictWrapper | dict, operation: Operation, values: dict) -> None:
+    """Apply change of many keys to a dictionary or class."""
+    if operation == Operation.VALUE_REMOVED:
+        container.clear()
+    else:
+        container.update(values)
+
+
+def __apply_range(
+    container: ListWrapper | list, operation: Operation, start: int, values: list, count: int
+) -> None:
+    """Apply change of a range of values to a list."""
+    if operation == Operation.VALUE_ADDED and start == len(container):
+        container.extend(values)
+    elif operation == Operation.VALUE_ADDED:
+        container[start:start] = values
+    elif operation == Operation.VALUE_REMOVED:
+        stop = start + count
+        del container[start:stop]
+    else:
+        stop = start + count
+        container[start:stop] = values
+
+
+class ReplicationObserver(ChangeObserver):
+    """Sending the changes of a responsive object as compact messages.
+
+    A message is a tuple `(sequence, operation, path, key, value, count)` where
+    the operation is `SNAPSHOT` (value is the whole data) or the value of an
+    `Operation`, the path are the names and indices to get to the changed
+    dictionary, class or list and the key is the name or index of the changed
+    value. For a range of values of a list the key is the first index, the
+    count the number of values and the value a list; for many keys of a
+    dictionary (`update` and `clear`) the key is None, the count the number of
+    keys and the value a dictionary (otherwise the count is None). Removals
+    don't have a value. The function to send can be `send` of a
+    multiprocessing connection or `put` of a multiprocessing queue.
+    """
+
+    def __init__(self, root: Subject, send: Callable[[tuple], None]):
+        """Register at responsive object and send snapshot.
+
+        Args:
+            root (Subject): responsive object to replicate
+            send (Callable[[tuple], None]): function to send a message
+        """
+        super().__init__()
+        self.__root = root
+        self.__send = send
+        self.__sequence = 0
+        root.add_observer(self)
+        self.resync()
+
+    def resync(self) -> None:
+        """Send the whole data (e.g. when a follower has requested it)."""
+        self.__send_message(SNAPSHOT, (), None, to_plain(self.__root))
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when the responsive object has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        for change in get_changes(event):
+            # changes of data which has been removed meanwhile don't have a path
+            if change.get("path") is not None:
+                self.__send_change(change)
+
+    def __send_change(self, kwargs: dict[str, Any] | ChangeEvent) -> None:
+        """Send one change."""
+        operation = kwargs["operation"]
+        value = None if operation == Operation.VALUE_REMOVED else to_plain(kwargs["new"])
+        if "count" in kwargs and kwargs["context"] != Context.LIST:
+            path, key = kwargs["path"], None
+        else:
+            path, key = kwargs["path"][:-1], kwargs["path"][-1]
+        self.__send_message(operation.value, path, key, value, kwargs.get("count"))
+
+    def __send_message(
+        self, operation: int, path: tuple, key: Any, value: Any, count: int = None
+    ) -> None:
+        """Send one message."""
+        self.__sequence += 1
+        self.__send((self.__sequence, operation, path, key, value, count))
+
+
+class ReplicationFollower(Subject, Observer):
+    """Applying messages of a `ReplicationObserver` to a mirror of the responsive object.
+
+    The observers of the follower get the changes of the mirror. When a
+    snapshot is applied the mirror is replaced (notification with old and
+    new mirror). When a message is missing the follower ignores all changes
+    until the next snapshot.
+    """
+
+    def __init__(self, request_resync: Callable[[], None] = None):
+        """Initialize follower without data.
+
+        Args:
+            request_resync (Callable[[], None]): called when a message is missing
+        """
+        super().__init__()
+        self.__request_resync = request_resync
+        self.__sequence = None
+        self.__data = None
+
+    def get_data(self) -> object:
+        """Get mirror of the responsive object (None until first snapshot)."""
+        return self.__data
+
+    def is_in_sync(self) -> bool:
+        """Checking that no message has been missed since the last snapshot."""
+        return self.__sequence is not None
+
+    def apply(self, message: tuple) -> None:
+        """Apply message to the mirror.
+
+        Args:
+            message (tuple): message of a `ReplicationObserver`
+        """
+        sequence, operation, value = message[0], message[1], message[4]
+        if operation == SNAPSHOT:
+            old_data, self.__data = self.__data, make_responsive(value)
+            self.__data.add_observer(self)
+            self.__sequence = sequence
+            self.notify(old=old_data, new=self.__data, operation=Operation.VALUE_CHANGED)
+            return
+
+        if self.__sequence is None:
+            return
+
+        if sequence != self.__sequence + 1:
+            self.__sequence = None
+            if self.__request_resync is not None:
+                self.__request_resync()
+            return
+
+        self.__sequence = sequence
+        apply_change(self.__data, message)
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when the mirror has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        self.notify(*args, **kwargs)
+
+    def on_change(self, subject: object, event: ChangeEvent) -> None:
+        """Called when the mirror has been changed.
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+        """
+        self.notify_change(event)
@@ -0,0 +1,275 @@
+"""Module serialization.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from responsive.classify import get_fields, get_kind, is_value
+from responsive.constants import Context, Operation, ValueKind
+from responsive.event import ChangeEvent
+from responsive.observer import ChangeObserver, get_changes
+from responsive.wrapper import ListWrapper, Wrapper
+
+
+class ResponsiveJSONEncoder(json.JSONEncoder):
+    """JSON encoder for responsive data (encoding the wrapped data without copying it).
+
+    >>> from responsive.data import make_responsive
+    >>> json.dumps(make_responsive({"a": [1, {"b": None}]}), cls=ResponsiveJSONEncoder)
+    '{"a": [1, {"b": null}]}'
+    """
+
+    def default(self, o: Any) -> Any:
+        """Get wrapped dictionary or list of a wrapper (fields of a class as dictionary).
+
+        Args:
+            o (Any): value not being supported by the encoder
+
+        Returns:
+            value supported by the encoder.
+        """
+        if isinstance(o, Wrapper):
+            o = o.obj
+        kind = get_kind(o)
+        if kind is ValueKind.VALUE:
+            return super().default(o)
+        if kind is ValueKind.CLASS:
+            fields = get_fields(o)
+            return fields if isinstance(fields, dict) else dict(fields)
+        return o
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """Get JSON of responsive data (or plain data).
+
+    Args:
+        obj (Any): responsive data
+        **kwargs (Any): further arguments of `json.dumps`
+
+    Returns:
+        JSON text.
+    """
+    return json.dumps(obj, cls=ResponsiveJSONEncoder, **kwargs)
+
+
+ENCODER = ResponsiveJSONEncoder()
+"""Encoder for values of a dictionary or list without cached JSON."""
+
+CONSTANTS = {True: "true", False: "false", None: "null"}
+"""JSON of the constants."""
+
+
+def encode_key(key: Any) -> str:
+    """Get JSON of a key of a dictionary (as `json.dumps` does for keys which aren't strings).
+
+    Args:
+        key (Any): key of a dictionary
+
+    Returns:
+        JSON string.
+
+    Raises:
+        TypeError: when the key is not a string, a number, a boolean or None
+
+    >>> encode_key(1), encode_key(None)
+    ('"1"', '"null"')
+    """
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if key is None or isinstance(key, (int, float)):
+        return '"' + encode_value(key) + '"'
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def encode_value(value: Any) -> str:
+    """Get JSON of a value (not being a wrapper).
+
+    Args:
+        value (Any): value
+
+    Returns:
+        JSON text.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if value_type is bool or value is None:
+        return CONSTANTS[value]
+    return ENCODER.encode(value)
+
+
+def is_structural(event: dict[str, Any] | ChangeEvent) -> bool:
+    """Checking change to add, remove or move values (not only changing one value).
+
+    Args:
+        event (dict[str, Any] | ChangeEvent): the change
+
+    Returns:
+        true when the paths of other values may have changed.
+    """
+    return event.get("operation") != Operation.VALUE_CHANGED or "count" in event
+
+
+class JsonCache(ChangeObserver):
+    """JSON of responsive data caching the JSON of each nested dictionary, list and class.
+
+    A change invalidates the JSON of the changed dictionary, list or class and
+    of the ones above it (and of removed ones), so the JSON of a mostly
+    unchanged document is created by joining cached parts. The JSON is the
+    same as the one of `json.dumps` with default arguments.
+
+    >>> from responsive.data import make_responsive
+    >>> data = make_responsive({"a": [1, {"b": "x"}], "c": {"d": 2}})
+    >>> cache = JsonCache(data)
+    >>> cache.dumps()
+    '{"a": [1, {"b": "x"}], "c": {"d": 2}}'
+    >>> data.c.d = 3
+    >>> cache.dumps(), cache.get_count_cached()
+    ('{"a": [1, {"b": "x"}], "c": {"d": 3}}', 4)
+    """
+
+    def __init__(self, root: Wrapper):
+        """Register at responsive object.
+
+        Args:
+            root (Wrapper): responsive object (root)
+        """
+        super().__init__()
+        self.__root = root
+        self.__cache: dict[int, tuple[Wrapper, str]] = {}
+        root.add_observer(self)
+
+    def dumps(self, wrapper: Wrapper = None) -> str:
+        """Get JSON of the responsive data (or of a nested wrapper).
+
+        Args:
+            wrapper (Wrapper): nested wrapper (default: the root)
+
+        Returns:
+            JSON text.
+        """
+        wrapper = self.__root if wrapper is None else wrapper
+        cached = self.__cache.get(id(wrapper))
+        if cached is not None:
+            return cached[1]
+
+        if isinstance(wrapper, ListWrapper):
+            text = "[" + ", ".join(self.__encode(value) for value in wrapper.obj) + "]"
+        else:
+            the_dict = get_fields(wrapper.obj)
+            text = (
+                "{"
+                + ", ".join(
+                    encode_key(key) + ": " + self.__encode(value) for key, value in the_dict.items()
+                )
+                + "}"
+            )
+        self.__cache[id(wrapper)] = (wrapper, text)
+        return text
+
+    def get_count_cached(self) -> int:
+        """Get number of dictionaries, lists and classes with cached JSON."""
+        return len(self.__cache)
+
+    def clear(self) -> None:
+        """Forget all cached JSON."""
+        self.__cache.clear()
+
+    def close(self) -> None:
+        """Stop observing the responsive object (forgetting all cached JSON)."""
+        self.__root.remove_observer(self)
+        self.clear()
+
+    def on_change(self, subject: object, event: dict[str, Any] | ChangeEvent) -> None:
+        """Called when the responsive object has been changed (invalidating cached JSON).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (dict[str, Any] | ChangeEvent): the change
+        """
+        if len(self.__cache) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        changes = get_changes(event)
+        if len(changes) > 1 and any(
+            is_structural(change) or not is_value(change.get("old")) for change in changes
+        ):
+            # the paths are the ones at the time of each change: a later change of the
+            # batch may have shifted them, so they can't be followed in the current data;
+            # removed dictionaries, lists and classes are copies (see `get_snapshot`)
+            self.__cache.clear()
+            return
+        for change in changes:
+            self.__invalidate(change)
+
+    def __encode(self, value: Any) -> str:
+        """Get JSON of a value of a dictionary or list."""
+        if isinstance(value, Wrapper):
+            return self.dumps(value)
+        return encode_value(value)
+
+    def __invalidate(self, event: dict[str, Any] | ChangeEvent) -> None:
+        """Forget JSON of the changed wrapper, the ones above and the removed ones."""
+        path = event.get("path")
+        if path is None:
+            self.__cache.clear()
+            return
+
+        self.__cache.pop(event.get("id"), None)
+        try:
+            if "count" in event and event["context"] != Context.LIST:
+                self.__invalidate_path(path)
+            else:
+                self.__invalidate_path(path[:-1])
+        except (KeyError, IndexError):
+            # the path has been changed by a later change of the same batch
+            self.__cache.clear()
+            return
+
+        old = event.get("old")
+        if isinstance(old, list) or ("count" in event and isinstance(old, dict)):
+            self.__forget(old.values() if isinstance(old, dict) else old)
+        else:
+            self.__forget((old,))
+
+    def __invalidate_path(self, path: tuple) -> None:
+        """Forget JSON of the wrappers from the root along the path."""
+        container = self.__root
+        for key in path:
+            self.__cache.pop(id(container), None)
+            the_data = container.obj
+            container = (the_data if isinstance(the_data, list) else get_fields(the_data))[key]
+            if not isinstance(container, Wrapper):
+                return
+        self.__cache.pop(id(container), None)
+
+    def __forget(self, values) -> None:
+        """Forget JSON of removed wrappers (and of their nested ones)."""
+        for value in values:
+            if isinstance(value, Wrapper):
+                self.__cache.pop(id(value), None)
+                self.__forget(value.get_nested_wrappers())
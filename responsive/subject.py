@@ -24,17 +24,475 @@
     THE SOFTWARE.
 """
 # pylint: disable=too-few-public-methods
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
-from responsive.observer import Observer
+from responsive.classify import is_value
+from responsive.constants import Context, Operation
+from responsive.event import ChangeEvent
+from responsive.observer import Observer, get_changes
+from responsive.path import PathTrie, parse_pattern
+
+
+def get_change_key(kwargs: dict[str, Any]) -> tuple | None:
+    """Get key identifying the changed value of a notification (object id and name or index).
+
+    Args:
+        kwargs (dict[str, Any]): key/value arguments of a notification
+
+    Returns:
+        key for a changed value otherwise None (the change can't be coalesced).
+
+    A change of a range of values (`count` is given) is never coalesced.
+
+    Example:
+
+        >>> get_change_key({"id": 1, "name": "a", "operation": Operation.VALUE_CHANGED})
+        (1, 'a')
+        >>> get_change_key({"id": 1, "new": 2, "operation": Operation.VALUE_ADDED}) is None
+        True
+    """
+    if kwargs.get("operation") != Operation.VALUE_CHANGED or "count" in kwargs:
+        return None
+    if "name" in kwargs:
+        return kwargs.get("id"), kwargs["name"]
+    if "index" in kwargs:
+        return kwargs.get("id"), kwargs["index"]
+    return None
+
+
+def is_shifting(kwargs: dict[str, Any] | ChangeEvent) -> bool:
+    """Checking change of a list to change the values from its index on.
+
+    Args:
+        kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+
+    Returns:
+        true for a range of values and for adding or removing a value of a list.
+    """
+    return kwargs.get("context") == Context.LIST and (
+        "count" in kwargs or kwargs.get("operation") != Operation.VALUE_CHANGED
+    )
+
+
+def get_snapshot(kwargs: dict[str, Any] | ChangeEvent) -> dict[str, Any] | ChangeEvent:
+    """Get change with copies of the old and new dictionaries, lists and classes.
+
+    A change delivered later (batch or queue) refers to the containers of the
+    data otherwise: a later change of them would be visible in the change.
+
+    Args:
+        kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+
+    Returns:
+        the change itself when old and new are values (otherwise a copy, see `to_plain`).
+    """
+    names = [name for name in ("old", "new") if name in kwargs and not is_value(kwargs[name])]
+    if len(names) == 0:  # pylint: disable=compare-to-zero
+        return kwargs
+
+    from responsive import data  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    values = {name: data.to_plain(kwargs[name]) for name in names}
+    if isinstance(kwargs, ChangeEvent):
+        return kwargs.replace(**values)
+    return {**kwargs, **values}
+
+
+MAX_OBSERVERS_IN_TUPLE = 8
+"""Number of observers (without interests) a subject keeps in a tuple."""
+
+
+class ChangeQueue:
+    """Queue of notifications coalescing changes of same value (last write wins).
+
+    A change of the structure (a value added or removed, a range of values
+    changed or a nested dictionary, list or class replaced) starts a new
+    epoch: changes are coalesced within an epoch only, so no change is moved
+    before or after a change of the structure (which could change its path).
+    The old and new dictionaries, lists and classes of a change of the
+    structure are copied (see `get_snapshot`).
+    """
+
+    def __init__(self, coalesce: bool = True):
+        """Initialize empty queue.
+
+        Args:
+            coalesce (bool): when false each notification is kept
+        """
+        self.coalesce = coalesce
+        self.events: dict[tuple, dict[str, Any]] = {}
+        self.epoch = 0
+        self.counter = 0
+
+    def __len__(self) -> int:
+        """Get number of queued notifications."""
+        return len(self.events)
+
+    def add(self, kwargs: dict[str, Any] | ChangeEvent) -> None:
+        """Adding notification; a change of same value replaces the previous one.
+
+        Args:
+            kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+        """
+        key = self.__get_key(kwargs)
+        if key is None:
+            self.epoch += 1
+            self.events[self.counter, None] = get_snapshot(kwargs)
+            self.counter += 1
+            return
+
+        previous = self.events.get(key)
+        self.events[key] = kwargs if previous is None else self.__merge(previous, kwargs)
+
+    def replace(self, kwargs: dict[str, Any] | ChangeEvent) -> bool:
+        """Replacing the last queued change of same value (coalescing on demand).
+
+        A change is never moved before a change of the structure (see `add`).
+
+        Args:
+            kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+
+        Returns:
+            true when the change has replaced a queued one (false when it has to be added).
+        """
+        key = self.__get_value_key(kwargs)
+        if key is None:
+            return False
+
+        for queued_key, queued in reversed(self.events.items()):
+            queued_change_key = self.__get_value_key(queued)
+            if queued_change_key is None:
+                return False
+            if queued_change_key == key:
+                self.events[queued_key] = self.__merge(queued, kwargs)
+                return True
+        return False
+
+    def __get_key(self, kwargs: dict[str, Any] | ChangeEvent) -> tuple | None:
+        """Get key of a change that can be coalesced in the current epoch (otherwise None)."""
+        if not self.coalesce:
+            return None
+        key = self.__get_value_key(kwargs)
+        return None if key is None else (self.epoch,) + key
+
+    @staticmethod
+    def __get_value_key(kwargs: dict[str, Any] | ChangeEvent) -> tuple | None:
+        """Get key of a change of a value that can be coalesced (otherwise None)."""
+        key = get_change_key(kwargs)
+        if key is None or not (is_value(kwargs.get("old")) and is_value(kwargs.get("new"))):
+            return None
+        return key
+
+    @staticmethod
+    def __merge(
+        previous: dict[str, Any] | ChangeEvent, kwargs: dict[str, Any] | ChangeEvent
+    ) -> dict[str, Any] | ChangeEvent:
+        """Get change replacing a previous one of same value (keeping its old value)."""
+        if "old" not in previous:
+            return kwargs
+        if isinstance(kwargs, ChangeEvent):
+            return kwargs.replace(old=previous["old"])
+        return {**kwargs, "old": previous["old"]}
+
+    def pop(self) -> dict[str, Any] | ChangeEvent:
+        """Removing oldest notification.
+
+        Returns:
+            key/value arguments of the oldest notification (or the change).
+        """
+        return self.events.pop(next(iter(self.events)))
+
+    def take(self) -> list[dict[str, Any] | ChangeEvent]:
+        """Get queued notifications (in order of first change) and reset the queue.
+
+        Returns:
+            list of key/value arguments of the queued notifications (or the changes).
+        """
+        events = list(self.events.values())
+        self.events.clear()
+        self.epoch += 1
+        return events
+
+
+class Batch(ChangeQueue):
+    """Notifications collected while a batch is open (see `Subject.batch`).
+
+    A batch with one notification only provides it as it is (not a copy):
+    there hasn't been a later change.
+    """
+
+    def __init__(self):
+        """Initialize closed batch without notifications."""
+        super().__init__()
+        self.depth = 0
+        self.first: dict[str, Any] | ChangeEvent | None = None
+        self.count_added = 0
+
+    def add(self, kwargs: dict[str, Any] | ChangeEvent) -> None:
+        """Adding notification; a change of same value replaces the previous one.
+
+        Args:
+            kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+        """
+        if self.count_added == 0:  # pylint: disable=compare-to-zero
+            self.first = kwargs
+        self.count_added += 1
+        super().add(kwargs)
+
+    def take(self) -> list[dict[str, Any] | ChangeEvent]:
+        """Get queued notifications (in order of first change) and reset the batch.
+
+        Returns:
+            list of key/value arguments of the queued notifications (or the changes).
+        """
+        events = super().take()
+        if self.count_added == 1:
+            events = [self.first]
+        self.first = None
+        self.count_added = 0
+        return events
+
+
+class ObserverRegistry:
+    """Observers of a subject with their interests compiled into an index by name.
+
+    Observers are kept by identity in order of registration (adding, removing
+    and checking an observer is O(1) and never compares observers by `__eq__`).
+    Observers without interests are kept in a wildcard bucket; all others are
+    registered for each name of their interests so a notification does touch
+    the observers only which could be interested in it. An interest being a
+    value instead of a function is matched by equality using a hashed lookup.
+    Observers registered for path patterns are kept in a `PathTrie` matched
+    with the path of a change.
+    """
+
+    __slots__ = (
+        "observers",
+        "wildcard",
+        "index",
+        "values",
+        "value_keys",
+        "compiled",
+        "snapshot",
+        "paths",
+        "counter",
+    )
+
+    def __init__(self, observers: tuple[Observer, ...] = ()):
+        """Initialize registry.
+
+        Args:
+            observers (tuple[Observer, ...]): initial observers
+        """
+        self.observers: dict[int, tuple[int, Observer]] = {}
+        self.wildcard: dict[int, Observer] = {}
+        self.index: dict[str, dict[int, tuple[Observer, Callable[[Any], bool]]]] = {}
+        self.values: dict[tuple[str, Any], dict[int, Observer]] = {}
+        self.value_keys: dict[str, int] = {}
+        self.compiled: dict[int, tuple[list[str], list[tuple[str, Any]]]] = {}
+        self.snapshot: tuple[Observer, ...] | None = None
+        self.paths: PathTrie | None = None
+        self.counter = 0
+        for observer in observers:
+            self.add(observer)
+
+    def __contains__(self, observer: Observer) -> bool:
+        """Checking observer to be registered.
+
+        Args:
+            observer (Observer): observer to check.
+
+        Returns:
+            true when the observer is registered.
+        """
+        return id(observer) in self.observers
+
+    def __len__(self) -> int:
+        """Get number of registered observers."""
+        return len(self.observers)
+
+    def add(self, observer: Observer) -> None:
+        """Adding observer (once only) compiling its interests.
+
+        Args:
+            observer (Observer): object that will be notified.
+        """
+        if id(observer) in self.observers:
+            return
+
+        self.observers[id(observer)] = (self.counter, observer)
+        self.__compile(self.counter, observer)
+        self.counter += 1
+
+    def remove(self, observer: Observer) -> None:
+        """Removing observer.
+
+        Args:
+            observer (Observer): object that don't want to get updated anymore.
+
+        Raises:
+            ValueError: when the observer is not registered.
+        """
+        entry = self.observers.pop(id(observer), None)
+        if entry is None:
+            raise ValueError("observer is not registered")
+
+        self.__discard(entry[0])
+
+    def add_path(self, pattern: str | tuple, observer: Observer) -> None:
+        """Adding observer for changes at paths matching a pattern (once only).
+
+        Args:
+            pattern (str | tuple): path pattern (see `responsive.path.parse_pattern`)
+            observer (Observer): object that will be notified.
+        """
+        if self.paths is None:
+            self.paths = PathTrie()
+
+        self.paths.add(parse_pattern(pattern), self.counter, observer)
+        self.counter += 1
+
+    def remove_path(self, pattern: str | tuple, observer: Observer) -> None:
+        """Removing observer for a path pattern.
+
+        Args:
+            pattern (str | tuple): path pattern (see `responsive.path.parse_pattern`)
+            observer (Observer): object that don't want to get updated anymore.
+
+        Raises:
+            ValueError: when the observer is not registered for the pattern.
+        """
+        if self.paths is None:
+            raise ValueError("observer is not registered for the pattern")
+
+        self.paths.remove(parse_pattern(pattern), observer)
+        if len(self.paths) == 0:  # pylint: disable=compare-to-zero
+            self.paths = None
+
+    def refresh(self, observer: Observer = None) -> None:
+        """Compiling interests again (all observers or the given one only).
+
+        Args:
+            observer (Observer): observer with changed interests (default: all observers)
+        """
+        for position, registered in list(self.observers.values()):
+            if observer is None or registered is observer:
+                self.__discard(position)
+                self.__compile(position, registered)
+
+        self.wildcard = dict(sorted(self.wildcard.items()))
+
+    def select(self, kwargs: dict[str, Any] | ChangeEvent) -> list[Observer] | tuple[Observer, ...]:
+        """Get observers interested in given notification (in order of registration).
+
+        The result is a snapshot; observers removed while the notification is
+        delivered still get it, observers added meanwhile get the next one.
+
+        Args:
+            kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+
+        Returns:
+            interested observers.
+        """
+        if (
+            len(self.index) == 0  # pylint: disable=compare-to-zero
+            and len(self.value_keys) == 0  # pylint: disable=compare-to-zero
+            and self.paths is None
+        ):
+            return self.__get_wildcard_snapshot()
+
+        matched = {}
+        for event in get_changes(kwargs):
+            self.__match(event, matched)
+
+        if len(matched) == 0:  # pylint: disable=compare-to-zero
+            return self.__get_wildcard_snapshot()
+
+        matched.update(self.wildcard)
+        return [matched[position] for position in sorted(matched)]
+
+    def __match(self, event: dict[str, Any] | ChangeEvent, matched: dict[int, Observer]) -> None:
+        """Add observers interested in one notification or change."""
+        for key, value in event.items():
+            if key in self.index:
+                for position, (observer, is_relevant) in self.index[key].items():
+                    if position not in matched and is_relevant(value):
+                        matched[position] = observer
+            if key in self.value_keys:
+                matched.update(self.__get_value_bucket(key, value))
+
+        if self.paths is not None and event.get("path") is not None:
+            matched.update(self.paths.match(event["path"], is_shifting(event)))
+
+    def __get_wildcard_snapshot(self) -> tuple[Observer, ...]:
+        """Get observers without interests."""
+        if self.snapshot is None:
+            self.snapshot = tuple(self.wildcard.values())
+        return self.snapshot
+
+    def __compile(self, position: int, observer: Observer) -> None:
+        """Adding observer to the wildcard bucket or to the index."""
+        interests = observer.get_interests()
+        if len(interests) == 0:  # pylint: disable=compare-to-zero
+            self.wildcard[position] = observer
+            self.snapshot = None
+            return
+
+        names, values = [], []
+        for name, interest in interests.items():
+            if callable(interest):
+                self.index.setdefault(name, {})[position] = (observer, interest)
+                names.append(name)
+            else:
+                self.values.setdefault((name, interest), {})[position] = observer
+                self.value_keys[name] = self.value_keys.get(name, 0) + 1
+                values.append((name, interest))
+        self.compiled[position] = (names, values)
+
+    def __discard(self, position: int) -> None:
+        """Removing observer from the wildcard bucket or from the index."""
+        if self.wildcard.pop(position, None) is not None:
+            self.snapshot = None
+            return
+
+        names, values = self.compiled.pop(position)
+        for name in names:
+            del self.index[name][position]
+            if len(self.index[name]) == 0:  # pylint: disable=compare-to-zero
+                del self.index[name]
+
+        for name, value in values:
+            del self.values[name, value][position]
+            if len(self.values[name, value]) == 0:  # pylint: disable=compare-to-zero
+                del self.values[name, value]
+            self.value_keys[name] -= 1
+            if self.value_keys[name] == 0:  # pylint: disable=compare-to-zero
+                del self.value_keys[name]
+
+    def __get_value_bucket(self, key: str, value: Any) -> dict[int, Observer]:
+        """Get observers interested in given value by equality."""
+        try:
+            return self.values.get((key, value), {})
+        except TypeError:  # value is not hashable
+            return {}
 
 
 class Subject:
-    """Subject from the subject/observer pattern."""
+    """Subject from the subject/observer pattern.
+
+    The observers are stored when the first one is added; as long as there are
+    a few observers without interests only they are kept in a tuple, otherwise
+    in an `ObserverRegistry`.
+    """
+
+    __slots__ = ("__observers", "__batch")
 
     def __init__(self):
-        """Initialize empty list of observers."""
-        self.__observers: list[Observer] = []
+        """Initialize subject without observers."""
+        self.__observers: tuple[Observer, ...] | ObserverRegistry | None = None
+        self.__batch: Batch | None = None
 
     def notify(self, *args: Any, **kwargs: Any):
         """Updating all observers.
@@ -43,29 +501,192 @@ class Subject:
             *args (Any): optional positional arguments
             **kwargs (Any): optional key/value arguments
         """
-        for observer in self.__observers:
-            interests = observer.get_interests()
-            if len(interests) == 0:  # pylint: disable=compare-to-zero
-                observer.update(self, *args, **kwargs)
-            else:
-                for key, value in kwargs.items():
-                    if key in interests and interests[key](value):
-                        observer.update(self, *args, **kwargs)
-                        break
+        if self.__batch is not None and len(args) == 0:  # pylint: disable=compare-to-zero
+            self.__batch.add(kwargs)
+            return
+
+        self.dispatch(*args, **kwargs)
+
+    def notify_change(self, event: ChangeEvent) -> None:
+        """Updating all observers with a change (event is passed by reference).
+
+        Args:
+            event (ChangeEvent): the change
+        """
+        if self.__batch is not None:
+            self.__batch.add(event)
+            return
+
+        self.dispatch_change(event)
+
+    def dispatch(self, *args: Any, **kwargs: Any):
+        """Delivering notification to the interested observers (not deferred by a batch).
+
+        Args:
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        for observer in self.get_interested_observers(kwargs):
+            observer.on_notify(self, *args, **kwargs)
+
+    def dispatch_change(self, event: ChangeEvent) -> None:
+        """Delivering change to the interested observers (not deferred by a batch).
+
+        Args:
+            event (ChangeEvent): the change
+        """
+        for observer in self.get_interested_observers(event):
+            observer.on_change(self, event)
+
+    def get_interested_observers(
+        self, kwargs: dict[str, Any] | ChangeEvent
+    ) -> list[Observer] | tuple[Observer, ...]:
+        """Get observers interested in given notification (in order of registration).
+
+        Args:
+            kwargs (dict[str, Any] | ChangeEvent): key/value arguments of a notification or change
+
+        Returns:
+            interested observers.
+        """
+        observers = self.__observers
+        if observers is None:
+            return ()
+        if isinstance(observers, tuple):
+            return observers
+        return observers.select(kwargs)
+
+    @contextmanager
+    def batch(self) -> Iterator["Subject"]:
+        """Defer notifications until the (outermost) batch is closed.
+
+        Repeated changes of the same value are coalesced into one notification
+        (first old value, last new value). When more than one notification
+        has been collected the observers get one notification with
+        `operation=Operation.BATCH` and `events` (list of the collected changes
+        and key/value arguments of notifications in order). Notifications with
+        positional arguments are not deferred.
+
+        Yields:
+            the subject itself.
+        """
+        if self.__batch is None:
+            self.__batch = Batch()
+
+        self.__batch.depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch.depth -= 1
+            if self.__batch.depth == 0:  # pylint: disable=compare-to-zero
+                events = self.__batch.take()
+                self.__batch = None
+                if len(events) > 1:
+                    self.dispatch_change(ChangeEvent(operation=Operation.BATCH, events=events))
+                elif len(events) == 1 and isinstance(events[0], ChangeEvent):
+                    self.dispatch_change(events[0])
+                elif len(events) == 1:
+                    self.dispatch(**events[0])
 
     def add_observer(self, observer: Observer) -> None:
-        """Adding observer to list.
+        """Adding observer; its interests are read once here (see `refresh_interests`).
 
         Args:
             observer (obj): object that will be notified.
         """
-        if observer not in self.__observers:
-            self.__observers.append(observer)
+        observers = self.__observers
+        if isinstance(observers, ObserverRegistry):
+            observers.add(observer)
+            return
+
+        observers = () if observers is None else observers
+        if any(registered is observer for registered in observers):
+            return
+
+        observers += (observer,)
+        if len(observers) <= MAX_OBSERVERS_IN_TUPLE and len(observer.get_interests()) == 0:
+            self.__observers = observers
+        else:
+            self.__observers = ObserverRegistry(observers)
 
     def remove_observer(self, observer: Observer) -> None:
         """Remove observer from list.
 
         Args:
             observer (obj): object that don't want to get updated anymore.
+
+        Raises:
+            ValueError: when the observer is not registered.
+        """
+        observers = self.__observers
+        if isinstance(observers, ObserverRegistry):
+            observers.remove(observer)
+            return
+
+        if not self.has_observer(observer):
+            raise ValueError("observer is not registered")
+
+        observers = tuple(registered for registered in observers if registered is not observer)
+        self.__observers = observers if len(observers) > 0 else None
+
+    def add_path_observer(self, pattern: str | tuple, observer: Observer) -> None:
+        """Adding observer for changes at paths matching a pattern.
+
+        The observer gets the changes with a path matching the pattern (or a
+        path above it, since replacing a dictionary or a list changes all values
+        below). Examples of patterns: `orders[3].status` (exactly this value),
+        `orders[*].status` (the status of any order) and `orders.**` (any change
+        of the orders). See `responsive.path.parse_pattern`.
+
+        Args:
+            pattern (str | tuple): path pattern as text or as tuple of names and indices
+            observer (Observer): object that will be notified.
+        """
+        observers = self.__observers
+        if not isinstance(observers, ObserverRegistry):
+            observers = ObserverRegistry(() if observers is None else observers)
+            self.__observers = observers
+        observers.add_path(pattern, observer)
+
+    def remove_path_observer(self, pattern: str | tuple, observer: Observer) -> None:
+        """Removing observer for changes at paths matching a pattern.
+
+        Args:
+            pattern (str | tuple): path pattern as given when adding the observer
+            observer (Observer): object that don't want to get updated anymore.
+
+        Raises:
+            ValueError: when the observer is not registered for the pattern.
+        """
+        observers = self.__observers
+        if not isinstance(observers, ObserverRegistry):
+            raise ValueError("observer is not registered for the pattern")
+        observers.remove_path(pattern, observer)
+
+    def has_observer(self, observer: Observer) -> bool:
+        """Checking observer to be registered.
+
+        Args:
+            observer (obj): observer to check.
+
+        Returns:
+            true when the observer is registered.
+        """
+        observers = self.__observers
+        if isinstance(observers, ObserverRegistry):
+            return observer in observers
+        return observers is not None and any(registered is observer for registered in observers)
+
+    def refresh_interests(self, observer: Observer = None) -> None:
+        """Read interests again after they have been changed for a registered observer.
+
+        Args:
+            observer (obj): observer with changed interests (default: all observers)
         """
-        self.__observers.remove(observer)
+        observers = self.__observers
+        if isinstance(observers, ObserverRegistry):
+            observers.refresh(observer)
+        elif observers is not None and any(
+            len(registered.get_interests()) > 0 for registered in observers
+        ):
+            self.__observers = ObserverRegistry(observers)
@@ -22,28 +22,266 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
+from collections.abc import Iterable, Iterator, MutableMapping, MutableSequence
+from types import MemberDescriptorType
 from typing import Any
 
+from responsive.classify import VALUE_TYPES, get_fields
 from responsive.constants import Context, Operation
+from responsive.event import UNSET, ChangeEvent
 from responsive.observer import Observer
 from responsive.subject import Subject
 
+READS: list[set] = []
+"""Stack of sets collecting reads `(id(wrapper), key)` while computing a value.
 
-class DictWrapper(Subject, Observer):
-    """Wrapper for a dictionary object."""
+The key is UNSET for reading a list or the keys of a dictionary (see
+`responsive.computed.Computed`).
+"""
+
+
+def make_responsive(value: Any, parent: "Wrapper", key: Any) -> Any:
+    """Make value of a wrapper responsive (see `responsive.data.make_responsive`).
+
+    Args:
+        value (Any): the value to make responsive
+        parent (Wrapper): the wrapper getting the value (providing root and options)
+        key (Any): name or index of the value
+
+    A wrapper being its own root (e.g. a removed value) is attached to the
+    parent; a wrapper of other responsive data is copied (see `to_plain`).
+
+    Returns:
+        responsive value (unchanged when it is not a dictionary, a list or a class).
+    """
+    if type(value) in VALUE_TYPES:
+        return value
+
+    from responsive import data  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    if isinstance(value, Wrapper):
+        if value.get_root() is value and value is not parent.get_root():
+            value.attach(parent, key)
+            return value
+        value = data.to_plain(value)
+
+    options = parent.options
+    wrapped_value = data.make_responsive(
+        value,
+        root=parent.get_root(),
+        lazy=options.lazy,
+        reconcile=options.reconcile,
+        proxy=options.proxy,
+    )
+    if wrapped_value is not value:
+        wrapped_value.set_parent(parent, key)
+    return wrapped_value
+
+
+def make_responsive_all(values: list, parent: "Wrapper", start: int) -> list:
+    """Make values of a list wrapper responsive (see `responsive.data.make_responsive`).
+
+    Args:
+        values (list): the values to make responsive
+        parent (Wrapper): the list wrapper getting the values
+        start (int): index of the first value
+
+    Returns:
+        list of responsive values.
+    """
+    return [make_responsive(value, parent, start + offset) for offset, value in enumerate(values)]
+
+
+def wrap_on_access(wrapper: "Wrapper", container: object, key: Any) -> Any:
+    """Get value from container wrapping it when it hasn't been wrapped yet (lazy mode).
+
+    Args:
+        wrapper (Wrapper): the wrapper owning the container
+        container (object): the wrapped dictionary (or class dictionary) or list
+        key (Any): name or index of the value
+
+    Returns:
+        value (wrapped when it is a dictionary, a list or a class).
+    """
+    value = container[key]
+    if isinstance(value, Wrapper):
+        return value
+
+    wrapped_value = make_responsive(value, wrapper, key)
+    if wrapped_value is not value:
+        container[key] = wrapped_value
+    return wrapped_value
+
+
+def assign_in_place(wrapper: "Wrapper", container: object, key: Any, value: Any) -> bool:
+    """Assign value to an existing one without replacing it when possible.
+
+    Nothing happens when the value is equal to the existing one (same type); a
+    nested dictionary, list or class of the same type is changed in place
+    reusing its wrapper (see `assign`).
+
+    Args:
+        wrapper (Wrapper): the wrapper owning the container
+        container (object): the wrapped dictionary (or class dictionary) or list
+        key (Any): name or index of the existing value
+        value (Any): new value
+
+    Returns:
+        true when the value has been assigned, false when it has to be replaced.
+    """
+    old_value = container[key]
+    if is_same(old_value, value):
+        return True
+
+    if not isinstance(old_value, Wrapper) and wrapper.options.lazy:
+        old_value = wrap_on_access(wrapper, container, key)
+
+    if isinstance(old_value, ListWrapper) and isinstance(value, list):
+        old_value.assign(value)
+        return True
+
+    if isinstance(old_value, DictWrapper) and type(old_value.obj) is type(value):
+        old_value.assign(value)
+        return True
+
+    return False
+
+
+def is_same(old_value: Any, value: Any) -> bool:
+    """Checking existing value (maybe wrapped) to be equal to a value of the same type.
+
+    Nested values of dictionaries and lists are compared with `==` only.
+
+    Args:
+        old_value (Any): existing value (maybe a wrapper)
+        value (Any): new value
+
+    Returns:
+        true when the same.
+    """
+    plain_old_value = old_value.obj if isinstance(old_value, Wrapper) else old_value
+    return type(plain_old_value) is type(value) and old_value == value
+
+
+def detach_all(values: Iterable) -> None:
+    """Detach the wrappers among replaced or removed values (see `Wrapper.detach`).
+
+    Args:
+        values (Iterable): the replaced or removed values
+    """
+    for value in values:
+        if isinstance(value, Wrapper):
+            value.detach()
+
+
+def change_root(wrapper: "Wrapper", old_root: Subject, new_root: Subject) -> None:
+    """Let a wrapper notify a new root instead of the old one (also the nested wrappers).
+
+    Args:
+        wrapper (Wrapper): the wrapper
+        old_root (Subject): root notified so far
+        new_root (Subject): root to notify
+    """
+    if wrapper.has_observer(old_root):
+        wrapper.remove_observer(old_root)
+    object.__setattr__(wrapper, "root", new_root)
+    wrapper.add_observer(new_root)
+    for nested_wrapper in wrapper.get_nested_wrappers():
+        change_root(nested_wrapper, old_root, new_root)
+
+
+class Options:
+    """Options of responsive data (shared by all of its wrappers, see `get_options`)."""
+
+    __slots__ = ("lazy", "reconcile", "proxy")
+
+    def __init__(self, lazy: bool, reconcile: bool, proxy: bool):
+        """Initialize options.
+
+        Args:
+            lazy (bool): when true nested containers are wrapped on first access only
+            reconcile (bool): when true assigning a dictionary, list or class changes
+                              the existing one in place (see `assign`)
+            proxy (bool): when true nested classes are wrapped by a proxy class with
+                          the fields as attributes (see `responsive.proxy`)
+        """
+        self.lazy = lazy
+        self.reconcile = reconcile
+        self.proxy = proxy
+
+
+OPTIONS: dict[tuple[bool, bool, bool], Options] = {}
+"""Options for each combination of the flags (one instance shared by the wrappers)."""
+
+
+def get_options(lazy: bool = False, reconcile: bool = False, proxy: bool = False) -> Options:
+    """Get options of responsive data (created once for each combination of the flags).
+
+    Args:
+        lazy (bool): when true nested containers are wrapped on first access only
+        reconcile (bool): when true assigning a dictionary, list or class changes
+                          the existing one in place (see `assign`)
+        proxy (bool): when true nested classes are wrapped by a proxy class with
+                      the fields as attributes (see `responsive.proxy`)
+
+    Returns:
+        the options.
+
+    >>> get_options(lazy=True) is get_options(True, False, False)
+    True
+    """
+    key = (bool(lazy), bool(reconcile), bool(proxy))
+    options = OPTIONS.get(key)
+    if options is None:
+        options = OPTIONS[key] = Options(*key)
+    return options
+
+
+class Wrapper(Subject, Observer):
+    """Base class of the wrappers (no instance dictionary, observers allocated on demand).
 
-    def __init__(self, obj: object, make_responsive: callable, root: Subject = None):
+    A nested wrapper knows its parent wrapper and its name or index there, so
+    the path from the root is computed on demand. The path is cached until the
+    structure of any responsive data changes (values of a list are shifted or a
+    nested dictionary, list or class is replaced or removed).
+    """
+
+    __slots__ = ("obj", "root", "options", "__parent", "__key", "__path")
+
+    obj: Any
+    root: Subject | None
+    options: Options
+
+    __version = 0
+
+    def __init__(
+        self,
+        obj: object,
+        *,
+        root: Subject = None,
+        parent: "Wrapper" = None,
+        key: Any = None,
+        options: Options = None,
+    ):
         """Initialize wrapper.
 
         Args:
             obj (objec): object to wrap.
-            make_responsive (callable): function to make responsive
             root (Subject): root object receiving notifications
+            parent (Wrapper): wrapper containing this one (None for the root)
+            key (Any): name or index of this wrapper in the parent
+            options (Options): options shared with the other wrappers of the data
+                               (default: no option set, see `get_options`)
         """
         super().__init__()
-        self.make_responsive = make_responsive
-        self.root = root
-        self.obj = obj
+        # attributes of the wrapper are written with object.__setattr__ because
+        # a dictionary wrapper writes any other attribute to the wrapped data
+        object.__setattr__(self, "root", root)
+        object.__setattr__(self, "options", get_options() if options is None else options)
+        object.__setattr__(self, "obj", obj)
+        self.__parent = parent
+        self.__key = key
+        self.__path = None
 
     def __repr__(self) -> str:
         """Get string representation of wrapped data.
@@ -53,42 +291,165 @@ class DictWrapper(Subject, Observer):
         """
         return f"{self.obj}"
 
+    def __len__(self):
+        """Get number of values."""
+        if READS:
+            READS[-1].add((id(self), UNSET))
+        return len(self.obj)
+
+    def get_root(self) -> Subject:
+        """Get root object receiving the notifications of nested data."""
+        return self.root if self.root is not None else self
+
+    def get_parent(self) -> "Wrapper":
+        """Get wrapper containing this one (None for the root)."""
+        return self.__parent
+
+    def set_parent(self, parent: "Wrapper", key: Any) -> None:
+        """Change wrapper containing this one.
+
+        Args:
+            parent (Wrapper): wrapper containing this one
+            key (Any): name or index of this wrapper in the parent
+        """
+        self.__parent = parent
+        self.__key = key
+        self.__path = None
+
+    def detach(self) -> None:
+        """Detach wrapper from its parent and root (when it has been replaced or removed).
+
+        The wrapper becomes a responsive object of its own: nested wrappers
+        notify it instead of the former root, the paths start here and holding
+        the wrapper doesn't keep the former data alive (and vice versa).
+        """
+        root = self.get_root()
+        if root is self:
+            return
+
+        if self.has_observer(root):
+            self.remove_observer(root)
+        object.__setattr__(self, "root", None)
+        self.set_parent(None, None)
+        for wrapper in self.get_nested_wrappers():
+            change_root(wrapper, root, self)
+
+    def attach(self, parent: "Wrapper", key: Any) -> None:
+        """Attach wrapper being its own root to a parent (the reverse of `detach`).
+
+        Args:
+            parent (Wrapper): wrapper containing this one
+            key (Any): name or index of this wrapper in the parent
+        """
+        root = parent.get_root()
+        object.__setattr__(self, "root", root)
+        self.set_parent(parent, key)
+        self.add_observer(root)
+        for wrapper in self.get_nested_wrappers():
+            change_root(wrapper, self, root)
+
+    def get_nested_wrappers(self) -> Iterator["Wrapper"]:
+        """Iterating over the wrappers of the values (not wrapped values are skipped)."""
+        raise NotImplementedError()
+
+    def get_path(self, key: Any = UNSET) -> tuple | None:
+        """Get names and indices to get from the root to this wrapper (or one of its values).
+
+        Args:
+            key (Any): name or index of a value of this wrapper (default: the wrapper itself)
+
+        Returns:
+            path (None when the wrapper is not found in its parent anymore).
+        """
+        path = self.__path
+        if path is None or path[0] != Wrapper.__version:
+            path = (Wrapper.__version, self.__find_path())
+            self.__path = path
+
+        if key is UNSET or path[1] is None:
+            return path[1]
+        return path[1] + (key,)
+
+    def find_key(self, value: "Wrapper", key: Any) -> Any:
+        """Get name or index of a nested wrapper.
+
+        Args:
+            value (Wrapper): the nested wrapper
+            key (Any): last known name or index of the nested wrapper
+
+        Returns:
+            name or index (UNSET when the wrapper is not a value of this one).
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def invalidate_paths() -> None:
+        """Forget cached paths (the structure of responsive data has changed)."""
+        Wrapper.__version += 1
+
+    def on_notify(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when related subject has changed (forwarding the notification).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
+        """
+        self.notify(*args, **kwargs)
+
+    def on_change(self, subject: object, event: ChangeEvent) -> None:
+        """Called when related subject has changed (forwarding the event).
+
+        Args:
+            subject (object): the one who does the notification.
+            event (ChangeEvent): the change
+        """
+        self.notify_change(event)
+
+    def __find_path(self) -> tuple | None:
+        """Get path from the root walking the parents (None when not reachable)."""
+        if self.__parent is None:
+            return ()
+
+        key = self.__parent.find_key(self, self.__key)
+        if key is UNSET:
+            return None
+
+        self.__key = key
+        return self.__parent.get_path(key)
+
+
+class DictWrapper(Wrapper, MutableMapping):
+    """Wrapper for a dictionary object (or the fields of a class).
+
+    The values can be accessed as attributes (`data.name`) or as items
+    (`data["name"]`, required for keys which are not identifiers or which are
+    named like a method of the wrapper, e.g. `items`). `update` and `clear`
+    notify one change for all keys: `count` is the number of keys, `old` and
+    `new` are dictionaries (`old` with the keys that existed before).
+    """
+
+    __slots__ = ()
+
     def __setattr__(self, name: str, value: Any) -> None:
-        """Creating attribute 'obj' or changing one of its attributes.
+        """Setting private attribute of the wrapper or changing a field of the wrapped data.
 
         Args:
             name  (str): name of the attribute.
             value (Any): value of the attribute.
         """
-        if "obj" in self.__dict__:
-            if isinstance(self.obj, dict):
-                old_value = self.obj[name]
-                self.obj[name] = self.make_responsive(
-                    value, root=self.root if self.root is not None else self
-                )
-                self.notify(
-                    id=id(self),
-                    context=Context.DICTIONARY,
-                    name=name,
-                    old=old_value,
-                    new=value,
-                    operation=Operation.VALUE_CHANGED,
-                )
-            else:
-                old_value = self.obj.__dict__[name]
-                self.obj.__dict__[name] = self.make_responsive(
-                    value, root=self.root if self.root is not None else self
-                )
-                self.notify(
-                    id=id(self),
-                    context=Context.CLASS,
-                    name=name,
-                    old=old_value,
-                    new=value,
-                    operation=Operation.VALUE_CHANGED,
-                )
+        if name in PRIVATE_ATTRIBUTES:
+            object.__setattr__(self, name, value)
         else:
-            super().__setattr__(name, value)
+            self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        """Removing a field of the wrapped data.
+
+        Args:
+            name  (str): name of the attribute.
+        """
+        del self[name]
 
     def __getattr__(self, name: str) -> Any:
         """Get value of attribute.
@@ -99,27 +460,154 @@ class DictWrapper(Subject, Observer):
         Returns:
             value of the attribute.
         """
-        if isinstance(self.obj, dict):
-            return self.obj[name]
+        return self[name]
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get value for given key.
+
+        Args:
+            key (Any): key of the value
+
+        Returns:
+            value for the key.
+        """
+        if READS:
+            READS[-1].add((id(self), key))
+        if self.options.lazy:
+            return wrap_on_access(self, self.__get_dict(), key)
 
-        return self.obj.__dict__[name]
+        return self.__get_dict()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Changing value for given key (adding the key when it does not exist).
+
+        Args:
+            key (Any): key of the value
+            value (Any): new value
+        """
+        the_dict = self.__get_dict()
+        if key in the_dict:
+            if isinstance(value, Wrapper) and the_dict[key] is value:
+                return  # e.g. `data.values += [1]` assigns the changed list to itself
+            if self.options.reconcile and assign_in_place(self, the_dict, key, value):
+                return
+
+            old_value = the_dict[key]
+            the_dict[key] = make_responsive(value, self, key)
+            if isinstance(old_value, Wrapper):
+                old_value.detach()
+                self.invalidate_paths()
+            self.__notify(
+                key, name=key, old=old_value, new=value, operation=Operation.VALUE_CHANGED
+            )
+        else:
+            the_dict[key] = make_responsive(value, self, key)
+            self.__notify(key, name=key, new=value, operation=Operation.VALUE_ADDED)
+
+    def __delitem__(self, key: Any) -> None:
+        """Removing given key.
+
+        Args:
+            key (Any): key of the value
+        """
+        old_value = self.__get_dict().pop(key)
+        if isinstance(old_value, Wrapper):
+            old_value.detach()
+            self.invalidate_paths()
+        self.__notify(key, name=key, old=old_value, operation=Operation.VALUE_REMOVED)
+
+    def __iter__(self):
+        """Iterating over the keys."""
+        if READS:
+            READS[-1].add((id(self), UNSET))
+        return iter(self.__get_dict())
 
     def __len__(self):
-        """Get length of dictionary."""
-        return len(self.obj)
+        """Get number of keys."""
+        if READS:
+            READS[-1].add((id(self), UNSET))
+        return len(self.__get_dict())
 
-    def update(self, subject: object, *args: Any, **kwargs: Any):
-        """Called when related subject has changed.
+    def __contains__(self, key: Any) -> bool:
+        """Checking key to exist."""
+        if READS:
+            READS[-1].add((id(self), key))
+        return key in self.__get_dict()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Changing values for many keys (one notification).
 
         Args:
-            subject (object): the one who does the notification.
-            *args (Any): optional positional arguments
+            *args (Any): optional mapping or iterable of key/value pairs
             **kwargs (Any): optional key/value arguments
         """
-        self.notify(*args, **kwargs)
+        the_dict = self.__get_dict()
+        values = {
+            key: value
+            for key, value in dict(*args, **kwargs).items()
+            if not (isinstance(value, Wrapper) and the_dict.get(key) is value)
+        }
+        if len(values) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        old_values = {key: the_dict[key] for key in values if key in the_dict}
+        for key, value in values.items():
+            the_dict[key] = make_responsive(value, self, key)
+        detach_all(old_values.values())
+        self.invalidate_paths()
+        self.__notify(
+            UNSET, count=len(values), old=old_values, new=values, operation=Operation.VALUE_CHANGED
+        )
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Get value for given key adding it with the default when it does not exist.
+
+        Args:
+            key (Any): key of the value
+            default (Any): value to add when the key does not exist
+
+        Returns:
+            value for the key.
+        """
+        if key not in self.__get_dict():
+            self[key] = default
+        return self[key]
+
+    def clear(self) -> None:
+        """Removing all keys (one notification)."""
+        the_dict = self.__get_dict()
+        if len(the_dict) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        old_values = dict(the_dict)
+        the_dict.clear()
+        detach_all(old_values.values())
+        self.invalidate_paths()
+        self.__notify(
+            UNSET, count=len(old_values), old=old_values, operation=Operation.VALUE_REMOVED
+        )
+
+    def assign(self, values: dict | object) -> None:
+        """Change the values to the given ones with the fewest notifications (one batch).
+
+        Keys which are missing are removed, new keys are added, equal values
+        are not changed and nested dictionaries, lists and classes are changed
+        in place reusing their wrappers.
+
+        Args:
+            values (dict | object): new values (dictionary or class of the same type)
+        """
+        values = get_fields(values)
+        the_dict = self.__get_dict()
+        with self.get_root().batch():
+            for key in [key for key in the_dict if key not in values]:
+                del self[key]
+            for key, value in values.items():
+                if key not in the_dict or not assign_in_place(self, the_dict, key, value):
+                    self[key] = value
 
     def __eq__(self, other: object) -> bool:
-        """Comparing two lists.
+        """Comparing two dictionaries.
 
         Args:
             other (object): another object to compare with
@@ -139,73 +627,202 @@ class DictWrapper(Subject, Observer):
         """Calculating hash of underlying object."""
         return hash(tuple(sorted(self.obj.items())))
 
+    def __get_dict(self) -> dict:
+        """Get the wrapped dictionary (or the dictionary of the class fields)."""
+        obj = self.obj
+        return obj if type(obj) is dict else get_fields(obj)
 
-class ListWrapper(Subject, Observer):
-    """Wrapper for a dictionary object."""
+    def get_nested_wrappers(self) -> Iterator[Wrapper]:
+        """Iterating over the wrappers of the values (not wrapped values are skipped)."""
+        return (value for value in self.__get_dict().values() if isinstance(value, Wrapper))
 
-    def __init__(self, obj: object, make_responsive: callable, root: Subject = None):
-        """Initialize wrapper.
+    def find_key(self, value: Wrapper, key: Any) -> Any:
+        """Get name of a nested wrapper.
 
         Args:
-            obj (objec): object to wrap.
-            make_responsive (callable): function to make responsive
-            root (Subject): root object receiving notifications
+            value (Wrapper): the nested wrapper
+            key (Any): last known name of the nested wrapper
+
+        Returns:
+            name (UNSET when the wrapper is not a value of this one).
         """
-        super().__init__()
-        self.make_responsive = make_responsive
-        self.root = root
-        self.obj = obj
+        return key if self.__get_dict().get(key) is value else UNSET
 
-    def __repr__(self) -> str:
-        """Get string representation of wrapped data.
+    def __notify(self, key: Any, **values: Any) -> None:
+        """Notify change of the wrapped dictionary (or class) for given key (UNSET: many keys)."""
+        context = Context.DICTIONARY if isinstance(self.obj, dict) else Context.CLASS
+        self.notify_change(
+            ChangeEvent(id=id(self), context=context, path=self.get_path(key), **values)
+        )
 
-        Returns:
-            string representation of wrapped data.
+
+class ListWrapper(Wrapper, MutableSequence):
+    """Wrapper for a list object.
+
+    Operations on many values (`extend`, `clear`, `sort`, `reverse`, `del`
+    and assignment with a slice) notify one change for the whole range:
+    `index` is the first index, `count` the number of values that have been
+    added (VALUE_ADDED), removed (VALUE_REMOVED) or replaced (VALUE_CHANGED,
+    `new` can have another length then).
+    """
+
+    __slots__ = ()
+
+    def update(self, subject: object, *args: Any, **kwargs: Any) -> None:
+        """Called when related subject has changed (same as `on_notify`).
+
+        Args:
+            subject (object): the one who does the notification.
+            *args (Any): optional positional arguments
+            **kwargs (Any): optional key/value arguments
         """
-        return f"{self.obj}"
+        self.on_notify(subject, *args, **kwargs)
+
+    def __getitem__(self, index):
+        """Get value at given index."""
+        if READS:
+            READS[-1].add((id(self), UNSET))
+        if self.options.lazy:
+            if isinstance(index, slice):
+                for position in range(*index.indices(len(self.obj))):
+                    wrap_on_access(self, self.obj, position)
+                return self.obj[index]
+            return wrap_on_access(self, self.obj, self.__normalize(index))
+
+        return self.obj[index]
+
+    def __setitem__(self, index, value):
+        """Change value at given index (or values of a slice)."""
+        if isinstance(index, slice):
+            self.__set_slice(index, value)
+            return
+
+        index = self.__normalize(index)
+        if isinstance(value, Wrapper) and self.obj[index] is value:
+            return  # e.g. `data[0] += [1]` assigns the changed list to itself
+        if self.options.reconcile and assign_in_place(self, self.obj, index, value):
+            return
+
+        old_value = self.obj[index]
+        self.obj[index] = make_responsive(value, self, index)
+        if isinstance(old_value, Wrapper):
+            old_value.detach()
+            self.invalidate_paths()
+        self.__notify(index, old=old_value, new=value, operation=Operation.VALUE_CHANGED)
+
+    def __delitem__(self, index):
+        """Remove value at given index (or values of a slice)."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.obj))
+            if step != 1:
+                self.__change_all(lambda: self.obj.__delitem__(index))
+                return
+
+            old_values = self.obj[start:stop]
+            del self.obj[start:stop]
+            detach_all(old_values)
+            self.invalidate_paths()
+            self.__notify_range(Operation.VALUE_REMOVED, start, len(old_values), old=old_values)
+            return
+
+        index = self.__normalize(index)
+        old_value = self.obj.pop(index)
+        if isinstance(old_value, Wrapper):
+            old_value.detach()
+        self.invalidate_paths()
+        self.__notify(index, old=old_value, operation=Operation.VALUE_REMOVED)
+
+    def __iter__(self):
+        """Iterating over the values."""
+        if READS:
+            READS[-1].add((id(self), UNSET))
+        if self.options.lazy:
+            return (self[index] for index in range(len(self.obj)))
+        return iter(self.obj)
+
+    def __contains__(self, value):
+        """Checking value to be in the list."""
+        if READS:
+            READS[-1].add((id(self), UNSET))
+        return value in self.obj
+
+    def __iadd__(self, values):
+        """Appending values to the list (one notification)."""
+        self.extend(values)
+        return self
+
+    def insert(self, index, value):
+        """Inserting a value before given index."""
+        index = min(max(len(self.obj) + index, 0) if index < 0 else index, len(self.obj))
+        self.obj.insert(index, make_responsive(value, self, index))
+        if index < len(self.obj) - 1:
+            self.invalidate_paths()
+        self.__notify(index, new=value, operation=Operation.VALUE_ADDED)
 
     def append(self, value):
         """Appending a value to the list."""
-        self.obj.append(value)
-        self.notify(id=id(self), context=Context.LIST, new=value, operation=Operation.VALUE_ADDED)
+        self.insert(len(self.obj), value)
+
+    def extend(self, values):
+        """Appending values to the list (one notification)."""
+        values = list(values)
+        if len(values) == 0:  # pylint: disable=compare-to-zero
+            return
+
+        self.__insert_all(len(self.obj), values)
+
+    def pop(self, index=-1):
+        """Removing value at given index (default: last one) returning it."""
+        value = self.obj[index]
+        del self[index]
+        return value
 
     def remove(self, value):
-        """Removing a value to the list."""
-        self.obj.remove(value)
-        self.notify(id=id(self), context=Context.LIST, old=value, operation=Operation.VALUE_REMOVED)
+        """Removing first occurrence of a value from the list."""
+        del self[self.obj.index(value)]
 
-    def __setitem__(self, index, value):
-        """Change value at given index."""
-        old_value = self.obj[index]
-        self.obj[index] = self.make_responsive(
-            value, root=self.root if self.root is not None else self
-        )
-        self.notify(
-            id=id(self),
-            context=Context.LIST,
-            index=index,
-            old=old_value,
-            new=value,
-            operation=Operation.VALUE_CHANGED,
-        )
+    def clear(self):
+        """Removing all values (one notification)."""
+        del self[:]
 
-    def __getitem__(self, index):
-        """Get value at given index."""
-        return self.obj[index]
+    def sort(self, *, key=None, reverse=False):
+        """Sorting the values (one notification)."""
+        self.__change_all(lambda: self.obj.sort(key=key, reverse=reverse))
 
-    def __len__(self):
-        """Get length of list."""
-        return len(self.obj)
+    def reverse(self):
+        """Reversing the order of the values (one notification)."""
+        self.__change_all(self.obj.reverse)
+
+    def assign(self, values: list) -> None:
+        """Change the values to the given ones with the fewest notifications (one batch).
 
-    def update(self, subject: object, *args: Any, **kwargs: Any):
-        """Called when related subject has changed.
+        Equal values at the start and at the end are kept, the values between
+        are changed by index (nested dictionaries, lists and classes in place
+        reusing their wrappers) and the remaining values are added or removed
+        as one range.
 
         Args:
-            subject (object): the one who does the notification.
-            *args (Any): optional positional arguments
-            **kwargs (Any): optional key/value arguments
+            values (list): new values
         """
-        self.notify(*args, **kwargs)
+        old_count, new_count = len(self.obj), len(values)
+        start, end = 0, 0
+        while start < min(old_count, new_count) and is_same(self.obj[start], values[start]):
+            start += 1
+        while end < min(old_count, new_count) - start and is_same(
+            self.obj[old_count - end - 1], values[new_count - end - 1]
+        ):
+            end += 1
+
+        stop = min(old_count, new_count) - end
+        with self.get_root().batch():
+            for index in range(start, stop):
+                if not assign_in_place(self, self.obj, index, values[index]):
+                    self[index] = values[index]
+            new_stop, old_stop = new_count - end, old_count - end
+            if new_count > old_count:
+                self.__insert_all(stop, values[stop:new_stop])
+            elif new_count < old_count:
+                del self[stop:old_stop]
 
     def __eq__(self, other: object) -> bool:
         """Comparing two lists.
@@ -227,3 +844,92 @@ class ListWrapper(Subject, Observer):
     def __hash__(self):
         """Calculating hash of underlying object."""
         return hash(self.obj)
+
+    def __normalize(self, index: int) -> int:
+        """Get index as non negative value (raising IndexError when out of range)."""
+        if not -len(self.obj) <= index < len(self.obj):
+            raise IndexError("list index out of range")
+        return index + len(self.obj) if index < 0 else index
+
+    def __set_slice(self, index: slice, values) -> None:
+        """Change values of a slice (one notification)."""
+        start, stop, step = index.indices(len(self.obj))
+        values = list(values)
+        wrapped_values = make_responsive_all(values, self, start)
+        if step != 1:
+            self.__change_all(lambda: self.obj.__setitem__(index, wrapped_values))
+            return
+
+        stop = max(start, stop)
+        old_values = self.obj[start:stop]
+        self.obj[start:stop] = wrapped_values
+        detach_all(old_values)
+        self.invalidate_paths()
+        self.__notify_range(
+            Operation.VALUE_CHANGED, start, len(old_values), old=old_values, new=values
+        )
+
+    def __insert_all(self, start: int, values: list) -> None:
+        """Insert values before given index (one notification)."""
+        self.obj[start:start] = make_responsive_all(values, self, start)
+        if start < len(self.obj) - len(values):
+            self.invalidate_paths()
+        self.__notify_range(Operation.VALUE_ADDED, start, len(values), new=values)
+
+    def __change_all(self, change) -> None:
+        """Do change of whole list notifying all values as replaced."""
+        old_values = list(self.obj)
+        change()
+        kept = {id(value) for value in self.obj}
+        detach_all(value for value in old_values if id(value) not in kept)
+        self.invalidate_paths()
+        self.__notify_range(
+            Operation.VALUE_CHANGED, 0, len(old_values), old=old_values, new=list(self.obj)
+        )
+
+    def get_nested_wrappers(self) -> Iterator[Wrapper]:
+        """Iterating over the wrappers of the values (not wrapped values are skipped)."""
+        return (value for value in self.obj if isinstance(value, Wrapper))
+
+    def find_key(self, value: Wrapper, key: Any) -> Any:
+        """Get index of a nested wrapper (updating the indices of all nested wrappers).
+
+        Args:
+            value (Wrapper): the nested wrapper
+            key (Any): last known index of the nested wrapper
+
+        Returns:
+            index (UNSET when the wrapper is not a value of this one).
+        """
+        if 0 <= key < len(self.obj) and self.obj[key] is value:
+            return key
+
+        found = UNSET
+        for index, other in enumerate(self.obj):
+            if isinstance(other, Wrapper):
+                other.set_parent(self, index)
+                if other is value:
+                    found = index
+        return found
+
+    def __notify(self, index: int, **values: Any) -> None:
+        """Notify change of the value at given index (or of a range starting there)."""
+        self.notify_change(
+            ChangeEvent(
+                id=id(self), context=Context.LIST, path=self.get_path(index), index=index, **values
+            )
+        )
+
+    def __notify_range(self, operation: Operation, start: int, count: int, **values) -> None:
+        """Notify change of a range of values."""
+        self.__notify(start, count=count, operation=operation, **values)
+
+
+PRIVATE_ATTRIBUTES = frozenset(
+    name
+    for cls in DictWrapper.__mro__
+    for name, value in vars(cls).items()
+    if isinstance(value, MemberDescriptorType) and name.startswith("_")
+)
+"""Names of the private attributes of a wrapper (all other names written as attributes are
+fields of the wrapped data, also the ones named like a public attribute, e.g. `root`)."""
@@ -0,0 +1,215 @@
+"""Module test_asynchronous.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase
+
+from responsive.asynchronous import AsyncObserver, AsyncSubject
+from responsive.constants import Operation, OverflowPolicy
+from responsive.data import make_responsive
+from responsive.observer import DefaultObserver
+
+
+class SlowObserver(AsyncObserver):
+    """Observer recording the values of its notifications after a short delay."""
+
+    def __init__(self, delay: float = 0.0):
+        """Initialize observer."""
+        self.delay = delay
+        self.values = []
+
+    async def update_async(self, subject, *args, **kwargs):
+        """Record value after a delay."""
+        await asyncio.sleep(self.delay)
+        self.values.append(kwargs.get("new"))
+
+
+class FailingObserver(AsyncObserver):
+    """Observer raising an exception."""
+
+    async def update_async(self, subject, *args, **kwargs):
+        """Raise an exception."""
+        raise ValueError("failing observer")
+
+
+class AsyncSubjectTest(IsolatedAsyncioTestCase):
+    """Testing class AsyncSubject."""
+
+    async def test_async_and_sync_observers(self):
+        """Testing changes of a responsive object delivered asynchronously."""
+        data = make_responsive({"value": 0, "values": []})
+        subject = AsyncSubject()
+        data.add_observer(subject)
+        async_observer, sync_observer = SlowObserver(), DefaultObserver()
+        subject.add_observer(async_observer)
+        subject.add_observer(sync_observer)
+        subject.start()
+
+        data.value = 1
+        data["values"].append(2)
+        self.assertEqual(async_observer.values, [])
+
+        await subject.stop()
+        self.assertEqual(async_observer.values, [1, 2])
+        self.assertEqual(
+            [kwargs["operation"] for _, _, kwargs in sync_observer],
+            [Operation.VALUE_CHANGED, Operation.VALUE_ADDED],
+        )
+
+    async def test_queued_changes_copied(self):
+        """Testing a queued change not showing a later change of the assigned list."""
+        data = make_responsive({})
+        subject = AsyncSubject()
+        data.add_observer(subject)
+        observer = SlowObserver()
+        subject.add_observer(observer)
+
+        data["f"] = [1]
+        data.f.append(2)
+        subject.start()
+        await subject.stop()
+        self.assertEqual(observer.values, [[1], 2])
+
+    async def test_observers_awaited_concurrently(self):
+        """Testing slow observers of one notification not waiting for each other."""
+        subject = AsyncSubject()
+        observers = [SlowObserver(delay=0.05) for _ in range(20)]
+        for observer in observers:
+            subject.add_observer(observer)
+        subject.start()
+
+        started = asyncio.get_running_loop().time()
+        subject.notify(new=1)
+        await subject.stop()
+        self.assertLess(asyncio.get_running_loop().time() - started, 0.5)
+        self.assertTrue(all(observer.values == [1] for observer in observers))
+
+    async def test_drop_oldest(self):
+        """Testing full queue with policy DROP_OLDEST."""
+        subject = AsyncSubject(maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+        observer = SlowObserver()
+        subject.add_observer(observer)
+
+        for value in range(5):
+            subject.notify(new=value)
+        self.assertEqual(subject.get_queue_size(), 2)
+        self.assertEqual(subject.get_count_dropped(), 3)
+
+        subject.start()
+        await subject.stop()
+        self.assertEqual(observer.values, [3, 4])
+
+    async def test_coalesce(self):
+        """Testing full queue with policy COALESCE."""
+        subject = AsyncSubject(maxsize=2, policy=OverflowPolicy.COALESCE)
+        observer = SlowObserver()
+        subject.add_observer(observer)
+        changed = Operation.VALUE_CHANGED
+
+        subject.notify(id=1, name="a", old=0, new=1, operation=changed)
+        subject.notify(id=1, name="b", old=0, new=2, operation=changed)
+        subject.notify(id=1, name="a", old=1, new=3, operation=changed)
+        subject.notify(id=1, name="c", old=0, new=4, operation=changed)
+
+        subject.start()
+        await subject.stop()
+        self.assertEqual(observer.values, [2, 4])
+        self.assertEqual(subject.get_count_dropped(), 1)
+
+    async def test_coalesce_on_overflow_only(self):
+        """Testing changes of same value being kept while the queue is not full."""
+        subject = AsyncSubject(maxsize=3, policy=OverflowPolicy.COALESCE)
+        observer = SlowObserver()
+        subject.add_observer(observer)
+        changed = Operation.VALUE_CHANGED
+
+        subject.notify(id=1, name="a", old=0, new=1, operation=changed)
+        subject.notify(id=1, name="a", old=1, new=2, operation=changed)
+        self.assertEqual(subject.get_queue_size(), 2)
+        subject.notify(id=1, name="b", old=0, new=3, operation=changed)
+        subject.notify(id=1, name="a", old=2, new=4, operation=changed)
+        self.assertEqual(subject.get_count_dropped(), 0)
+        # no change is moved before a change of the structure
+        subject.notify(id=1, name="c", new=5, operation=Operation.VALUE_ADDED)
+        subject.notify(id=1, name="a", old=4, new=6, operation=changed)
+        self.assertEqual(subject.get_count_dropped(), 2)
+
+        subject.start()
+        await subject.stop()
+        self.assertEqual(observer.values, [3, 5, 6])
+
+    async def test_stop_before_start(self):
+        """Testing stop without task doing nothing."""
+        subject = AsyncSubject()
+        subject.notify(new=1)
+        await subject.stop()
+        self.assertEqual(subject.get_queue_size(), 1)
+
+    async def test_block(self):
+        """Testing full queue with policy BLOCK."""
+        subject = AsyncSubject(maxsize=1)
+        observer = SlowObserver()
+        subject.add_observer(observer)
+
+        subject.notify(new=1)
+        self.assertRaises(RuntimeError, subject.notify, new=2)
+        self.assertRaises(ValueError, subject.notify, 3)
+
+        subject.start()
+        thread = threading.Thread(target=lambda: [subject.notify(new=n) for n in range(2, 10)])
+        thread.start()
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+        await subject.stop()
+        self.assertEqual(observer.values, list(range(1, 10)))
+
+    async def test_errors(self):
+        """Testing exceptions of observers being collected."""
+        subject = AsyncSubject()
+        observer = SlowObserver()
+        subject.add_observer(FailingObserver())
+        subject.add_observer(observer)
+        subject.start()
+
+        subject.notify(new=1)
+        await subject.stop()
+        self.assertEqual(observer.values, [1])
+        self.assertEqual(len(subject.get_errors()), 1)
+
+    async def test_errors_bounded(self):
+        """Testing the last exceptions of observers being kept only."""
+        subject = AsyncSubject(max_errors=2)
+        subject.add_observer(FailingObserver())
+        subject.start()
+        for value in range(5):
+            subject.notify(new=value)
+        await subject.stop()
+        self.assertEqual(len(subject.get_errors()), 2)
+
+    async def test_join_before_start(self):
+        """Testing join returning at once when the task has not been started."""
+        subject = AsyncSubject()
+        subject.notify(new=1)
+        await subject.join()
+        self.assertEqual(subject.get_queue_size(), 1)
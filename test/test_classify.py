@@ -0,0 +1,203 @@
+"""Module test_classify.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pylint: disable=too-few-public-methods
+import json
+from collections import namedtuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from fractions import Fraction
+from ipaddress import IPv4Address
+from pathlib import PurePosixPath
+from unittest import TestCase
+from uuid import UUID
+
+from responsive.classify import KINDS, SlotFields, get_fields, get_kind, register_type
+from responsive.constants import Operation, ValueKind
+from responsive.data import make_responsive, to_plain
+from responsive.observer import DefaultObserver
+from responsive.serialization import dumps
+from responsive.wrapper import DictWrapper, ListWrapper
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class Color(Enum):
+    """Some enum."""
+
+    RED = 1
+
+
+class Slotted:
+    """Class with slots."""
+
+    __slots__ = ("name", "values", "__secret")
+
+    def __init__(self, name: str):
+        """Initialize fields (secret stays unset)."""
+        self.name = name
+        self.values = [1, {"a": 2}]
+
+
+class SlottedWithDict(Slotted):
+    """Class with slots and instance dictionary."""
+
+    __slots__ = ("__dict__",)
+
+
+@dataclass
+class Record:
+    """Some dataclass."""
+
+    name: str
+    tags: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SlottedRecord:
+    """Some dataclass with slots."""
+
+    name: str
+    tags: list = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FrozenRecord:
+    """Some frozen dataclass."""
+
+    name: str
+
+
+class Opaque:
+    """Class registered with own fields."""
+
+    def __init__(self):
+        """Initialize fields kept in another attribute."""
+        self.data = {"value": 1}
+
+
+class TestClassify(TestCase):
+    """Testing classification of types."""
+
+    def test_kinds(self):
+        """Testing kinds of values."""
+        values = [
+            (1, ValueKind.VALUE),
+            ("a", ValueKind.VALUE),
+            ((1, 2), ValueKind.VALUE),
+            (Point(1, 2), ValueKind.VALUE),
+            (Color.RED, ValueKind.VALUE),
+            (datetime(2020, 1, 1), ValueKind.VALUE),
+            (FrozenRecord("a"), ValueKind.VALUE),
+            ({1, 2}, ValueKind.VALUE),
+            (Record, ValueKind.VALUE),
+            ({}, ValueKind.DICTIONARY),
+            ([], ValueKind.LIST),
+            (Record("a"), ValueKind.CLASS),
+            (SlottedRecord("a"), ValueKind.CLASS),
+            (Slotted("a"), ValueKind.CLASS),
+        ]
+        for value, kind in values:
+            with self.subTest(value=value):
+                self.assertEqual(get_kind(value), kind)
+                self.assertIn(type(value), KINDS)
+
+    def test_slot_fields(self):
+        """Testing fields of an object with slots as mapping."""
+        obj = SlottedWithDict("a")
+        obj.extra = 1
+        fields = get_fields(obj)
+        self.assertIsInstance(fields, SlotFields)
+        self.assertEqual(dict(fields), {"name": "a", "values": [1, {"a": 2}], "extra": 1})
+        self.assertNotIn("_Slotted__secret", fields)
+
+        fields["_Slotted__secret"] = 2
+        self.assertEqual(fields["_Slotted__secret"], 2)
+        del fields["name"]
+        self.assertNotIn("name", fields)
+        with self.assertRaises(KeyError):
+            del fields["name"]
+        with self.assertRaises(TypeError):
+            get_fields(1)
+
+    def test_responsive_slotted_objects(self):
+        """Testing responsive objects with slots."""
+        for obj in (Slotted("a"), SlottedRecord("a", [1, {"a": 2}])):
+            for lazy in (False, True):
+                with self.subTest(obj=type(obj).__name__, lazy=lazy):
+                    observer = DefaultObserver()
+                    data = make_responsive({"item": obj}, lazy=lazy)
+                    data.add_observer(observer)
+
+                    data.item.name = "b"
+                    self.assertEqual(obj.name, "b")
+                    self.assertIsInstance(data.item[list(data.item)[1]], ListWrapper)
+                    self.assertEqual(list(observer)[-1][2]["path"], ("item", "name"))
+                    self.assertEqual(list(observer)[-1][2]["operation"], Operation.VALUE_CHANGED)
+
+                    self.assertEqual(to_plain(data)["item"]["name"], "b")
+                    self.assertEqual(json.loads(dumps(data)), to_plain(data))
+
+    def test_values_not_wrapped(self):
+        """Testing values of types which are not wrapped."""
+        data = make_responsive(
+            {"point": Point(1, 2), "color": Color.RED, "frozen": FrozenRecord("a")}
+        )
+        self.assertIs(type(data.point), Point)
+        self.assertIs(data.color, Color.RED)
+        self.assertIs(type(data.frozen), FrozenRecord)
+        self.assertIsInstance(make_responsive(Record("a")), DictWrapper)
+
+    def test_hashable_slotted_values(self):
+        """Testing immutable types with slots (defining their hash) not to be wrapped."""
+        values = {
+            "uuid": UUID(int=1),
+            "fraction": Fraction(1, 3),
+            "path": PurePosixPath("/home/user"),
+            "address": IPv4Address("127.0.0.1"),
+        }
+        for value in values.values():
+            with self.subTest(value=value):
+                self.assertEqual(get_kind(value), ValueKind.VALUE)
+
+        data = make_responsive(values)
+        for name, value in values.items():
+            self.assertIs(data[name], value)
+        self.assertEqual(to_plain(data), values)
+
+    def test_register_type(self):
+        """Testing types registered with own fields."""
+        register_type(Opaque, ValueKind.CLASS, lambda obj: obj.data)
+        try:
+            data = make_responsive({"opaque": Opaque()})
+            data.opaque.value = 2
+            self.assertEqual(to_plain(data), {"opaque": {"value": 2}})
+            with self.assertRaises(ValueError):
+                register_type(Opaque, ValueKind.CLASS)
+            with self.assertRaises(ValueError):
+                register_type(Opaque, ValueKind.LIST)
+        finally:
+            register_type(Opaque, ValueKind.VALUE)
+        self.assertEqual(get_kind(Opaque()), ValueKind.VALUE)
@@ -0,0 +1,149 @@
+"""Module test_computed.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+from unittest import TestCase
+
+from responsive.computed import Computed
+from responsive.data import make_responsive
+
+
+def create_data() -> dict:
+    """Create test data."""
+    return {
+        "order": {"items": [{"price": 2, "count": 3}, {"price": 5, "count": 1}], "discount": 1},
+        "customer": {"name": "Jane", "city": "Berlin"},
+    }
+
+
+def get_total(data) -> int:
+    """Compute total of an order."""
+    order = data.order
+    return sum(item.price * item.count for item in order["items"]) - order.discount
+
+
+class TestComputed(TestCase):
+    """Testing class Computed."""
+
+    def test_cached(self):
+        """Testing that the value is computed once until a dependency changes."""
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                data = make_responsive(create_data(), lazy=lazy)
+                total = Computed(data, lambda data=data: get_total(data))
+                self.assertEqual(total.get_value(), 10)
+                self.assertEqual(total.get_value(), 10)
+                self.assertEqual(total.get_count_computations(), 1)
+
+                data.customer.name = "John"
+                data.customer.zip = "10115"
+                data.order.note = "fast"
+                self.assertTrue(total.is_valid())
+
+                data.order["items"][1].count = 2
+                self.assertFalse(total.is_valid())
+                self.assertEqual(total.get_value(), 15)
+                self.assertEqual(total.get_count_computations(), 2)
+
+    def test_invalidating_changes(self):
+        """Testing the changes invalidating the value."""
+        changes = [
+            lambda data: setattr(data.order, "discount", 0),
+            lambda data: data.order.__delitem__("discount"),
+            lambda data: data.order["items"].append({"price": 1, "count": 1}),
+            lambda data: data.order["items"].pop(),
+            lambda data: data.order["items"].reverse(),
+            lambda data: setattr(data.order["items"][0], "price", 3),
+            lambda data: setattr(data, "order", {"items": [], "discount": 0}),
+            lambda data: data.order.update({"discount": 2}),
+            lambda data: data.order.clear(),
+        ]
+        for number, change in enumerate(changes):
+            with self.subTest(number=number):
+                data = make_responsive(create_data())
+                total = Computed(data, lambda data=data: len(data.order) + get_total(data))
+                total.get_value()
+                change(data)
+                self.assertFalse(total.is_valid())
+
+    def test_keys(self):
+        """Testing dependency on the keys of a dictionary."""
+        data = make_responsive(create_data())
+        keys = Computed(data, lambda: sorted(data.customer))
+        self.assertEqual(keys.get_value(), ["city", "name"])
+        data.order.discount = 0
+        self.assertTrue(keys.is_valid())
+        data.customer.zip = "10115"
+        self.assertEqual(keys.get_value(), ["city", "name", "zip"])
+
+    def test_missing_key(self):
+        """Testing dependency on a key which does not exist yet."""
+        data = make_responsive(create_data())
+        label = Computed(data, lambda: data.customer.get("title", "") + data.customer.name)
+        self.assertEqual(label.get_value(), "Jane")
+        data.customer.title = "Dr. "
+        self.assertEqual(label.get_value(), "Dr. Jane")
+
+    def test_batch(self):
+        """Testing invalidation by a batch of changes."""
+        data = make_responsive(create_data())
+        total = Computed(data, lambda: get_total(data))
+        total.get_value()
+        with data.batch():
+            data.customer.name = "John"
+            data.order.discount = 0
+        self.assertEqual(total.get_value(), 11)
+
+    def test_nested_computed(self):
+        """Testing a computed value reading another computed value."""
+        data = make_responsive(create_data())
+        total = Computed(data, lambda: get_total(data))
+        label = Computed(data, lambda: f"{data.customer.name}: {total.get_value()}")
+        self.assertEqual(label.get_value(), "Jane: 10")
+
+        data.order.discount = 0
+        self.assertEqual(label.get_value(), "Jane: 11")
+        self.assertEqual(total.get_count_computations(), 2)
+
+        data.customer.name = "John"
+        self.assertEqual(label.get_value(), "John: 11")
+        self.assertEqual(total.get_count_computations(), 2)
+
+    def test_failing_function(self):
+        """Testing that an exception of the function leaves the value not computed."""
+        data = make_responsive(create_data())
+        value = Computed(data, lambda: data.customer.age)
+        with self.assertRaises(KeyError):
+            value.get_value()
+        self.assertFalse(value.is_valid())
+
+    def test_close(self):
+        """Testing that a closed computed value is not observing anymore."""
+        data = make_responsive(create_data())
+        total = Computed(data, lambda: get_total(data))
+        total.get_value()
+        total.close()
+        self.assertFalse(total.is_valid())
+        total.get_value()
+        data.order.discount = 0
+        self.assertTrue(total.is_valid())
@@ -25,7 +25,10 @@ THE SOFTWARE.
 # pylint: disable=too-few-public-methods
 from unittest import TestCase
 
-from responsive.data import make_responsive
+from responsive.constants import Operation
+from responsive.data import make_responsive, to_plain
+from responsive.observer import DefaultObserver
+from responsive.wrapper import DictWrapper, ListWrapper
 
 
 class SomeOtherData:
@@ -76,3 +79,271 @@ class DataTest(TestCase):
             self.assertEqual(some_data.some_list, some_data.some_list)
             self.assertNotEqual(some_data.some_list, 1234567890)
             self.assertEqual(some_data.some_list[-1], 6)
+
+    def test_lazy_wrapping_on_access(self):
+        """Test nested containers being wrapped on first access only (lazy mode)."""
+        observer = DefaultObserver()
+        some_data = make_responsive(
+            {"some_dict": {"some_str": "a"}, "some_list": [{"some_str": "b"}]}, lazy=True
+        )
+        some_data.add_observer(observer)
+
+        self.assertIsInstance(some_data.obj["some_dict"], dict)
+        self.assertIsInstance(some_data.obj["some_list"], list)
+
+        some_data.some_dict.some_str = "c"
+        some_data.some_list[0].some_str = "d"
+        some_data.some_list.append(5)
+
+        self.assertIsInstance(some_data.obj["some_dict"], DictWrapper)
+        self.assertIsInstance(some_data.obj["some_list"], ListWrapper)
+        self.assertEqual(some_data.some_dict.some_str, "c")
+        self.assertEqual(some_data.some_list[0].some_str, "d")
+        self.assertEqual(some_data.some_list[1:], [5])
+        self.assertEqual(observer.get_count_updates(), 3)
+        self.assertEqual(
+            [kwargs["operation"] for _, _, kwargs in observer],
+            [Operation.VALUE_CHANGED, Operation.VALUE_CHANGED, Operation.VALUE_ADDED],
+        )
+
+    def test_batch_for_nested_changes(self):
+        """Test batch on the root collecting changes of nested data."""
+        observer = DefaultObserver()
+        some_data = make_responsive(SomeData())
+        some_data.add_observer(observer)
+
+        with some_data.batch():
+            for value in range(1000):
+                some_data.some_other_data.some_int_2 = value
+            some_data.some_str = "hello"
+
+        self.assertEqual(observer.get_count_updates(), 1)
+        events = list(observer)[0][2]["events"]
+        self.assertEqual([event["new"] for event in events], [999, "hello"])
+        self.assertEqual(events[0]["old"], 0)
+
+    def test_path_of_changes(self):
+        """Test changes providing the path from the root."""
+        observer = DefaultObserver()
+        data = make_responsive({"some_list": [1, {"inner": [2, {"value": 3}]}]})
+        data.add_observer(observer)
+
+        data.some_list[1].inner[1].value = 4
+        data.some_list[1].inner.append(5)
+        data.some_list[1]["other"] = 6
+        self.assertEqual(
+            [kwargs["path"] for _, _, kwargs in observer],
+            [
+                ("some_list", 1, "inner", 1, "value"),
+                ("some_list", 1, "inner", 2),
+                ("some_list", 1, "other"),
+            ],
+        )
+
+    def test_path_after_structural_changes(self):
+        """Test path of a nested value after values of a list have been shifted."""
+        observer = DefaultObserver()
+        data = make_responsive({"some_list": [{"value": 1}, {"value": 2}, {"value": 3}]})
+        data.add_observer(observer)
+        last = data.some_list[2]
+
+        data.some_list.insert(0, {"value": 0})
+        last.value = 4
+        del data.some_list[:2]
+        last.value = 5
+        data.some_list.reverse()
+        last.value = 6
+        self.assertEqual(
+            [kwargs["path"] for _, _, kwargs in observer][1::2],
+            [("some_list", 3, "value"), ("some_list", 1, "value"), ("some_list", 0, "value")],
+        )
+
+        old_list = data.some_list
+        data.some_list = [{"value": 7}]
+        self.assertIs(last.get_root(), old_list)
+        self.assertEqual(last.get_path(), (0,))
+        data.some_list[0].value = 8
+        self.assertEqual(list(observer)[-1][2]["path"], ("some_list", 0, "value"))
+
+    def test_path_of_lazy_wrapped_data(self):
+        """Test path of values being wrapped on access."""
+        observer = DefaultObserver()
+        data = make_responsive({"some_list": [{"some_dict": {"value": 1}}]}, lazy=True)
+        data.add_observer(observer)
+
+        data.some_list[0].some_dict.value = 2
+        self.assertEqual(list(observer)[-1][2]["path"], ("some_list", 0, "some_dict", "value"))
+
+        data = make_responsive({"some_list": [{"value": 1}, {"value": 2}]}, lazy=True)
+        data.add_observer(observer)
+        data.some_list[-1].value = 3
+        self.assertEqual(list(observer)[-1][2]["path"], ("some_list", 1, "value"))
+        self.assertRaises(IndexError, data.some_list.__getitem__, -3)
+
+    def test_reconcile_on_assignment(self):
+        """Test assigning a dictionary notifying the changed values only."""
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                config = {
+                    "server": {"host": "a", "port": 80, "paths": ["/", "/api", "/docs"]},
+                    "users": [{"name": "x"}, {"name": "y"}],
+                    "debug": False,
+                }
+                observer = DefaultObserver()
+                data = make_responsive({"config": config}, lazy=lazy, reconcile=True)
+                data.add_observer(observer)
+                server = data.config.server
+
+                new_config = {
+                    "server": {"host": "b", "port": 80, "paths": ["/", "/v2", "/api", "/docs"]},
+                    "users": [{"name": "x"}, {"name": "z"}],
+                    "timeout": 5,
+                }
+                data.config = new_config
+                self.assertEqual(data.config, new_config)
+                self.assertIs(data.config.server, server)
+                self.assertEqual(observer.get_count_updates(), 1)
+
+                events = list(observer)[0][2]["events"]
+                self.assertEqual(
+                    [(event["path"], event["operation"]) for event in events],
+                    [
+                        (("config", "debug"), Operation.VALUE_REMOVED),
+                        (("config", "server", "host"), Operation.VALUE_CHANGED),
+                        (("config", "server", "paths", 1), Operation.VALUE_ADDED),
+                        (("config", "users", 1, "name"), Operation.VALUE_CHANGED),
+                        (("config", "timeout"), Operation.VALUE_ADDED),
+                    ],
+                )
+
+                data.config = new_config
+                self.assertEqual(observer.get_count_updates(), 1)
+
+    def test_reconcile_lists(self):
+        """Test assigning lists notifying the changed values only."""
+        observer = DefaultObserver()
+        data = make_responsive({"values": [1, 2, 3, 4, 5]}, reconcile=True)
+        data.add_observer(observer)
+
+        cases = [
+            ([1, 2, 4, 5], [(("values", 2), Operation.VALUE_REMOVED)]),
+            ([1, 9, 4, 5], [(("values", 1), Operation.VALUE_CHANGED)]),
+            ([1, 9, 4, 5, 6, 7], [(("values", 4), Operation.VALUE_ADDED)]),
+            ([0, 1, 9, 4, 5, 6, 7], [(("values", 0), Operation.VALUE_ADDED)]),
+            ([], [(("values", 0), Operation.VALUE_REMOVED)]),
+            ([2], [(("values", 0), Operation.VALUE_ADDED)]),
+            ([1], [(("values", 0), Operation.VALUE_CHANGED)]),
+            ({"a": 1}, [(("values",), Operation.VALUE_CHANGED)]),
+        ]
+        for values, expected in cases:
+            with self.subTest(values=values):
+                before = len(list(observer))
+                data["values"] = values
+                self.assertEqual(data["values"], values)
+                changes = [(kwargs["path"], kwargs["operation"]) for _, _, kwargs in observer]
+                self.assertEqual(changes[before:], expected)
+
+    def test_reconcile_class(self):
+        """Test assigning an instance of the same class changing the existing one in place."""
+        observer = DefaultObserver()
+        data = make_responsive(SomeData(), reconcile=True)
+        data.add_observer(observer)
+        other_data = data.some_other_data
+
+        new_other_data = SomeOtherData()
+        new_other_data.some_int_2 = 5
+        data.some_other_data = new_other_data
+        self.assertIs(data.some_other_data, other_data)
+        self.assertEqual(other_data.some_int_2, 5)
+        self.assertEqual(list(observer)[-1][2]["path"], ("some_other_data", "some_int_2"))
+
+    def test_detach_replaced_and_removed_values(self):
+        """Test replaced and removed nested values not notifying the root anymore."""
+        changes = [
+            lambda data: setattr(data, "some_dict", {}),
+            lambda data: data.__delitem__("some_dict"),
+            lambda data: data.update({"some_dict": {}}),
+            lambda data: data.clear(),
+            lambda data: data.some_list.__setitem__(0, {}),
+            lambda data: data.some_list.__delitem__(0),
+            lambda data: data.some_list.__setitem__(slice(0, 1), []),
+            lambda data: data.some_list.__delitem__(slice(0, 2, 2)),
+            lambda data: data.some_list.pop(0),
+            lambda data: data.some_list.remove(data.some_list[0]),
+            lambda data: data.some_list.clear(),
+        ]
+        for number, change in enumerate(changes):
+            with self.subTest(number=number):
+                observer = DefaultObserver()
+                data = make_responsive(
+                    {"some_dict": {"inner": [{"value": 1}]}, "some_list": [{"inner": [1]}, 2]}
+                )
+                data.add_observer(observer)
+                some_dict_value = data.some_dict.inner[0]
+                some_list_value = data.some_list[0].inner
+                change(data)
+                count = observer.get_count_updates()
+
+                if number < 4:
+                    some_dict_value.value = 3
+                else:
+                    some_list_value.append(3)
+                self.assertEqual(observer.get_count_updates(), count)
+
+    def test_detached_value_is_responsive(self):
+        """Test a detached value being a responsive object of its own."""
+        data = make_responsive({"some_dict": {"inner": {"value": 1}}})
+        old_dict = data.some_dict
+        data.some_dict = {}
+
+        observer = DefaultObserver()
+        old_dict.add_observer(observer)
+        old_dict.inner.value = 2
+        self.assertIsNone(old_dict.get_parent())
+        self.assertEqual(list(observer)[-1][2]["path"], ("inner", "value"))
+
+    def test_inplace_add_to_nested_lists(self):
+        """Test += on nested lists (assigning the changed list to itself)."""
+        for reconcile in (False, True):
+            with self.subTest(reconcile=reconcile):
+                observer = DefaultObserver()
+                data = make_responsive({"some_list": [[1], 2]}, reconcile=reconcile)
+                data.add_observer(observer)
+                some_list = data.some_list
+
+                data.some_list += [3, 4]
+                data.some_list[0] += [5]
+                self.assertIs(data.some_list, some_list)
+                self.assertEqual(to_plain(data), {"some_list": [[1, 5], 2, 3, 4]})
+                self.assertEqual(observer.get_count_updates(), 2)
+                self.assertEqual(list(observer)[-1][2]["path"], ("some_list", 0, 1))
+
+    def test_assign_wrapper(self):
+        """Test assigning a detached wrapper (attached) or a wrapper of other data (copied)."""
+        observer = DefaultObserver()
+        data = make_responsive({"some_dict": {"inner": {"value": 1}}, "some_list": [1]})
+        data.add_observer(observer)
+        old_dict = data.some_dict
+        del data["some_dict"]
+
+        data.other_dict = old_dict
+        self.assertIs(data.other_dict, old_dict)
+        old_dict.inner.value = 2
+        self.assertEqual(list(observer)[-1][2]["path"], ("other_dict", "inner", "value"))
+
+        data.copied_list = data.some_list
+        self.assertIsNot(data.copied_list, data.some_list)
+        data.copied_list.append(2)
+        self.assertEqual(to_plain(data.some_list), [1])
+        self.assertEqual(list(observer)[-1][2]["path"], ("copied_list", 1))
+
+    def test_notify_of_nested_wrappers(self):
+        """Test notifications of nested wrappers forwarded without changing the data."""
+        observer = DefaultObserver()
+        data = make_responsive({"some_dict": {"a": 1}, "some_list": [1]})
+        data.add_observer(observer)
+
+        data.some_dict.notify(custom=1)
+        data.some_list.notify(custom=2)
+        self.assertEqual(to_plain(data), {"some_dict": {"a": 1}, "some_list": [1]})
+        self.assertEqual([update[2] for update in observer], [{"custom": 1}, {"custom": 2}])
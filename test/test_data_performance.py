@@ -0,0 +1,587 @@
+"""Module test_data_performance.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import gc
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from responsive.computed import Computed
+from responsive.data import make_responsive, to_plain
+from responsive.history import History
+from responsive.ingest import ingest_all, read_ndjson
+from responsive.jsonpatch import JsonPatchObserver
+from responsive.observer import DoNothingObserver, Observer
+from responsive.persistence import ChangeLog, recover
+from responsive.serialization import JsonCache, dumps
+
+CHECK = TestCase()
+"""Assertions of unittest for the test functions (kept when running optimized)."""
+
+
+class KeyValueObserver(Observer):
+    """Observer implementing `update` only (getting key/value arguments)."""
+
+    def update(self, subject, *args, **kwargs):
+        """Does nothing."""
+
+
+def create_large_document(count: int = 2000) -> dict:
+    """Create a document with many nested dictionaries and lists.
+
+    Args:
+        count (int): number of records in the document
+
+    Returns:
+        document with given number of records.
+    """
+    return {
+        "records": [
+            {"name": f"record {index}", "tags": ["a", "b", "c"], "details": {"value": index}}
+            for index in range(count)
+        ]
+    }
+
+
+@dataclass
+class Details:
+    """Details of a typed record."""
+
+    value: int
+    unit: str = "m"
+
+
+@dataclass
+class Record:
+    """Typed record."""
+
+    name: str
+    details: Details
+    tags: list = field(default_factory=list)
+
+
+def create_typed_document(count: int = 2000) -> dict:
+    """Create a document with many nested dataclasses.
+
+    Args:
+        count (int): number of records in the document
+
+    Returns:
+        document with given number of records.
+    """
+    return {
+        "records": [
+            Record(f"record {index}", Details(index), ["a", "b", "c"]) for index in range(count)
+        ]
+    }
+
+
+def create_list_data() -> object:
+    """Create responsive data with an empty list and an observer.
+
+    Returns:
+        responsive data.
+    """
+    data = make_responsive({"numbers": []})
+    data.add_observer(DoNothingObserver())
+    return data
+
+
+def create_dict_data() -> object:
+    """Create empty responsive dictionary with an observer.
+
+    Returns:
+        responsive data.
+    """
+    data = make_responsive({})
+    data.add_observer(DoNothingObserver())
+    return data
+
+
+def test_eager_time_to_first_access_performance(benchmark):
+    """Testing make_responsive (eager) with access to one leaf of a large document."""
+
+    def func(document):
+        """Function for benchmarking."""
+        return make_responsive(document).records[0].details.value
+
+    benchmark.pedantic(func, setup=lambda: ((create_large_document(),), {}), rounds=20)
+
+
+def test_eager_typed_document_performance(benchmark):
+    """Testing eager wrapping of a large document of dataclasses."""
+
+    def setup():
+        """Create new document (it's wrapped in place)."""
+        return (create_typed_document(),), {}
+
+    benchmark.pedantic(make_responsive, setup=setup, rounds=20)
+
+
+def test_typed_attribute_read_performance(benchmark):
+    """Testing reading fields of many dataclasses wrapped by the dictionary wrapper."""
+    data = make_responsive(create_typed_document())
+
+    def func():
+        """Function for benchmarking."""
+        return sum(record.details.value for record in data.records)
+
+    CHECK.assertEqual(benchmark(func), sum(range(2000)))
+
+
+def test_typed_attribute_read_with_proxy_performance(benchmark):
+    """Testing reading fields of many dataclasses wrapped by generated proxy classes."""
+    data = make_responsive(create_typed_document(), proxy=True)
+
+    def func():
+        """Function for benchmarking."""
+        return sum(record.details.value for record in data.records)
+
+    CHECK.assertEqual(benchmark(func), sum(range(2000)))
+
+
+def test_typed_attribute_write_performance(benchmark):
+    """Testing change of a field of a dataclass wrapped by the dictionary wrapper."""
+    data = make_responsive(create_typed_document(10))
+    data.add_observer(DoNothingObserver())
+    details = data.records[5].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value = 1
+
+    benchmark(func)
+
+
+def test_typed_attribute_write_with_proxy_performance(benchmark):
+    """Testing change of a field of a dataclass wrapped by a generated proxy class."""
+    data = make_responsive(create_typed_document(10), proxy=True)
+    data.add_observer(DoNothingObserver())
+    details = data.records[5].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value = 1
+
+    benchmark(func)
+
+
+def test_lazy_time_to_first_access_performance(benchmark):
+    """Testing make_responsive (lazy) with access to one leaf of a large document."""
+
+    def func(document):
+        """Function for benchmarking."""
+        return make_responsive(document, lazy=True).records[0].details.value
+
+    benchmark.pedantic(func, setup=lambda: ((create_large_document(),), {}), rounds=20)
+
+
+def test_nested_write_with_event_observer_performance(benchmark):
+    """Testing change of nested data with an observer getting the change event."""
+    data = make_responsive(create_large_document(10))
+    data.add_observer(DoNothingObserver())
+    details = data.records[5].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value = 1
+
+    benchmark(func)
+
+
+def test_nested_write_with_key_value_observer_performance(benchmark):
+    """Testing change of nested data with an observer getting key/value arguments."""
+    data = make_responsive(create_large_document(10))
+    data.add_observer(KeyValueObserver())
+    details = data.records[5].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value = 1
+
+    benchmark(func)
+
+
+def get_write_memory(observer: Observer | None, count: int = 10000) -> tuple[int, int]:
+    """Get memory kept by changing a nested value and the extra memory of a single change.
+
+    Args:
+        observer (Observer | None): observer of the data (None for no observer)
+        count (int): number of changes
+
+    Returns:
+        memory kept after all changes and peak of traced memory above it.
+    """
+    data = make_responsive(create_large_document(10))
+    if observer is not None:
+        data.add_observer(observer)
+    details = data.records[5].details
+    details.value = 1  # caching the path
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            details.value = index % 100
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - before, peak - current
+
+
+def test_memory_per_nested_write():
+    """Testing changes of nested data not to keep memory (with and without observer)."""
+    for observer in (None, DoNothingObserver(), KeyValueObserver()):
+        kept, extra = get_write_memory(observer)
+        # a change allocates the event (and the key/value arguments) released after notifying
+        CHECK.assertLess(kept, 10000, type(observer).__name__)
+        CHECK.assertLess(extra, 2000, type(observer).__name__)
+
+
+def test_extend_performance(benchmark):
+    """Testing extend of a responsive list with many values (one notification)."""
+    values = list(range(100_000))
+
+    def func(data):
+        """Function for benchmarking."""
+        data.numbers.extend(values)
+
+    benchmark.pedantic(func, setup=lambda: ((create_list_data(),), {}), rounds=20)
+
+
+def test_append_loop_performance(benchmark):
+    """Testing append of many values to a responsive list (one notification per value)."""
+    values = list(range(100_000))
+
+    def func(data):
+        """Function for benchmarking."""
+        for value in values:
+            data.numbers.append(value)
+
+    benchmark.pedantic(func, setup=lambda: ((create_list_data(),), {}), rounds=5)
+
+
+def test_dict_update_performance(benchmark):
+    """Testing update of a responsive dictionary with many keys (one notification)."""
+    values = {f"key {index}": {"value": index} for index in range(10_000)}
+
+    def func(data):
+        """Function for benchmarking."""
+        data.update(values)
+
+    benchmark.pedantic(func, setup=lambda: ((create_dict_data(),), {}), rounds=20)
+
+
+def test_dict_set_loop_performance(benchmark):
+    """Testing setting many keys of a responsive dictionary (one notification per key)."""
+    values = {f"key {index}": {"value": index} for index in range(10_000)}
+
+    def func(data):
+        """Function for benchmarking."""
+        for key, value in values.items():
+            data[key] = value
+
+    benchmark.pedantic(func, setup=lambda: ((create_dict_data(),), {}), rounds=20)
+
+
+def test_change_as_json_patch_performance(benchmark):
+    """Testing change of a large document sent as JSON patch."""
+    lines = []
+    data = make_responsive(create_large_document())
+    data.add_observer(JsonPatchObserver(callback=lambda patch: lines.append(json.dumps(patch))))
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value = 1
+
+    benchmark(func)
+
+
+def test_change_as_whole_document_performance(benchmark):
+    """Testing change of a large document sent as whole document (for comparison)."""
+    lines = []
+    data = make_responsive(create_large_document())
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value = 1
+        lines.append(json.dumps(to_plain(data)))
+
+    benchmark(func)
+
+
+def test_change_with_history_performance(benchmark):
+    """Testing change of a large document recording the inverse change for undo."""
+    data = make_responsive(create_large_document())
+    History(data, max_steps=1000)
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value += 1
+
+    benchmark(func)
+
+
+def test_change_with_copy_for_undo_performance(benchmark):
+    """Testing change of a large document keeping copies for undo (for comparison)."""
+    data = make_responsive(create_large_document())
+    copies = []
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        copies.append(to_plain(data))
+        details.value += 1
+
+    benchmark(func)
+
+
+def test_computed_with_unrelated_changes_performance(benchmark):
+    """Testing a total kept as computed value while unrelated values change."""
+    data = make_responsive(create_large_document())
+    total = Computed(data, lambda: sum(record.details.value for record in data.records))
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        details.name = "changed"
+        return total.get_value()
+
+    benchmark(func)
+
+
+def test_recompute_with_unrelated_changes_performance(benchmark):
+    """Testing a total computed on each change (for comparison)."""
+    data = make_responsive(create_large_document())
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        details.name = "changed"
+        return sum(record.details.value for record in data.records)
+
+    benchmark(func)
+
+
+def test_reload_with_reconcile_performance(benchmark):
+    """Testing reload of a large document where one value changed (changes in place)."""
+    data = make_responsive({"document": create_large_document()}, reconcile=True)
+    data.add_observer(DoNothingObserver())
+    documents = [create_large_document(), create_large_document()]
+    documents[1]["records"][1000]["details"]["value"] = -1
+
+    def func():
+        """Function for benchmarking."""
+        data.document = documents[func.count % 2]
+        func.count += 1
+
+    func.count = 0
+    benchmark(func)
+
+
+def test_reload_with_replace_performance(benchmark):
+    """Testing reload of a large document where one value changed (for comparison)."""
+    data = make_responsive({"document": create_large_document()})
+    data.add_observer(DoNothingObserver())
+
+    def setup():
+        """Create new document (the assigned one is wrapped in place)."""
+        document = create_large_document()
+        document["records"][1000]["details"]["value"] = -1
+        return (document,), {}
+
+    def func(document):
+        """Function for benchmarking."""
+        data.document = document
+
+    benchmark.pedantic(func, setup=setup, rounds=20)
+
+
+def test_to_plain_performance(benchmark):
+    """Testing plain copy of a large document."""
+    data = make_responsive(create_large_document())
+    benchmark(to_plain, data)
+
+
+def test_dumps_performance(benchmark):
+    """Testing JSON of a large document with the encoder for wrappers."""
+    data = make_responsive(create_large_document())
+    benchmark(dumps, data)
+
+
+def test_dumps_of_plain_copy_performance(benchmark):
+    """Testing JSON of a plain copy of a large document (for comparison)."""
+    data = make_responsive(create_large_document())
+    benchmark(lambda: json.dumps(to_plain(data)))
+
+
+def test_dumps_cached_after_change_performance(benchmark):
+    """Testing cached JSON of a large document after one change."""
+    data = make_responsive(create_large_document())
+    cache = JsonCache(data)
+    details = data.records[1000].details
+
+    def func():
+        """Function for benchmarking."""
+        details.value += 1
+        return cache.dumps()
+
+    CHECK.assertEqual(benchmark(func), json.dumps(to_plain(data)))
+
+
+def test_recovery_from_change_log_performance(benchmark):
+    """Testing rebuild of a large document from snapshot and 10000 logged changes."""
+    count_changes = 10000
+    with TemporaryDirectory() as directory:
+        data = make_responsive(create_large_document())
+        log = ChangeLog(data, directory)
+        for index in range(count_changes):
+            data.records[index % 2000].details.value = -index
+        log.close()
+
+        def func():
+            """Function for benchmarking (recording recovered events per second)."""
+            start = time.perf_counter()
+            data = recover(directory)
+            benchmark.extra_info["events_per_second"] = count_changes / (
+                time.perf_counter() - start
+            )
+            return data
+
+        recovered = benchmark.pedantic(func, rounds=10)
+
+    CHECK.assertEqual(recovered.records[1999].details.value, -9999)
+
+
+def test_bytes_per_wrapper():
+    """Testing memory of nested wrappers (one dictionary wrapper per record)."""
+    records = [{"value": index} for index in range(10000)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        data = make_responsive({"records": records})
+        bytes_per_wrapper = (tracemalloc.get_traced_memory()[0] - before) / len(records)
+    finally:
+        tracemalloc.stop()
+
+    CHECK.assertEqual(len(data.records), len(records))
+    # a wrapper with six slots (96 bytes), a tuple with the root as observer (48 bytes)
+    # and the index of the record as key (28 bytes); the options are shared
+    CHECK.assertLess(bytes_per_wrapper, 96 + 48 + 28 + 4)
+
+
+def test_memory_for_replaced_subtrees():
+    """Testing memory staying flat when nested values are replaced repeatedly."""
+    data = make_responsive({"records": create_large_document(100)["records"]})
+    data.add_observer(DoNothingObserver())
+
+    def replace(count: int) -> int:
+        """Replace the records while holding the previous ones (returning traced memory)."""
+        for _ in range(count):
+            previous = data.records
+            data.records = create_large_document(100)["records"]
+            previous[0].details.value = -1
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    try:
+        first = replace(20)
+        second = replace(80)
+    finally:
+        tracemalloc.stop()
+
+    CHECK.assertLess(second - first, 100000)
+
+
+def write_ndjson(directory: str, count: int) -> str:
+    """Write file with records as newline delimited JSON.
+
+    Args:
+        directory (str): directory for the file
+        count (int): number of records
+
+    Returns:
+        path of the file.
+    """
+    path = os.path.join(directory, "events.ndjson")
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(count):
+            file.write(json.dumps({"id": index, "kind": "click", "tags": ["a", "b"]}) + "\n")
+    return path
+
+
+def get_peak_memory(function) -> int:
+    """Get peak of traced memory above the memory after calling the function (extra memory)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    CHECK.assertEqual(len(result["events"]), 10000)
+    return peak - current
+
+
+def test_ingest_peak_memory():
+    """Testing extra memory of ingesting records being proportional to the chunk size."""
+    with TemporaryDirectory() as directory:
+        path = write_ndjson(directory, 10000)
+
+        def ingest_in_chunks(chunk_size: int):
+            """Read and append records chunk by chunk."""
+            data = make_responsive({"events": []})
+            ingest_all(data["events"], read_ndjson(path), chunk_size=chunk_size)
+            return data
+
+        extra = [
+            get_peak_memory(lambda size=size: ingest_in_chunks(size)) for size in (100, 1000, 5000)
+        ]
+
+    CHECK.assertLess(extra[0], extra[1])
+    CHECK.assertLess(extra[1], extra[2])
+    CHECK.assertLess(extra[1], 1000 * 100)
+
+
+def test_ingest_performance(benchmark):
+    """Testing ingestion of 20000 records from a file."""
+    with TemporaryDirectory() as directory:
+        path = write_ndjson(directory, 20000)
+
+        def func():
+            """Function for benchmarking."""
+            data = make_responsive({"events": []})
+            return ingest_all(data["events"], read_ndjson(path))
+
+        CHECK.assertEqual(benchmark.pedantic(func, rounds=5), 20000)
@@ -25,8 +25,36 @@ THE SOFTWARE.
 # pylint: disable=compare-to-zero,no-self-use
 from unittest import TestCase
 
-from responsive.data import make_responsive
-from responsive.wrapper import DictWrapper
+from responsive.constants import Context, Operation
+from responsive.observer import DefaultObserver
+from responsive.wrapper import DictWrapper, ListWrapper, get_options
+
+
+def create_observed_dict(data: dict) -> tuple:
+    """Create dictionary wrapper with an observer.
+
+    Args:
+        data (dict): dictionary to wrap
+
+    Returns:
+        wrapper and observer
+    """
+    wrapper = DictWrapper(data)
+    observer = DefaultObserver()
+    wrapper.add_observer(observer)
+    return wrapper, observer
+
+
+def get_last_kwargs(observer: DefaultObserver) -> dict:
+    """Provide key/value arguments of last notification.
+
+    Args:
+        observer (DefaultObserver): observer with the notifications
+
+    Returns:
+        key/value arguments
+    """
+    return list(observer)[-1][2]
 
 
 class DictWrapperTest(TestCase):
@@ -34,13 +62,13 @@ class DictWrapperTest(TestCase):
 
     def test_len(self):
         """Testing length of dicitionary."""
-        wrapper = DictWrapper({"a": "value a", "b": "value b"}, make_responsive)
+        wrapper = DictWrapper({"a": "value a", "b": "value b"})
         self.assertEqual(len(wrapper), 2)
 
     def test_eq(self):
         """Testing __eq__."""
         data = {"a": "value a", "b": "value b"}
-        wrapper = DictWrapper(data, make_responsive)
+        wrapper = DictWrapper(data)
         self.assertEqual(wrapper, data)
         self.assertNotEqual(wrapper, 1234)
 
@@ -48,7 +76,106 @@ class DictWrapperTest(TestCase):
         """Testing __hash__."""
         data1 = {"a": "value a", "b": "value b"}
         data2 = {"c": "value c", "d": "value d"}
-        wrapper1 = DictWrapper(data1, make_responsive)
-        wrapper2 = DictWrapper(data2, make_responsive)
+        wrapper1 = DictWrapper(data1)
+        wrapper2 = DictWrapper(data2)
         self.assertEqual(hash(wrapper1), hash(tuple(sorted(data1.items()))))
         self.assertEqual(hash(wrapper2), hash(tuple(sorted(data2.items()))))
+
+    def test_no_instance_dictionary(self):
+        """Testing wrapper without instance dictionary and fields named like attributes."""
+        wrapper, observer = create_observed_dict({"a": "value a", "root": 1, "obj": 2})
+        self.assertEqual(type(wrapper).__dictoffset__, 0)
+        wrapper.a = "value b"
+        self.assertEqual(wrapper.obj["a"], "value b")
+
+        for name in ("root", "obj", "lazy", "reconcile", "proxy"):
+            with self.subTest(name=name):
+                setattr(wrapper, name, 5)
+                self.assertEqual(wrapper[name], 5)
+                self.assertEqual(get_last_kwargs(observer)["name"], name)
+        self.assertIsNone(wrapper.root)
+        self.assertIs(wrapper.options, get_options())
+        self.assertEqual(observer.get_count_updates(), 6)
+
+    def test_options_are_keywords(self):
+        """Testing options of the wrapper not to be given as positional arguments."""
+        with self.assertRaises(TypeError):
+            DictWrapper({"a": 1}, lambda value: value)  # pylint: disable=too-many-function-args
+
+    def test_items(self):
+        """Testing access by key including keys which are no identifiers."""
+        wrapper, observer = create_observed_dict({"a": 1, "some key": 2, "items": 3})
+        self.assertEqual(wrapper["some key"], 2)
+        self.assertEqual(wrapper["items"], 3)
+        wrapper["some key"] = 4
+        self.assertEqual(wrapper.obj["some key"], 4)
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_CHANGED)
+        self.assertEqual(list(wrapper.keys()), ["a", "some key", "items"])
+        self.assertEqual(dict(wrapper.items()), {"a": 1, "some key": 4, "items": 3})
+        self.assertTrue("a" in wrapper)
+        self.assertEqual(wrapper.get("b", 5), 5)
+        self.assertRaises(KeyError, wrapper.__getitem__, "b")
+
+    def test_add_and_remove_key(self):
+        """Testing adding and removing keys."""
+        wrapper, observer = create_observed_dict({"a": 1})
+        wrapper["b"] = [2]
+        self.assertIsInstance(wrapper.b, ListWrapper)
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_ADDED)
+        self.assertEqual(get_last_kwargs(observer)["name"], "b")
+        wrapper.c = 3
+        del wrapper["a"]
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_REMOVED)
+        self.assertEqual(get_last_kwargs(observer)["old"], 1)
+        self.assertEqual(wrapper.pop("c"), 3)
+        self.assertEqual(wrapper.setdefault("d", 4), 4)
+        self.assertEqual(wrapper.setdefault("d", 5), 4)
+        self.assertEqual(wrapper, {"b": [2], "d": 4})
+        self.assertEqual(observer.get_count_updates(), 5)
+
+    def test_update(self):
+        """Testing update of many keys with one notification."""
+        wrapper, observer = create_observed_dict({"a": 1})
+        wrapper.update({"a": 2, "b": {"c": 3}}, d=4)
+        self.assertEqual(wrapper, {"a": 2, "b": {"c": 3}, "d": 4})
+        self.assertIsInstance(wrapper.b, DictWrapper)
+        self.assertEqual(observer.get_count_updates(), 1)
+        self.assertEqual(get_last_kwargs(observer)["count"], 3)
+        self.assertEqual(get_last_kwargs(observer)["old"], {"a": 1})
+        self.assertEqual(get_last_kwargs(observer)["new"], {"a": 2, "b": {"c": 3}, "d": 4})
+        wrapper.update({})
+        self.assertEqual(observer.get_count_updates(), 1)
+
+        nested = wrapper.b
+        wrapper.update({"b": wrapper.b})
+        self.assertIs(wrapper.b, nested)
+        self.assertEqual(observer.get_count_updates(), 1)
+        wrapper.update(b=wrapper.b, d=5)
+        self.assertIs(wrapper.b, nested)
+        self.assertEqual(get_last_kwargs(observer)["new"], {"d": 5})
+
+    def test_clear(self):
+        """Testing removal of all keys with one notification."""
+        wrapper, observer = create_observed_dict({"a": 1, "b": 2})
+        wrapper.clear()
+        self.assertEqual(len(wrapper), 0)
+        self.assertEqual(get_last_kwargs(observer)["old"], {"a": 1, "b": 2})
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_REMOVED)
+        wrapper.clear()
+        self.assertEqual(observer.get_count_updates(), 1)
+
+    def test_class(self):
+        """Testing mapping access to the fields of a class."""
+
+        class Book:
+            """Some class."""
+
+            def __init__(self):
+                """Initialize fields."""
+                self.title = "The Big Sleep"
+
+        wrapper, observer = create_observed_dict(Book())
+        wrapper["author"] = "Raymond Chandler"
+        self.assertEqual(wrapper.obj.author, "Raymond Chandler")
+        self.assertEqual(len(wrapper), 2)
+        self.assertEqual(get_last_kwargs(observer)["context"], Context.CLASS)
@@ -0,0 +1,101 @@
+"""Module test_event.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+from unittest import TestCase
+
+from responsive.constants import Context, Operation
+from responsive.data import make_responsive
+from responsive.event import UNSET, ChangeEvent
+from responsive.observer import DefaultObserver, Observer
+
+
+class EventObserver(Observer):
+    """Observer recording the change events."""
+
+    def __init__(self):
+        """Initialize observer."""
+        self.events = []
+
+    def on_change(self, subject, event):
+        """Record change event."""
+        self.events.append(event)
+
+
+class ChangeEventTest(TestCase):
+    """Testing class ChangeEvent."""
+
+    def test_fields(self):
+        """Testing fields being set or not."""
+        event = ChangeEvent(id=1, context=Context.LIST, index=0, old=None, new=2)
+        self.assertIs(event.name, UNSET)
+        self.assertNotIn("name", event)
+        self.assertIn("old", event)
+        self.assertIsNone(event["old"])
+        self.assertRaises(KeyError, event.__getitem__, "name")
+        self.assertEqual(event.get("operation", Operation.VALUE_CHANGED), Operation.VALUE_CHANGED)
+        self.assertEqual(
+            list(event.items()),
+            [("id", 1), ("context", Context.LIST), ("index", 0), ("old", None), ("new", 2)],
+        )
+        self.assertEqual(repr(event.replace(new=3)).count("new=3"), 1)
+        self.assertRaises(AttributeError, setattr, event, "other", 1)
+
+    def test_event_passed_by_reference(self):
+        """Testing same event delivered to all observers of nested data."""
+        data = make_responsive({"some_dict": {"some_list": [1, 2]}})
+        first, second = EventObserver(), EventObserver()
+        data.add_observer(first)
+        data.add_observer(second)
+
+        data.some_dict.some_list[0] = 3
+        self.assertEqual(len(first.events), 1)
+        self.assertIs(first.events[0], second.events[0])
+        self.assertEqual(first.events[0].id, id(data.some_dict.some_list))
+
+    def test_observer_with_key_value_arguments(self):
+        """Testing observer implementing update only (getting key/value arguments)."""
+        data = make_responsive({"value": 1, "other": 0})
+        observer = DefaultObserver()
+        data.add_observer(observer)
+        with data.batch():
+            data.value = 2
+            data.value = 3
+            data.other = 4
+        data.value = 5
+
+        kwargs = list(observer)[0][2]
+        self.assertEqual(kwargs["operation"], Operation.BATCH)
+        self.assertIsInstance(kwargs["events"][0], dict)
+        self.assertEqual(
+            list(observer)[1][2],
+            {
+                "id": id(data),
+                "context": Context.DICTIONARY,
+                "path": ("value",),
+                "name": "value",
+                "old": 3,
+                "new": 5,
+                "operation": Operation.VALUE_CHANGED,
+            },
+        )
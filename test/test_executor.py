@@ -0,0 +1,139 @@
+"""Module test_executor.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import threading
+from unittest import TestCase
+
+from responsive.data import make_responsive
+from responsive.executor import ExecutorSubject
+from responsive.observer import DefaultObserver, Observer
+
+
+class WaitingObserver(Observer):
+    """Observer recording the values of its notifications after waiting for something."""
+
+    def __init__(self, wait=lambda: None):
+        """Initialize observer.
+
+        Args:
+            wait: function called before recording a value (e.g. waiting for an event)
+        """
+        self.wait = wait
+        self.values = []
+        self.threads = set()
+
+    def update(self, subject, *args, **kwargs):
+        """Record value after waiting."""
+        self.wait()
+        self.values.append(kwargs.get("new"))
+        self.threads.add(threading.get_ident())
+
+
+class FailingObserver(Observer):
+    """Observer raising an exception."""
+
+    def update(self, subject, *args, **kwargs):
+        """Raise an exception."""
+        raise ValueError("failing observer")
+
+
+class ExecutorSubjectTest(TestCase):
+    """Testing class ExecutorSubject."""
+
+    def test_order_per_observer(self):
+        """Testing changes of a responsive object delivered in order for each observer."""
+        data = make_responsive({"value": 0})
+        subject = ExecutorSubject(max_workers=4)
+        data.add_observer(subject)
+        released = threading.Event()
+        observers = [WaitingObserver(wait=lambda: released.wait(10.0)) for _ in range(4)]
+        for observer in observers:
+            subject.add_observer(observer)
+
+        for value in range(1, 21):
+            data.value = value
+        # the observers wait in the first notification, so the other ones are still queued
+        self.assertGreaterEqual(subject.get_queue_depth(), 4 * 19)
+        released.set()
+
+        self.assertTrue(subject.flush(timeout=10.0))
+        subject.close()
+        self.assertEqual(subject.get_queue_depth(), 0)
+        self.assertGreaterEqual(subject.get_max_queue_depth(), 20)
+        for observer in observers:
+            self.assertEqual(observer.values, list(range(1, 21)))
+            self.assertNotIn(threading.get_ident(), observer.threads)
+
+    def test_queued_changes_copied(self):
+        """Testing a queued change not showing a later change of the assigned list."""
+        data = make_responsive({})
+        subject = ExecutorSubject()
+        data.add_observer(subject)
+        released = threading.Event()
+        observer = WaitingObserver(wait=lambda: released.wait(10.0))
+        subject.add_observer(observer)
+
+        data["f"] = [1]
+        data.f.append(2)
+        released.set()
+        subject.close()
+        self.assertEqual(observer.values, [[1], 2])
+
+    def test_observers_in_parallel(self):
+        """Testing observers not waiting for each other (all wait for each other at once)."""
+        subject = ExecutorSubject(max_workers=10)
+        barrier = threading.Barrier(10, timeout=10.0)
+        observers = [WaitingObserver(wait=barrier.wait) for _ in range(10)]
+        for observer in observers:
+            subject.add_observer(observer)
+
+        subject.notify(new=1)
+        self.assertLessEqual(subject.get_queue_depth(observers[0]), 1)
+        subject.close()
+        self.assertEqual(subject.get_errors(), [])
+        self.assertTrue(all(observer.values == [1] for observer in observers))
+
+    def test_errors_and_filter(self):
+        """Testing exceptions of observers being collected and interests being used."""
+        subject = ExecutorSubject()
+        observer = DefaultObserver()
+        observer.set_interests({"name": "a"})
+        subject.add_observer(FailingObserver())
+        subject.add_observer(observer)
+
+        subject.notify(name="a")
+        subject.notify(name="b")
+        subject.close()
+        self.assertEqual(observer.get_count_updates(), 1)
+        self.assertEqual(len(subject.get_errors()), 2)
+        self.assertEqual(subject.get_queue_depth(observer), 0)
+
+    def test_errors_bounded(self):
+        """Testing the last exceptions of observers being kept only."""
+        subject = ExecutorSubject(max_errors=2)
+        subject.add_observer(FailingObserver())
+        for value in range(5):
+            subject.notify(new=value)
+        subject.close()
+        self.assertEqual(len(subject.get_errors()), 2)
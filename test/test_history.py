@@ -0,0 +1,204 @@
+"""Module test_history.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+from unittest import TestCase
+
+from responsive.data import make_responsive, to_plain
+from responsive.history import History, estimate_size
+from responsive.observer import DefaultObserver
+
+
+def create_data() -> dict:
+    """Create test data."""
+    return {
+        "some_str": "a",
+        "some_list": [1, 2, {"inner_str": "b", "inner_list": [3, 4]}],
+        "some_dict": {"some_int": 5},
+    }
+
+
+CHANGES = [
+    lambda data: setattr(data, "some_str", "x"),
+    lambda data: data.some_dict.__setitem__("new", [1]),
+    lambda data: data.__delitem__("some_dict"),
+    lambda data: setattr(data, "some_dict", {"other": {"deep": 1}}),
+    lambda data: data.some_list[2].inner_list.__setitem__(0, 9),
+    lambda data: data.some_list[2].inner_list.__setitem__(-1, 9),
+    lambda data: data.some_list.insert(1, {"x": 1}),
+    lambda data: data.some_list.__delitem__(2),
+    lambda data: data.some_list.append(7),
+    lambda data: data.some_list.extend([7, 8]),
+    lambda data: data.some_list.__setitem__(slice(0, 2), [5, 6, 7]),
+    lambda data: data.some_list.__delitem__(slice(0, 2)),
+    lambda data: data.some_list.sort(key=str, reverse=True),
+    lambda data: data.some_list.reverse(),
+    lambda data: data.some_list.clear(),
+    lambda data: data.some_dict.update({"some_int": 6, "other": 7}),
+    lambda data: data.some_dict.clear(),
+]
+
+
+class TestHistory(TestCase):
+    """Testing class History."""
+
+    def assert_undo_redo(self, data, history, before):
+        """Check undo and redo of last step."""
+        after = to_plain(data)
+        self.assertNotEqual(after, before)
+        self.assertTrue(history.undo())
+        self.assertEqual(to_plain(data), before)
+        self.assertTrue(history.redo())
+        self.assertEqual(to_plain(data), after)
+        self.assertTrue(history.undo())
+        self.assertEqual(to_plain(data), before)
+
+    def test_changes(self):
+        """Testing undo and redo of the different changes."""
+        for lazy in (False, True):
+            for number, change in enumerate(CHANGES):
+                with self.subTest(number=number, lazy=lazy):
+                    data = make_responsive(create_data(), lazy=lazy)
+                    history = History(data)
+                    change(data)
+                    self.assert_undo_redo(data, history, create_data())
+
+    def test_undo_redo_all(self):
+        """Testing undo of all changes in reverse order and redo of them."""
+        data = make_responsive(create_data())
+        history = History(data)
+        states = [create_data()]
+        for change in CHANGES[4:]:
+            change(data)
+            states.append(to_plain(data))
+
+        self.assertEqual(history.get_count_steps(), (len(states) - 1, 0))
+        for state in reversed(states[:-1]):
+            self.assertTrue(history.undo())
+            self.assertEqual(to_plain(data), state)
+        self.assertFalse(history.undo())
+
+        for state in states[1:]:
+            self.assertTrue(history.redo())
+            self.assertEqual(to_plain(data), state)
+        self.assertFalse(history.redo())
+
+    def test_undo_batch_with_shifted_values(self):
+        """Testing undo of a batch changing values around a change of the structure."""
+        data = make_responsive({"values": [{"x": 0}, {"x": 0}, {"x": 0}]})
+        history = History(data)
+        with data.batch():
+            data["values"][1].x = 1
+            data["values"].insert(0, {"x": 9})
+            data["values"][2].x = 2
+        state = to_plain(data)
+
+        self.assertTrue(history.undo())
+        self.assertEqual(to_plain(data), {"values": [{"x": 0}, {"x": 0}, {"x": 0}]})
+        self.assertTrue(history.redo())
+        self.assertEqual(to_plain(data), state)
+
+    def test_new_change_clears_redo(self):
+        """Testing that a new change after undo clears the steps to redo."""
+        data = make_responsive(create_data())
+        history = History(data)
+        data.some_str = "x"
+        history.undo()
+        self.assertTrue(history.can_redo())
+        data.some_str = "y"
+        self.assertFalse(history.can_redo())
+        self.assertEqual(history.get_count_steps(), (1, 0))
+
+    def test_steps(self):
+        """Testing grouping of changes into steps."""
+        data = make_responsive(create_data())
+        history = History(data)
+        with history.step():
+            data.some_str = "x"
+            with history.step():
+                data.some_list.append(3)
+            data.some_str = "y"
+        with data.batch():
+            data.some_dict.some_int = 6
+            del data.some_list[0]
+
+        self.assertEqual(history.get_count_steps(), (2, 0))
+        history.undo()
+        self.assertEqual(to_plain(data)["some_dict"], {"some_int": 5})
+        self.assertEqual(to_plain(data)["some_list"][0], 1)
+        history.undo()
+        self.assertEqual(to_plain(data), create_data())
+
+    def test_one_notification(self):
+        """Testing that undo and redo of a step is one notification."""
+        data = make_responsive(create_data())
+        history = History(data)
+        with history.step():
+            for value in range(10):
+                data.some_list.append(value)
+
+        observer = DefaultObserver()
+        data.add_observer(observer)
+        history.undo()
+        history.redo()
+        self.assertEqual(observer.get_count_updates(), 2)
+
+    def test_limit_steps(self):
+        """Testing limit for the number of steps."""
+        data = make_responsive({"value": 0})
+        history = History(data, max_steps=3)
+        for value in range(1, 10):
+            data.value = value
+
+        self.assertEqual(history.get_count_steps(), (3, 0))
+        while history.undo():
+            pass
+        self.assertEqual(data.value, 6)
+
+    def test_limit_bytes(self):
+        """Testing limit for the estimated bytes of all steps."""
+        data = make_responsive({"text": ""})
+        history = History(data, max_bytes=5000)
+        for value in range(100):
+            data.text = str(value) * 100
+
+        self.assertLessEqual(history.get_size(), 5000)
+        self.assertGreater(history.get_count_steps()[0], 0)
+        self.assertLess(history.get_count_steps()[0], 100)
+
+        history.clear()
+        self.assertEqual(history.get_size(), 0)
+        self.assertFalse(history.can_undo())
+
+    def test_close(self):
+        """Testing that closed history does not record changes."""
+        data = make_responsive(create_data())
+        history = History(data)
+        history.close()
+        data.some_str = "x"
+        self.assertFalse(history.can_undo())
+
+    def test_estimate_size(self):
+        """Testing estimation of bytes."""
+        self.assertGreater(estimate_size({"a": [1, 2, 3]}), estimate_size({"a": []}))
+        self.assertGreater(estimate_size("a" * 1000), 1000)
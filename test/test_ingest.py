@@ -0,0 +1,92 @@
+"""Module test_ingest.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from responsive.constants import Operation
+from responsive.data import make_responsive, to_plain
+from responsive.ingest import ingest, ingest_all, read_ndjson
+from responsive.observer import DefaultObserver
+from responsive.wrapper import DictWrapper
+
+
+class TestIngest(TestCase):
+    """Testing ingestion of records."""
+
+    def test_read_ndjson_file(self):
+        """Testing reading records from a file (by path and as open file)."""
+        records = [{"id": index, "tags": ["a"]} for index in range(10)]
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.ndjson")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("\n".join(json.dumps(record) for record in records) + "\n\n")
+
+            self.assertEqual(list(read_ndjson(path)), records)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(list(read_ndjson(file)), records)
+
+    def test_read_ndjson_invalid(self):
+        """Testing error for an invalid line."""
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            list(read_ndjson(['{"a": 1}', '{"a": ']))
+
+    def test_ingest(self):
+        """Testing records appended in chunks with one notification per chunk."""
+        observer = DefaultObserver()
+        data = make_responsive({"events": [{"id": -1}]})
+        data.add_observer(observer)
+        records = ({"id": index, "tags": ["a"]} for index in range(25))
+
+        processed = []
+        for indices in ingest(data["events"], records, chunk_size=10):
+            processed.extend(data["events"][index].id for index in indices)
+
+        self.assertEqual(processed, list(range(25)))
+        self.assertEqual(len(data["events"]), 26)
+        self.assertIsInstance(data["events"][25], DictWrapper)
+        self.assertEqual(data["events"][25].get_path(), ("events", 25))
+        self.assertEqual(
+            [(kwargs["index"], kwargs["count"], kwargs["operation"]) for _, _, kwargs in observer],
+            [
+                (1, 10, Operation.VALUE_ADDED),
+                (11, 10, Operation.VALUE_ADDED),
+                (21, 5, Operation.VALUE_ADDED),
+            ],
+        )
+
+    def test_ingest_lazy(self):
+        """Testing records appended to a lazy responsive list."""
+        data = make_responsive({"events": []}, lazy=True)
+        count = ingest_all(data["events"], read_ndjson(['{"id": 1}', '{"id": 2}']), 1)
+        self.assertEqual(count, 2)
+        self.assertEqual(to_plain(data), {"events": [{"id": 1}, {"id": 2}]})
+
+    def test_invalid_chunk_size(self):
+        """Testing error for a chunk size which is not positive."""
+        data = make_responsive({"events": []})
+        with self.assertRaises(ValueError):
+            ingest_all(data["events"], [], chunk_size=0)
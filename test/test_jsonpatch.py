@@ -0,0 +1,167 @@
+"""Module test_jsonpatch.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pylint: disable=compare-to-zero,no-self-use
+import json
+from copy import deepcopy
+from io import StringIO
+from unittest import TestCase
+
+from responsive.constants import Operation
+from responsive.data import make_responsive, to_plain
+from responsive.jsonpatch import JsonPatchObserver, apply_patch
+from responsive.observer import DefaultObserver
+
+
+def create_data() -> dict:
+    """Create test data."""
+    return {
+        "title": "The Big Sleep",
+        "authors": ["Raymond Chandler"],
+        "details": {"pages": 231, "tags": ["crime", "noir"]},
+    }
+
+
+class JsonPatchTest(TestCase):
+    """Testing JSON patch export and import."""
+
+    def test_round_trip(self):
+        """Testing patches of changes applied to a copy of the data."""
+        patches = []
+        data = make_responsive(create_data())
+        mirror = make_responsive(create_data())
+        data.add_observer(JsonPatchObserver(callback=patches.append))
+
+        data.title = "Farewell, My Lovely"
+        data.authors.append("Someone Else")
+        data.authors.insert(0, {"name": "x"})
+        data.authors[0].name = "y"
+        data.details["year"] = 1940
+        data.details.tags.extend(["classic", "novel"])
+        del data.details.tags[0:2]
+        data.details.tags[0:1] = ["a", "b", "c"]
+        data.details.tags.sort(reverse=True)
+        data.details.update({"pages": 275, "publisher": "Knopf"})
+        del data.details["year"]
+        data.authors.pop(0)
+        data.details = {"pages": 1, "other": {"a/b": 1, "c~d": 2}}
+        data.details.other.clear()
+        with data.batch():
+            data.title = "The Long Goodbye"
+            data.authors.remove("Someone Else")
+
+        for patch in patches:
+            apply_patch(mirror, patch)
+        self.assertEqual(to_plain(mirror), to_plain(data))
+
+    def test_batch_with_shifted_values(self):
+        """Testing patch of a batch applied in order around a change of the structure."""
+        patches = []
+        data = make_responsive({"values": [{"x": 0}, {"x": 0}, {"x": 0}]})
+        mirror = make_responsive({"values": [{"x": 0}, {"x": 0}, {"x": 0}]})
+        data.add_observer(JsonPatchObserver(callback=patches.append))
+        with data.batch():
+            data["values"][1].x = 1
+            data["values"].insert(0, {"x": 9})
+            data["values"][2].x = 2
+
+        for patch in patches:
+            apply_patch(mirror, patch)
+        self.assertEqual(to_plain(mirror), to_plain(data))
+
+    def test_export_to_stream(self):
+        """Testing patches written as lines of JSON collecting some operations."""
+        stream = StringIO()
+        data = make_responsive(create_data())
+        observer = JsonPatchObserver(stream=stream, batch_size=2)
+        data.add_observer(observer)
+
+        data.title = "a"
+        data.details.tags.append("b")
+        data.details.pages = 1
+        observer.flush()
+        observer.flush()
+
+        self.assertEqual(
+            [json.loads(line) for line in stream.getvalue().splitlines()],
+            [
+                [
+                    {"op": "replace", "path": "/title", "value": "a"},
+                    {"op": "add", "path": "/details/tags/2", "value": "b"},
+                ],
+                [{"op": "replace", "path": "/details/pages", "value": 1}],
+            ],
+        )
+        self.assertRaises(ValueError, JsonPatchObserver)
+
+    def test_apply_with_one_notification(self):
+        """Testing apply of a patch with all operations (RFC 6902) notified once."""
+        data = make_responsive(create_data())
+        observer = DefaultObserver()
+        data.add_observer(observer)
+
+        apply_patch(
+            data,
+            [
+                {"op": "test", "path": "/details/pages", "value": 231},
+                {"op": "replace", "path": "/title", "value": "Playback"},
+                {"op": "add", "path": "/authors/-", "value": "b"},
+                {"op": "add", "path": "/authors/0", "value": "a"},
+                {"op": "remove", "path": "/details/tags/0"},
+                {"op": "copy", "from": "/details/tags", "path": "/tags"},
+                {"op": "move", "from": "/details/pages", "path": "/pages"},
+            ],
+        )
+
+        self.assertEqual(
+            to_plain(data),
+            {
+                "title": "Playback",
+                "authors": ["a", "Raymond Chandler", "b"],
+                "details": {"tags": ["noir"]},
+                "tags": ["noir"],
+                "pages": 231,
+            },
+        )
+        self.assertEqual(observer.get_count_updates(), 1)
+        self.assertEqual(list(observer)[0][2]["operation"], Operation.BATCH)
+
+    def test_apply_invalid_operations(self):
+        """Testing invalid operations (failing test, missing path, invalid index)."""
+        original = create_data()
+        data = make_responsive(deepcopy(original))
+        for operation in [
+            {"op": "test", "path": "/title", "value": "x"},
+            {"op": "replace", "path": "/missing", "value": 1},
+            {"op": "remove", "path": "/missing/value"},
+            {"op": "add", "path": "/authors/2", "value": 1},
+            {"op": "add", "path": "/authors/01", "value": 1},
+            {"op": "add", "path": "", "value": 1},
+            {"op": "add", "path": "title", "value": 1},
+            {"op": "add", "path": "/title"},
+            {"op": "move", "path": "/title"},
+            {"op": "unknown", "path": "/title"},
+        ]:
+            self.assertRaises(ValueError, apply_patch, data, [operation])
+        self.assertEqual(to_plain(data), original)
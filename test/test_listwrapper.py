@@ -25,8 +25,36 @@ THE SOFTWARE.
 # pylint: disable=compare-to-zero,no-self-use
 from unittest import TestCase
 
-from responsive.data import make_responsive
-from responsive.wrapper import ListWrapper
+from responsive.constants import Operation
+from responsive.observer import DefaultObserver
+from responsive.wrapper import DictWrapper, ListWrapper
+
+
+def create_observed_list(data: list) -> tuple:
+    """Create list wrapper with an observer.
+
+    Args:
+        data (list): list to wrap
+
+    Returns:
+        wrapper and observer
+    """
+    wrapper = ListWrapper(data)
+    observer = DefaultObserver()
+    wrapper.add_observer(observer)
+    return wrapper, observer
+
+
+def get_last_kwargs(observer: DefaultObserver) -> dict:
+    """Provide key/value arguments of last notification.
+
+    Args:
+        observer (DefaultObserver): observer with the notifications
+
+    Returns:
+        key/value arguments
+    """
+    return list(observer)[-1][2]
 
 
 class ListWrapperTest(TestCase):
@@ -34,13 +62,13 @@ class ListWrapperTest(TestCase):
 
     def test_len(self):
         """Testing length of list."""
-        wrapper = ListWrapper([1, 2, 3, 4], make_responsive)
+        wrapper = ListWrapper([1, 2, 3, 4])
         self.assertEqual(len(wrapper), 4)
 
     def test_set_and_get_by_index(self):
         """Testing __setitem__ and __getitem__."""
         data = [1, 2, 3, 4]
-        wrapper = ListWrapper([1, 2, 3, 4], make_responsive)
+        wrapper = ListWrapper([1, 2, 3, 4])
         wrapper[2] = 9
         self.assertEqual(wrapper[2], 9)
         self.assertEqual(data, [1, 2, 3, 4])
@@ -48,14 +76,110 @@ class ListWrapperTest(TestCase):
     def test_eq(self):
         """Testing __eq__."""
         data = [1, 2, 3, 4]
-        wrapper = ListWrapper(data, make_responsive)
+        wrapper = ListWrapper(data)
         self.assertEqual(wrapper, data)
         self.assertNotEqual(wrapper, 1234)
 
     def test_iter(self):
         """Testing in and not in."""
         data = [1, 2, 3, 4]
-        wrapper = ListWrapper(data, make_responsive)
+        wrapper = ListWrapper(data)
         self.assertTrue(2 in wrapper)
         self.assertTrue(5 not in wrapper)
         self.assertEqual(list(wrapper), data)
+
+    def test_no_instance_dictionary(self):
+        """Testing wrapper without instance dictionary."""
+        wrapper = ListWrapper([1, 2, 3, 4])
+        self.assertFalse(hasattr(wrapper, "__dict__"))
+        self.assertRaises(AttributeError, setattr, wrapper, "other", 1)
+
+    def test_update(self):
+        """Testing update forwarding a notification like on_notify."""
+        wrapper, observer = create_observed_list([1, 2])
+        wrapper.update(None, name="a")
+        self.assertEqual(get_last_kwargs(observer), {"name": "a"})
+
+    def test_extend(self):
+        """Testing extend with one notification for all values."""
+        wrapper, observer = create_observed_list([1, 2])
+        wrapper.extend(range(3, 6))
+        self.assertEqual(wrapper, [1, 2, 3, 4, 5])
+        self.assertEqual(observer.get_count_updates(), 1)
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_ADDED)
+        self.assertEqual(get_last_kwargs(observer)["index"], 2)
+        self.assertEqual(get_last_kwargs(observer)["count"], 3)
+        self.assertEqual(get_last_kwargs(observer)["new"], [3, 4, 5])
+
+    def test_extend_nothing(self):
+        """Testing extend with no values (no notification)."""
+        wrapper, observer = create_observed_list([1, 2])
+        wrapper.extend([])
+        self.assertEqual(observer.get_count_updates(), 0)
+
+    def test_append_and_insert(self):
+        """Testing append and insert wrapping the value and providing the index."""
+        wrapper, observer = create_observed_list([1, 2])
+        wrapper.append({"a": 1})
+        self.assertIsInstance(wrapper[2], DictWrapper)
+        self.assertEqual(get_last_kwargs(observer)["index"], 2)
+        wrapper.insert(-1, 3)
+        self.assertEqual(wrapper, [1, 2, 3, {"a": 1}])
+        self.assertEqual(get_last_kwargs(observer)["index"], 2)
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_ADDED)
+
+    def test_pop_and_remove(self):
+        """Testing pop and remove."""
+        wrapper, observer = create_observed_list([1, 2, 3, 4])
+        self.assertEqual(wrapper.pop(), 4)
+        self.assertEqual(get_last_kwargs(observer)["index"], 3)
+        self.assertEqual(get_last_kwargs(observer)["old"], 4)
+        wrapper.remove(2)
+        self.assertEqual(wrapper, [1, 3])
+        self.assertEqual(get_last_kwargs(observer)["index"], 1)
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_REMOVED)
+        self.assertRaises(ValueError, wrapper.remove, 5)
+        self.assertEqual(observer.get_count_updates(), 2)
+
+    def test_delete_slice_and_clear(self):
+        """Testing deletion of a range of values."""
+        wrapper, observer = create_observed_list([1, 2, 3, 4, 5])
+        del wrapper[1:3]
+        self.assertEqual(wrapper, [1, 4, 5])
+        self.assertEqual(get_last_kwargs(observer)["index"], 1)
+        self.assertEqual(get_last_kwargs(observer)["count"], 2)
+        self.assertEqual(get_last_kwargs(observer)["old"], [2, 3])
+        wrapper.clear()
+        self.assertEqual(wrapper, [])
+        self.assertEqual(get_last_kwargs(observer)["count"], 3)
+        self.assertEqual(observer.get_count_updates(), 2)
+
+    def test_set_slice(self):
+        """Testing assignment of a range of values."""
+        wrapper, observer = create_observed_list([1, 2, 3, 4])
+        wrapper[1:3] = [5, 6]
+        self.assertEqual(wrapper, [1, 5, 6, 4])
+        self.assertEqual(get_last_kwargs(observer)["operation"], Operation.VALUE_CHANGED)
+        self.assertEqual(get_last_kwargs(observer)["old"], [2, 3])
+        self.assertEqual(get_last_kwargs(observer)["new"], [5, 6])
+        self.assertEqual(observer.get_count_updates(), 1)
+
+    def test_sort_and_reverse(self):
+        """Testing sort and reverse with one notification each."""
+        wrapper, observer = create_observed_list([3, 1, 2])
+        wrapper.sort()
+        self.assertEqual(wrapper, [1, 2, 3])
+        self.assertEqual(get_last_kwargs(observer)["old"], [3, 1, 2])
+        wrapper.reverse()
+        self.assertEqual(wrapper, [3, 2, 1])
+        wrapper.sort(key=lambda value: value % 3, reverse=True)
+        self.assertEqual(wrapper, [2, 1, 3])
+        self.assertEqual(observer.get_count_updates(), 3)
+
+    def test_inplace_add(self):
+        """Testing += being an extend."""
+        wrapper, observer = create_observed_list([1])
+        wrapper += [2, 3]
+        self.assertIsInstance(wrapper, ListWrapper)
+        self.assertEqual(wrapper, [1, 2, 3])
+        self.assertEqual(observer.get_count_updates(), 1)
@@ -22,9 +22,21 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
+import gc
 from unittest import TestCase
 
-from responsive.observer import DefaultObserver, Observer, OutputObserver
+from responsive.constants import Operation
+from responsive.data import make_responsive
+from responsive.observer import (
+    ChangeObserver,
+    DefaultObserver,
+    Observer,
+    OutputObserver,
+    RingBufferObserver,
+    ScalarRingBufferObserver,
+    WeakObserver,
+    get_changes,
+)
 from responsive.subject import Subject
 
 
@@ -36,6 +48,30 @@ class ObserverTest(TestCase):
         observer = Observer()
         self.assertRaises(NotImplementedError, observer.update, None)
 
+    def test_change_observer(self):
+        """Testing change observer getting notifications and events as changes."""
+
+        class Collector(ChangeObserver):
+            """Collecting the single changes."""
+
+            def __init__(self):
+                self.changes = []
+
+            def on_change(self, subject, event):
+                self.changes.extend(get_changes(event))
+
+        observer = Collector()
+        self.assertRaises(NotImplementedError, ChangeObserver().on_change, None, {})
+        observer.update(None, operation=Operation.VALUE_CHANGED, name="a", new=1)
+        data = make_responsive({"a": 1, "b": 2})
+        data.add_observer(observer)
+        with data.batch():
+            data.a = 2
+            data.b = 3
+
+        self.assertEqual([change["name"] for change in observer.changes], ["a", "a", "b"])
+        self.assertEqual([change["new"] for change in observer.changes], [1, 2, 3])
+
     def test_output_observer(self):
         """Testing output observer."""
         messages = []
@@ -63,3 +99,85 @@ class ObserverTest(TestCase):
 
         observer.clear()
         self.assertEqual(observer.get_count_updates(), 0)
+
+    def test_ring_buffer_observer(self):
+        """Testing ring buffer observer keeping the last updates only."""
+        observer = RingBufferObserver(capacity=3)
+        subject = Subject()
+        subject.add_observer(observer)
+        for value in range(5):
+            subject.notify(value=value)
+
+        self.assertEqual([kwargs["value"] for _, _, kwargs in observer], [2, 3, 4])
+        self.assertEqual([kwargs["value"] for _, _, kwargs in observer.get_last(2)], [3, 4])
+        self.assertEqual(observer.get_last(0), [])
+        self.assertEqual(observer.get_count_updates(), 3)
+        self.assertEqual(observer.get_count_total(), 5)
+        self.assertEqual(observer.get_count_dropped(), 2)
+        self.assertEqual(observer.get_capacity(), 3)
+
+        observer.clear()
+        self.assertEqual(observer.get_count_updates(), 0)
+        self.assertEqual(observer.get_count_total(), 5)
+        self.assertRaises(ValueError, RingBufferObserver, 0)
+
+    def test_ring_buffer_observer_with_interests(self):
+        """Testing ring buffer observer with interests (as the default observer)."""
+        observer = RingBufferObserver(capacity=3)
+        observer.set_interests({"name": "a"})
+        data = make_responsive({"a": 0, "b": 0})
+        data.add_observer(observer)
+        data.a = 1
+        data.b = 1
+        self.assertEqual(observer.get_count_total(), 1)
+
+    def test_scalar_ring_buffer_observer(self):
+        """Testing ring buffer observer keeping one numeric field in an array."""
+        observer = ScalarRingBufferObserver(capacity=3)
+        data = make_responsive({"value": 0, "text": ""})
+        data.add_observer(observer)
+        for value in range(5):
+            data.value = value
+        data.text = "hello"
+        with data.batch():
+            data.value = 10
+            data.text = "world"
+
+        self.assertEqual(list(observer), [3.0, 4.0, 10.0])
+        self.assertEqual(observer.get_last(1), [10.0])
+        self.assertEqual(observer.get_count_total(), 6)
+        self.assertEqual(observer.get_count_dropped(), 3)
+        self.assertEqual(observer.get_count_ignored(), 2)
+
+        observer.clear()
+        self.assertEqual(list(observer), [])
+        data.value = 11
+        self.assertEqual(list(observer), [11.0])
+
+    def test_scalar_ring_buffer_observer_with_integers(self):
+        """Testing values not fitting the type of the array being ignored."""
+        observer = ScalarRingBufferObserver(capacity=2, name="value", typecode="b")
+        observer.update(None, value=1)
+        observer.update(None, value=1000)
+        observer.update(None, value=2.5)
+        self.assertEqual(list(observer), [1])
+        self.assertEqual(observer.get_count_ignored(), 2)
+
+    def test_weak_observer(self):
+        """Testing weak observer forwarding while the observer is alive."""
+        data = make_responsive({"value": 0})
+        observer = DefaultObserver()
+        observer.set_interests({"name": "value"})
+        weak_observer = WeakObserver(observer)
+        data.add_observer(weak_observer)
+
+        data.value = 1
+        data.other = 2
+        self.assertEqual(observer.get_count_updates(), 1)
+        self.assertIs(weak_observer.get_observer(), observer)
+
+        del observer
+        gc.collect()
+        self.assertIsNone(weak_observer.get_observer())
+        data.value = 2
+        self.assertFalse(data.has_observer(weak_observer))
@@ -0,0 +1,138 @@
+"""Module test_path.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pylint: disable=compare-to-zero,no-self-use
+from unittest import TestCase
+
+from responsive.data import make_responsive
+from responsive.observer import DefaultObserver
+from responsive.path import PathTrie, parse_pattern
+
+
+class PathTest(TestCase):
+    """Testing path patterns."""
+
+    def test_parse_pattern(self):
+        """Testing parsing of text patterns."""
+        self.assertEqual(parse_pattern("orders[*].status"), ("orders", "*", "status"))
+        self.assertEqual(parse_pattern("a.**"), ("a", "**"))
+        self.assertEqual(parse_pattern("a['some key'][12]"), ("a", "some key", 12))
+        self.assertEqual(parse_pattern(""), ())
+        self.assertEqual(parse_pattern(("a", 1)), ("a", 1))
+        self.assertRaises(ValueError, parse_pattern, "a..b")
+        self.assertRaises(ValueError, parse_pattern, "a[1")
+
+    def test_match(self):
+        """Testing matching of paths with exact names, wildcards and subtrees."""
+        trie = PathTrie()
+        observers = [DefaultObserver() for _ in range(5)]
+        trie.add(("orders", 1, "status"), 0, observers[0])
+        trie.add(("orders", "*", "status"), 1, observers[1])
+        trie.add(("orders", "**"), 2, observers[2])
+        trie.add(("**", "status"), 3, observers[3])
+        trie.add(("customers",), 4, observers[4])
+
+        self.assertEqual(sorted(trie.match(("orders", 1, "status"))), [0, 1, 2, 3])
+        self.assertEqual(sorted(trie.match(("orders", 2, "status"))), [1, 2, 3])
+        self.assertEqual(sorted(trie.match(("orders", 2, "amount"))), [2])
+        self.assertEqual(sorted(trie.match(("orders",))), [0, 1, 2])
+        self.assertEqual(sorted(trie.match(("customers", 1, "status"))), [3])
+        self.assertEqual(sorted(trie.match(("customers",))), [4])
+        self.assertEqual(sorted(trie.match(("products", 1))), [])
+
+    def test_match_shifted(self):
+        """Testing matching of the indices of a list from the changed one on."""
+        trie = PathTrie()
+        observers = [DefaultObserver() for _ in range(4)]
+        trie.add(("orders", 1, "status"), 0, observers[0])
+        trie.add(("orders", 3, "status"), 1, observers[1])
+        trie.add(("orders", "*", "status"), 2, observers[2])
+        trie.add(("orders", "**"), 3, observers[3])
+
+        self.assertEqual(sorted(trie.match(("orders", 2))), [2, 3])
+        self.assertEqual(sorted(trie.match(("orders", 2), shifted=True)), [1, 2, 3])
+        self.assertEqual(sorted(trie.match(("orders", 0), shifted=True)), [0, 1, 2, 3])
+        self.assertEqual(sorted(trie.match(("orders", 4), shifted=True)), [2, 3])
+
+    def test_add_and_remove(self):
+        """Testing removal of a pattern (removing nodes not used anymore)."""
+        trie = PathTrie()
+        observer = DefaultObserver()
+        trie.add(("a", "b"), 0, observer)
+        trie.add(("a", "b"), 1, observer)
+        self.assertEqual(len(trie), 1)
+        self.assertRaises(ValueError, trie.remove, ("a",), observer)
+        self.assertRaises(ValueError, trie.remove, ("a", "c"), observer)
+        trie.remove(("a", "b"), observer)
+        self.assertEqual(len(trie), 0)
+        self.assertEqual(trie.root.children, {})
+
+    def test_path_observer(self):
+        """Testing observers of responsive data registered for path patterns."""
+        data = make_responsive({"orders": [{"status": "new", "amount": 1} for _ in range(3)]})
+        status_observer, order_observer, observer = (DefaultObserver() for _ in range(3))
+        data.add_path_observer("orders[*].status", status_observer)
+        data.add_path_observer("orders[1].**", order_observer)
+        data.add_observer(observer)
+
+        data.orders[0].status = "paid"
+        data.orders[1].amount = 2
+        data.orders[2].status = "paid"
+        data.orders.append({"status": "new"})
+        self.assertEqual(status_observer.get_count_updates(), 3)
+        self.assertEqual(order_observer.get_count_updates(), 1)
+        self.assertEqual(observer.get_count_updates(), 4)
+
+        data.remove_path_observer("orders[*].status", status_observer)
+        data.orders[0].status = "sent"
+        self.assertEqual(status_observer.get_count_updates(), 3)
+        self.assertRaises(ValueError, data.remove_path_observer, "orders", status_observer)
+
+    def test_path_observer_with_shifted_values(self):
+        """Testing observer of an index of a list getting sort, insert and delete."""
+        data = make_responsive({"orders": [{"status": str(index)} for index in range(5)]})
+        observer, other_observer = DefaultObserver(), DefaultObserver()
+        data.add_path_observer("orders[3].status", observer)
+        data.add_path_observer("orders[0].status", other_observer)
+
+        data.orders.sort(key=lambda order: order["status"], reverse=True)
+        data.orders.insert(0, {"status": "new"})
+        del data.orders[0]
+        data.orders.insert(3, {"status": "new"})
+        data.orders.append({"status": "new"})
+        self.assertEqual(observer.get_count_updates(), 4)
+        self.assertEqual(other_observer.get_count_updates(), 3)
+
+    def test_path_observer_with_batch(self):
+        """Testing path observer getting a batch with one matching change."""
+        data = make_responsive({"a": {"value": 1}, "b": {"value": 2}})
+        observer = DefaultObserver()
+        data.add_path_observer("b.value", observer)
+        with data.batch():
+            data.a.value = 3
+            data.b.value = 4
+        with data.batch():
+            data.a.value = 5
+            data.a.value = 6
+        self.assertEqual(observer.get_count_updates(), 1)
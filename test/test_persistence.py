@@ -0,0 +1,146 @@
+"""Module test_persistence.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pylint: disable=compare-to-zero,no-self-use
+import os
+
+# pickled records are written by the test itself only
+import pickle  # nosec B403
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from responsive.constants import FsyncPolicy
+from responsive.data import make_responsive, to_plain
+from responsive.observer import DefaultObserver
+from responsive.persistence import LOG_FILENAME, RECORD_HEADER, ChangeLog, recover
+
+
+def create_data() -> dict:
+    """Create test data."""
+    return {"title": "a", "tags": ["b", "c"], "details": {"pages": 1, "items": [{"d": 2}]}}
+
+
+def change_data(data: object) -> None:
+    """Change test data in many ways."""
+    data.title = "e"
+    data.tags.append("f")
+    data.tags.extend(["g", "h"])
+    del data.tags[0:2]
+    data.tags.sort(reverse=True)
+    data.details["items"][0].d = 3
+    data.details.update({"pages": 2, "year": 1939})
+    with data.batch():
+        data.title = "i"
+        data.details["items"].insert(0, {"d": 4})
+    del data.details["year"]
+    data.details = {"pages": 5}
+
+
+class ChangeLogTest(TestCase):
+    """Testing change log and recovery."""
+
+    def test_recover(self):
+        """Testing data rebuilt from snapshot and changes."""
+        with TemporaryDirectory() as directory:
+            data = make_responsive(create_data())
+            log = ChangeLog(data, directory, fsync_policy=FsyncPolicy.ALWAYS, group_size=3)
+            change_data(data)
+            log.close()
+
+            recovered = recover(directory)
+            self.assertEqual(to_plain(recovered), to_plain(data))
+            self.assertFalse(data.has_observer(log))
+
+            observer = DefaultObserver()
+            recovered.add_observer(observer)
+            recovered.title = "j"
+            self.assertEqual(observer.get_count_updates(), 1)
+
+    def test_recover_batch_with_shifted_values(self):
+        """Testing recovery of a batch changing values around a change of the structure."""
+        with TemporaryDirectory() as directory:
+            data = make_responsive({"values": [{"x": 0}, {"x": 0}, {"x": 0}]})
+            log = ChangeLog(data, directory)
+            with data.batch():
+                data["values"][1].x = 1
+                data["values"].insert(0, {"x": 9})
+                data["values"][2].x = 2
+            log.close()
+
+            self.assertEqual(to_plain(recover(directory)), to_plain(data))
+
+    def test_group_commit(self):
+        """Testing changes written when enough have been collected."""
+        with TemporaryDirectory() as directory:
+            data = make_responsive(create_data())
+            log = ChangeLog(data, directory, fsync_policy=FsyncPolicy.NEVER, group_size=3)
+            path = os.path.join(directory, LOG_FILENAME)
+            data.title = "b"
+            data.title = "c"
+            self.assertEqual(os.path.getsize(path), 0)
+            self.assertEqual(recover(directory).title, "a")
+
+            data.title = "d"
+            self.assertGreater(os.path.getsize(path), 0)
+            self.assertEqual(recover(directory).title, "d")
+
+            data.title = "e"
+            log.commit()
+            self.assertEqual(recover(directory).title, "e")
+            log.close()
+
+    def test_snapshot_interval(self):
+        """Testing new snapshot truncating the log."""
+        with TemporaryDirectory() as directory:
+            data = make_responsive(create_data())
+            log = ChangeLog(data, directory, group_size=1, snapshot_interval=5)
+            path = os.path.join(directory, LOG_FILENAME)
+            for index in range(5):
+                data.tags.append(index)
+            self.assertEqual(os.path.getsize(path), 0)
+            data.tags.append(5)
+            self.assertGreater(os.path.getsize(path), 0)
+            log.close()
+
+            self.assertEqual(to_plain(recover(directory)), to_plain(data))
+
+    def test_crash(self):
+        """Testing incomplete record and records before the snapshot being ignored."""
+        with TemporaryDirectory() as directory:
+            data = make_responsive(create_data())
+            log = ChangeLog(data, directory, group_size=1)
+            data.title = "b"
+            path = os.path.join(directory, LOG_FILENAME)
+            with open(path, "ab") as file:
+                payload = pickle.dumps(("other generation", [(2, 1, (), "title", "c", None)]))
+                file.write(RECORD_HEADER.pack(len(payload)) + payload)
+                file.write(RECORD_HEADER.pack(100) + b"incomplete")
+
+            self.assertEqual(to_plain(recover(directory)), dict(create_data(), title="b"))
+            log.close()
+
+    def test_nothing_to_recover(self):
+        """Testing recovery without snapshot."""
+        with TemporaryDirectory() as directory:
+            self.assertIsNone(recover(directory))
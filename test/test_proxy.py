@@ -0,0 +1,234 @@
+"""Module test_proxy.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pylint: disable=too-few-public-methods
+from dataclasses import dataclass, field
+from typing import ClassVar
+from unittest import TestCase
+
+from responsive.classify import register_type
+from responsive.computed import Computed
+from responsive.constants import Operation, ValueKind
+from responsive.data import make_responsive, to_plain
+from responsive.observer import DefaultObserver
+from responsive.proxy import ClassProxy, get_field_names, get_proxy_class
+from responsive.wrapper import DictWrapper, ListWrapper, get_options
+
+
+@dataclass
+class Details:
+    """Some dataclass."""
+
+    value: int
+
+
+@dataclass
+class Record:
+    """Some dataclass with a field named like a method of the wrapper."""
+
+    name: str
+    details: Details
+    items: list = field(default_factory=list)
+
+
+@dataclass
+class Named:
+    """Some dataclass with fields named like attributes of the wrapper."""
+
+    root: int
+    obj: int
+    options: bool
+
+
+class Annotated:
+    """Class with annotated fields."""
+
+    count: ClassVar[int] = 0
+    name: str
+
+    def __init__(self, name: str):
+        """Initialize fields."""
+        self.name = name
+
+
+class Slotted:
+    """Class with slots."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        """Initialize fields."""
+        self.name = name
+
+
+class Undeclared:
+    """Class without declared fields."""
+
+    def __init__(self, name: str):
+        """Initialize fields."""
+        self.name = name
+
+
+class Opaque:
+    """Class registered with own fields."""
+
+    name: str
+
+    def __init__(self):
+        """Initialize fields kept in another attribute."""
+        self.data = {"name": "a"}
+
+
+class TestProxy(TestCase):
+    """Testing generated proxy classes."""
+
+    def test_proxy_classes(self):
+        """Testing the wrapper classes generated (once) for classes."""
+        data = make_responsive([Record("a", Details(1)), Record("b", Details(2))], proxy=True)
+        self.assertIsInstance(data, ListWrapper)
+        self.assertIs(type(data[0]), type(data[1]))
+        self.assertEqual(type(data[0]).__name__, "RecordProxy")
+        self.assertIsInstance(data[0], ClassProxy)
+        self.assertIs(type(data[0].details), get_proxy_class(Details))
+
+        self.assertIs(get_proxy_class(dict), DictWrapper)
+        self.assertIs(get_proxy_class(Undeclared), DictWrapper)
+        self.assertIs(type(make_responsive(Record("a", Details(1)))), DictWrapper)
+
+    def test_field_names(self):
+        """Testing the names of the declared fields."""
+        self.assertEqual(get_field_names(Record), {"name": False, "details": False, "items": False})
+        self.assertEqual(get_field_names(Annotated), {"name": False})
+        self.assertEqual(get_field_names(Slotted), {"name": True})
+        self.assertEqual(get_field_names(Undeclared), {})
+
+    def test_read_and_change_fields(self):
+        """Testing fields as attributes of the proxies."""
+        for create in (
+            lambda: Record("a", Details(1)),
+            lambda: Annotated("a"),
+            lambda: Slotted("a"),
+        ):
+            for lazy in (False, True):
+                obj = create()
+                with self.subTest(obj=type(obj).__name__, lazy=lazy):
+                    observer = DefaultObserver()
+                    data = make_responsive({"item": obj}, lazy=lazy, proxy=True)
+                    data.add_observer(observer)
+
+                    self.assertEqual(data.item.name, "a")
+                    data.item.name = "b"
+                    self.assertEqual(obj.name, "b")
+                    self.assertEqual(list(observer)[-1][2]["path"], ("item", "name"))
+                    self.assertEqual(list(observer)[-1][2]["operation"], Operation.VALUE_CHANGED)
+
+                    del data.item.name
+                    self.assertEqual(list(observer)[-1][2]["operation"], Operation.VALUE_REMOVED)
+                    with self.assertRaises(AttributeError):
+                        _ = data.item.name
+                    with self.assertRaises(AttributeError):
+                        del data.item.name
+
+    def test_changes_like_dictionary_wrapper(self):
+        """Testing changes of fields by the proxies to notify like the dictionary wrapper."""
+        events = []
+        for proxy in (False, True):
+            for reconcile in (False, True):
+                observer = DefaultObserver()
+                data = make_responsive(Record("a", Details(1)), proxy=proxy, reconcile=reconcile)
+                data.add_observer(observer)
+                details = data.details
+                data.name = "b"
+                data.name = "b"
+                data.name = {"first": "c"}
+                data.name = "d"
+                data.details = 2
+                details.value = 3
+                data.details = Details(4)
+                events.append([(update[2]["path"], update[2]["old"]) for update in observer])
+
+        self.assertEqual(events[0], events[2])
+        self.assertEqual(events[1], events[3])
+        self.assertEqual(len(events[0]), 6)
+        self.assertEqual(len(events[1]), 5)
+
+    def test_unknown_names(self):
+        """Testing names which are not declared fields."""
+        data = make_responsive(Record("a", Details(1), [1]), proxy=True)
+        with self.assertRaises(AttributeError):
+            data.nmae = "b"
+        with self.assertRaises(AttributeError):
+            _ = data.nmae
+        self.assertNotIn("nmae", data)
+
+        data["extra"] = 1
+        self.assertEqual(data["extra"], 1)
+        self.assertEqual(data.extra, 1)
+        self.assertIsInstance(data["items"], ListWrapper)
+        self.assertEqual(
+            to_plain(data), {"name": "a", "details": {"value": 1}, "items": [1], "extra": 1}
+        )
+
+    def test_fields_named_like_wrapper_attributes(self):
+        """Testing fields named like attributes of the wrapper being changed in the data."""
+        observer = DefaultObserver()
+        obj = Named(1, 2, False)
+        data = make_responsive(obj, proxy=True)
+        data.add_observer(observer)
+
+        # set by name so a linter doesn't take the fields for the attributes of the wrapper
+        for name, value in (("root", 3), ("obj", 4), ("options", True)):
+            setattr(data, name, value)
+        self.assertEqual((obj.root, obj.obj, obj.options), (3, 4, True))
+        self.assertEqual([update[2]["name"] for update in observer], ["root", "obj", "options"])
+        self.assertIsNone(data.root)
+        self.assertIs(data.obj, obj)
+        self.assertIs(data.options, get_options(proxy=True))
+
+        del data.root
+        self.assertNotIn("root", data)
+        with self.assertRaises(AttributeError):
+            del data.unknown
+
+    def test_nested_values(self):
+        """Testing proxies for values assigned later and for reads of computed values."""
+        data = make_responsive({"records": []}, proxy=True)
+        data.records.append(Record("a", Details(1)))
+        data.records[0].details = Details(2)
+        self.assertIs(type(data.records[0].details), get_proxy_class(Details))
+
+        computed = Computed(data, lambda: sum(record.details.value for record in data.records))
+        self.assertEqual(computed.get_value(), 2)
+        data.records[0].details.value = 3
+        self.assertEqual(computed.get_value(), 3)
+
+    def test_registered_type(self):
+        """Testing types registered with own fields to be wrapped by the dictionary wrapper."""
+        register_type(Opaque, ValueKind.CLASS, lambda obj: obj.data)
+        try:
+            data = make_responsive(Opaque(), proxy=True)
+            self.assertIs(type(data), DictWrapper)
+            self.assertEqual(data.name, "a")
+        finally:
+            register_type(Opaque, ValueKind.VALUE)
@@ -0,0 +1,238 @@
+"""Module test_rate.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import threading
+from unittest import TestCase
+
+from responsive.data import make_responsive
+from responsive.observer import DefaultObserver
+from responsive.rate import (
+    MIN_PRUNE_SIZE,
+    DebounceObserver,
+    SamplingObserver,
+    Scheduler,
+    ThrottleObserver,
+)
+
+
+class Clock:
+    """Clock for tests (time changes when advanced only)."""
+
+    def __init__(self):
+        """Initialize clock at time 0."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get current time."""
+        return self.now
+
+
+def create_setup(create_observer):
+    """Create responsive data, scheduler (without thread) and observers."""
+    clock = Clock()
+    scheduler = Scheduler(clock=clock, threaded=False)
+    data = make_responsive({"progress": 0, "counter": 0, "items": []})
+    observer = DefaultObserver()
+    data.add_observer(create_observer(observer, scheduler))
+    return data, clock, scheduler, observer
+
+
+def advance(clock: Clock, scheduler: Scheduler, seconds: float) -> None:
+    """Advance clock running due callbacks."""
+    clock.now += seconds
+    scheduler.run_pending()
+
+
+def get_changes(observer: DefaultObserver) -> list[tuple]:
+    """Get name, old and new value of the delivered changes."""
+    return [(kwargs.get("name"), kwargs.get("old"), kwargs.get("new")) for _, _, kwargs in observer]
+
+
+class TestScheduler(TestCase):
+    """Testing class Scheduler."""
+
+    def test_run_pending(self):
+        """Testing callbacks run in order of time when being due."""
+        clock = Clock()
+        scheduler = Scheduler(clock=clock, threaded=False)
+        calls = []
+        scheduler.call_at(2.0, lambda: calls.append(2))
+        scheduler.call_at(1.0, lambda: calls.append(1))
+        scheduler.call_at(1.0, lambda: 1 / 0)
+
+        self.assertEqual(scheduler.run_pending(), 0)
+        clock.now = 1.5
+        self.assertEqual(scheduler.run_pending(), 2)
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(scheduler.get_errors()), 1)
+        self.assertEqual(scheduler.get_count_pending(), 1)
+
+    def test_last_errors(self):
+        """Testing the number of kept exceptions of callbacks being limited."""
+        scheduler = Scheduler(clock=Clock(), threaded=False, max_errors=2)
+        for key in range(3):
+            scheduler.call_at(0.0, lambda key=key: {}[key])
+
+        self.assertEqual(scheduler.run_pending(), 3)
+        self.assertEqual([error.args[0] for error in scheduler.get_errors()], [1, 2])
+
+    def test_thread(self):
+        """Testing callbacks run by the thread."""
+        scheduler = Scheduler()
+        called = threading.Event()
+        scheduler.call_at(scheduler.clock() + 0.01, called.set)
+        self.assertTrue(called.wait(5.0))
+        scheduler.close()
+
+
+class TestDebounceObserver(TestCase):
+    """Testing class DebounceObserver."""
+
+    def test_quiet_period(self):
+        """Testing delivery after the value hasn't changed for the quiet period."""
+        data, clock, scheduler, observer = create_setup(
+            lambda observer, scheduler: DebounceObserver(observer, 1.0, scheduler)
+        )
+        for value in range(1, 6):
+            data.progress = value
+            advance(clock, scheduler, 0.5)
+        self.assertEqual(observer.get_count_updates(), 0)
+
+        advance(clock, scheduler, 0.5)
+        self.assertEqual(get_changes(observer), [("progress", 0, 5)])
+        self.assertEqual(scheduler.get_count_pending(), 0)
+
+    def test_order_with_structural_changes(self):
+        """Testing that pending changes are delivered before adding a value."""
+        data, _, _, observer = create_setup(
+            lambda observer, scheduler: DebounceObserver(observer, 1.0, scheduler)
+        )
+        data.progress = 1
+        data.counter = 1
+        data["items"].append(1)
+        self.assertEqual(
+            get_changes(observer), [("progress", 0, 1), ("counter", 0, 1), (None, None, 1)]
+        )
+
+
+class TestThrottleObserver(TestCase):
+    """Testing class ThrottleObserver."""
+
+    def test_interval(self):
+        """Testing at most one delivery per interval with latest value."""
+        data, clock, scheduler, observer = create_setup(
+            lambda observer, scheduler: ThrottleObserver(observer, 1.0, scheduler)
+        )
+        for value in range(1, 11):
+            data.progress = value
+            data.counter = -value
+            advance(clock, scheduler, 0.25)
+
+        self.assertEqual(
+            get_changes(observer),
+            [
+                ("progress", 0, 1),
+                ("counter", 0, -1),
+                ("progress", 1, 4),
+                ("counter", -1, -4),
+                ("progress", 4, 8),
+                ("counter", -4, -8),
+            ],
+        )
+        advance(clock, scheduler, 1.0)
+        self.assertEqual(get_changes(observer)[-2:], [("progress", 8, 10), ("counter", -8, -10)])
+
+    def test_batch(self):
+        """Testing changes of a batch handled one by one."""
+        data, clock, scheduler, observer = create_setup(
+            lambda observer, scheduler: ThrottleObserver(observer, 1.0, scheduler)
+        )
+        with data.batch():
+            data.progress = 1
+            data.counter = 1
+        data.progress = 2
+        self.assertEqual(observer.get_count_updates(), 2)
+        advance(clock, scheduler, 1.0)
+        self.assertEqual(get_changes(observer)[-1], ("progress", 1, 2))
+
+    def test_interests(self):
+        """Testing interests of the observer the changes are delivered to."""
+        data = make_responsive({"progress": 0, "counter": 0})
+        observer = DefaultObserver()
+        observer.set_interests({"name": "progress"})
+        throttle = ThrottleObserver(observer, 1.0, Scheduler(clock=Clock(), threaded=False))
+        data.add_observer(throttle)
+        self.assertEqual(throttle.get_interests(), {"name": "progress"})
+
+        data.counter = 1
+        data.progress = 1
+        self.assertEqual(get_changes(observer), [("progress", 0, 1)])
+
+    def test_delivery_times_pruned(self):
+        """Testing delivery times of values changed long ago being forgotten."""
+        data = make_responsive({f"value {index}": 0 for index in range(3 * MIN_PRUNE_SIZE)})
+        clock = Clock()
+        throttle = ThrottleObserver(DefaultObserver(), 1.0, Scheduler(clock=clock, threaded=False))
+        data.add_observer(throttle)
+        for index in range(3 * MIN_PRUNE_SIZE):
+            data[f"value {index}"] = 1
+            clock.now += 0.01
+
+        self.assertLessEqual(throttle.get_count_keys(), MIN_PRUNE_SIZE + 1)
+
+
+class TestSamplingObserver(TestCase):
+    """Testing class SamplingObserver."""
+
+    def test_every(self):
+        """Testing delivery of every n-th change of a value."""
+        data = make_responsive({"progress": 0})
+        observer = DefaultObserver()
+        sampling = SamplingObserver(observer, 10)
+        data.add_observer(sampling)
+        for value in range(1, 26):
+            data.progress = value
+
+        self.assertEqual(get_changes(observer), [("progress", 0, 10), ("progress", 10, 20)])
+        self.assertEqual(sampling.get_count_pending(), 1)
+        sampling.flush()
+        self.assertEqual(get_changes(observer)[-1], ("progress", 20, 25))
+        self.assertEqual(sampling.get_count_keys(), 0)
+
+    def test_counts_forgotten(self):
+        """Testing counts of values being forgotten on delivery."""
+        data = make_responsive({f"value {index}": 0 for index in range(100)})
+        sampling = SamplingObserver(DefaultObserver(), 2)
+        data.add_observer(sampling)
+        for index in range(100):
+            data[f"value {index}"] = 1
+        self.assertEqual(sampling.get_count_keys(), 100)
+        for index in range(100):
+            data[f"value {index}"] = 2
+        self.assertEqual(sampling.get_count_keys(), 0)
+
+    def test_invalid(self):
+        """Testing invalid number of changes."""
+        with self.assertRaises(ValueError):
+            SamplingObserver(DefaultObserver(), 0)
@@ -0,0 +1,178 @@
+"""Module test_replication.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+# pickle measures the size of messages only (nothing is loaded)
+import pickle  # nosec B403
+from multiprocessing import Pipe
+from unittest import TestCase
+
+from responsive.data import make_responsive, to_plain
+from responsive.observer import DefaultObserver
+from responsive.replication import ReplicationFollower, ReplicationObserver
+
+
+def create_data() -> dict:
+    """Create test data."""
+    return {
+        "some_str": "a",
+        "some_list": [1, 2, {"inner_str": "b", "inner_list": [3, 4]}],
+        "some_dict": {"some_int": 5},
+    }
+
+
+class ReplicationTest(TestCase):
+    """Testing replication of a responsive object."""
+
+    def test_replication_through_pipe(self):
+        """Testing changes being applied to the mirror."""
+        receiving, sending = Pipe(duplex=False)
+        data = make_responsive(create_data())
+        ReplicationObserver(data, sending.send)
+        follower = ReplicationFollower()
+        observer = DefaultObserver()
+        follower.add_observer(observer)
+
+        data.some_str = "c"
+        data.some_list[2].inner_str = "d"
+        data.some_list[2].inner_list.append(5)
+        data.some_list.remove(1)
+        data.some_list[1].inner_list[0] = 6
+        data.some_dict = {"some_int": 7}
+        data.some_dict.some_int = 8
+        with data.batch():
+            data.some_str = "e"
+            data.some_list.append({"inner_str": "f"})
+        data.some_list[-1].inner_str = "g"
+        data.some_list.extend([7, 8, 9])
+        data.some_list.insert(0, 10)
+        del data.some_list[2:4]
+        data.some_list[1:2] = [11, 12]
+        data.some_list.sort(key=str)
+        data.some_list.pop()
+        data.some_dict["other int"] = 9
+        data.some_dict.update({"some_int": 10, "items": [13]})
+        data.some_dict["items"].append(14)
+        del data.some_dict["other int"]
+        data.some_dict["more"] = {"a": 1, "b": 2}
+        data.some_dict["more"].clear()
+
+        while receiving.poll():
+            follower.apply(receiving.recv())
+
+        self.assertTrue(follower.is_in_sync())
+        self.assertEqual(to_plain(follower.get_data()), to_plain(data))
+        self.assertEqual(observer.get_count_updates(), 23)
+
+    def test_batch_with_shifted_values(self):
+        """Testing changes of a batch applied in order around a change of the structure."""
+        messages = []
+        data = make_responsive({"values": [{"x": 0}, {"x": 0}, {"x": 0}]})
+        ReplicationObserver(data, messages.append)
+        with data.batch():
+            data["values"][1].x = 1
+            data["values"].insert(0, {"x": 9})
+            data["values"][2].x = 2
+            data["values"][1] = {"x": 3}
+            data["values"][1].x = 4
+            data["values"][1] = {"x": 5}
+
+        follower = ReplicationFollower()
+        for message in messages:
+            follower.apply(message)
+        self.assertEqual(to_plain(follower.get_data()), to_plain(data))
+
+    def test_batch_changing_assigned_list(self):
+        """Testing a list assigned and changed in the same batch."""
+        messages = []
+        data = make_responsive({})
+        ReplicationObserver(data, messages.append)
+        with data.batch():
+            data["f"] = [1]
+            data.f.append(2)
+
+        follower = ReplicationFollower()
+        for message in messages:
+            follower.apply(message)
+        self.assertEqual(to_plain(follower.get_data()), {"f": [1, 2]})
+
+    def test_message_size(self):
+        """Testing size of a message not depending on size of the data."""
+        messages = []
+        data = make_responsive({"records": [{"value": index} for index in range(10000)]})
+        ReplicationObserver(data, messages.append)
+        data.records[5000].value = -1
+
+        self.assertGreater(len(pickle.dumps(messages[0])), 10000)
+        self.assertLess(len(pickle.dumps(messages[1])), 100)
+        self.assertEqual(messages[1][1:], (1, ("records", 5000), "value", -1, None))
+
+    def test_removed_data(self):
+        """Testing changes of removed data not being sent."""
+        messages = []
+        data = make_responsive(create_data())
+        ReplicationObserver(data, messages.append)
+        inner = data.some_list[2]
+        data.some_list.pop(0)
+        inner.inner_str = "c"
+        self.assertEqual(messages[-1][1:], (1, ("some_list", 1), "inner_str", "c", None))
+        data.some_list.remove(inner)
+        inner.inner_str = "d"
+        self.assertEqual(len(messages), 4)
+
+    def test_missing_message_and_resync(self):
+        """Testing follower ignoring changes after a missing message until resync."""
+        messages, requests = [], []
+        data = make_responsive(create_data())
+        leader = ReplicationObserver(data, messages.append)
+        follower = ReplicationFollower(request_resync=lambda: requests.append(True))
+
+        data.some_str = "b"
+        data.some_str = "c"
+        data.some_str = "d"
+        follower.apply(messages[0])
+        follower.apply(messages[1])
+        follower.apply(messages[3])
+        self.assertFalse(follower.is_in_sync())
+        self.assertEqual(requests, [True])
+        self.assertEqual(follower.get_data().some_str, "b")
+
+        leader.resync()
+        follower.apply(messages[-1])
+        self.assertTrue(follower.is_in_sync())
+        self.assertEqual(follower.get_data().some_str, "d")
+
+    def test_lazy_data(self):
+        """Testing changes of lazy wrapped data being sent as changes."""
+        messages = []
+        data = make_responsive(create_data(), lazy=True)
+        ReplicationObserver(data, messages.append)
+        follower = ReplicationFollower()
+
+        data.some_dict.some_int = 6
+        data.some_dict.some_int = 7
+        for message in messages:
+            follower.apply(message)
+
+        self.assertEqual([message[1] for message in messages], [0, 1, 1])
+        self.assertEqual(follower.get_data().some_dict.some_int, 7)
@@ -0,0 +1,162 @@
+"""Module test_serialization.
+
+The MIT License
+
+Copyright 2022 Thomas Lehmann.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+import json
+from unittest import TestCase
+
+from responsive.data import make_responsive, to_plain
+from responsive.serialization import JsonCache, ResponsiveJSONEncoder, dumps
+
+
+class Point:
+    """Some class."""
+
+    def __init__(self, x: float, y: float):
+        """Initialize point."""
+        self.x = x
+        self.y = y
+
+
+def create_data() -> dict:
+    """Create test data."""
+    return {
+        "text": 'ä "quoted"\n',
+        "numbers": [1, 2.5, -3, True, None],
+        "records": [{"name": f"r{index}", "tags": ["a", "b"]} for index in range(5)],
+        "point": Point(1.0, 2.0),
+        "keys": {1: "int", 2.5: "float", None: "none", False: "bool"},
+        "empty": {"dict": {}, "list": []},
+    }
+
+
+CHANGES = [
+    lambda data: setattr(data, "text", "changed"),
+    lambda data: setattr(data.records[2], "name", "x"),
+    lambda data: data.records[3].tags.append("c"),
+    lambda data: data.records.insert(0, {"name": "new"}),
+    lambda data: data.records.__delitem__(slice(1, 3)),
+    lambda data: data.records.reverse(),
+    lambda data: setattr(data.point, "y", 3.5),
+    lambda data: setattr(data, "point", Point(0.0, 0.0)),
+    lambda data: data.empty.dict.update({"a": [1], "b": 2}),
+    lambda data: data.empty.list.extend([{"a": 1}]),
+    lambda data: data.records[1].clear(),
+    lambda data: data.__delitem__("records"),
+]
+
+
+class TestSerialization(TestCase):
+    """Testing JSON of responsive data."""
+
+    def test_encoder(self):
+        """Testing encoder getting the same JSON as for the plain data."""
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                data = make_responsive(create_data(), lazy=lazy)
+                expected = json.dumps(to_plain(data))
+                self.assertEqual(dumps(data), expected)
+                self.assertEqual(json.dumps(data, cls=ResponsiveJSONEncoder), expected)
+                self.assertEqual(dumps(data, indent=2), json.dumps(to_plain(data), indent=2))
+
+    def test_encoder_unsupported_value(self):
+        """Testing encoder failing for values without JSON."""
+        with self.assertRaises(TypeError):
+            dumps(make_responsive({"value": {1, 2}}))
+
+    def test_cache_unsupported_key(self):
+        """Testing cached JSON failing for keys which json.dumps rejects."""
+        data = make_responsive({"keys": {(1, 2): "tuple"}})
+        with self.assertRaises(TypeError):
+            json.dumps(to_plain(data))
+        with self.assertRaises(TypeError):
+            JsonCache(data).dumps()
+
+    def test_cache(self):
+        """Testing cached JSON being the same as the JSON of the plain data after changes."""
+        for lazy in (False, True):
+            data = make_responsive(create_data(), lazy=lazy)
+            cache = JsonCache(data)
+            self.assertEqual(cache.dumps(), json.dumps(to_plain(data)))
+            for number, change in enumerate(CHANGES):
+                with self.subTest(lazy=lazy, number=number):
+                    change(data)
+                    self.assertEqual(cache.dumps(), json.dumps(to_plain(data)))
+
+    def test_cache_batch(self):
+        """Testing cached JSON after a batch of changes of the structure."""
+        data = make_responsive(create_data())
+        cache = JsonCache(data)
+        cache.dumps()
+        with data.batch():
+            data.records[4].name = "x"
+            del data.records[0]
+            data.records[0].tags.append("z")
+            data.empty = {"other": [1]}
+        self.assertEqual(cache.dumps(), json.dumps(to_plain(data)))
+
+    def test_cache_batch_with_shifted_values(self):
+        """Testing cached JSON after a batch changing values around a change of the structure."""
+        data = make_responsive({"values": [{"inner": {"x": 0}} for _ in range(3)]})
+        cache = JsonCache(data)
+        cache.dumps()
+        with data.batch():
+            data["values"][1].inner.x = 1
+            data["values"].insert(0, {"inner": {"x": 9}})
+        self.assertEqual(cache.dumps(), json.dumps(to_plain(data)))
+
+        with data.batch():
+            data["values"][0].inner.x = 2
+            data["values"][3].inner.x = 3
+        self.assertEqual(cache.dumps(), json.dumps(to_plain(data)))
+
+    def test_cache_batch_replacing_dictionary(self):
+        """Testing cached JSON of a dictionary replaced in a batch and assigned again."""
+        data = make_responsive({"a": {"x": 1}, "b": 0})
+        cache = JsonCache(data)
+        cache.dumps()
+        removed = data.a
+        with data.batch():
+            data.a = {"x": 2}
+            data.b = 1
+        removed.x = 5
+        data.c = removed
+        self.assertEqual(cache.dumps(), json.dumps(to_plain(data)))
+
+    def test_cache_reuse(self):
+        """Testing that unchanged parts are not encoded again."""
+        data = make_responsive(create_data())
+        cache = JsonCache(data)
+        cache.dumps()
+        count = cache.get_count_cached()
+
+        data.records[2].tags.append("c")
+        self.assertEqual(cache.get_count_cached(), count - 4)
+        self.assertEqual(cache.dumps(data.records[2]), json.dumps(to_plain(data.records[2])))
+
+        data.records = []
+        # numbers, point, keys and empty (with its dictionary and list) are kept
+        self.assertEqual(cache.get_count_cached(), 6)
+        cache.close()
+        data.text = "closed"
+        self.assertEqual(cache.get_count_cached(), 0)
@@ -25,8 +25,14 @@ THE SOFTWARE.
 # pylint: disable=compare-to-zero,no-self-use
 from unittest import TestCase
 
-from responsive.observer import DefaultObserver
+from responsive.constants import Operation
+from responsive.data import make_responsive
+from responsive.observer import DefaultObserver, OutputObserver
 from responsive.subject import Subject
+from responsive.wrapper import DictWrapper
+
+CHANGED = Operation.VALUE_CHANGED
+REMOVED = Operation.VALUE_REMOVED
 
 
 class SubjectTest(TestCase):
@@ -80,3 +86,150 @@ class SubjectTest(TestCase):
         subject.remove_observer(observer)
         subject.notify()
         self.assertEqual(observer.get_count_updates(), 0)
+
+    def test_batch_coalesces_notifications(self):
+        """Testing batch with repeated changes of same value."""
+        observer = DefaultObserver()
+        subject = Subject()
+        subject.add_observer(observer)
+
+        with subject.batch():
+            for value in range(100):
+                subject.notify(id=1, name="a", old=value, new=value + 1, operation=CHANGED)
+            with subject.batch():
+                subject.notify(id=1, name="b", old=0, new=1, operation=CHANGED)
+            self.assertEqual(observer.get_count_updates(), 0)
+
+        self.assertEqual(observer.get_count_updates(), 1)
+        kwargs = list(observer)[0][2]
+        self.assertEqual(kwargs["operation"], Operation.BATCH)
+        self.assertEqual(
+            [(event["name"], event["old"], event["new"]) for event in kwargs["events"]],
+            [("a", 0, 100), ("b", 0, 1)],
+        )
+
+    def test_batch_keeps_order_of_structural_changes(self):
+        """Testing batch not coalescing changes across an add or remove."""
+        observer = DefaultObserver()
+        subject = Subject()
+        subject.add_observer(observer)
+
+        with subject.batch():
+            subject.notify(id=1, index=0, old=1, new=2, operation=CHANGED)
+            subject.notify(id=1, old=2, operation=Operation.VALUE_REMOVED)
+            subject.notify(id=1, index=0, old=3, new=4, operation=CHANGED)
+
+        events = list(observer)[0][2]["events"]
+        self.assertEqual([event["operation"] for event in events], [CHANGED, REMOVED, CHANGED])
+
+    def test_batch_copies_changed_containers(self):
+        """Testing changes of a batch not showing later changes of an assigned list."""
+        observer = DefaultObserver()
+        data = make_responsive({})
+        data.add_observer(observer)
+
+        with data.batch():
+            data["f"] = [1]
+            data.f.append(2)
+            data["f"] = [3]
+
+        events = list(observer)[0][2]["events"]
+        self.assertEqual([event.get("old") for event in events], [None, None, [1, 2]])
+        self.assertEqual([event["new"] for event in events], [[1], 2, [3]])
+
+    def test_batch_with_single_notification(self):
+        """Testing batch with one notification only (delivered as it is)."""
+        observer = DefaultObserver()
+        observer.set_interests({"name": lambda value: value == "a"})
+        subject = Subject()
+        subject.add_observer(observer)
+
+        with subject.batch():
+            subject.notify(id=1, name="a", old=0, new=1, operation=CHANGED)
+
+        with subject.batch():
+            subject.notify(id=1, name="b", old=0, new=1, operation=CHANGED)
+            subject.notify(id=1, name="c", old=0, new=1, operation=CHANGED)
+
+        self.assertEqual(observer.get_count_updates(), 1)
+        self.assertEqual(list(observer)[0][2]["operation"], CHANGED)
+
+    def test_refresh_interests(self):
+        """Testing changed interests of a registered observer."""
+        observer = DefaultObserver()
+        subject = Subject()
+        subject.add_observer(observer)
+
+        observer.set_interests({"value": lambda value: value == 1})
+        subject.refresh_interests(observer)
+        subject.notify(value=2)
+        subject.notify(value=1)
+
+        observer.set_interests({})
+        subject.refresh_interests()
+        subject.notify(value=2)
+        self.assertEqual(observer.get_count_updates(), 2)
+
+    def test_notify_in_order_of_registration(self):
+        """Testing observers with and without interests notified in order of registration."""
+        updates = []
+        subject = Subject()
+        for number in range(6):
+            observer = OutputObserver(
+                output_function=lambda _, number=number: updates.append(number)
+            )
+            if number % 2 == 0:
+                observer.get_interests = lambda: {"name": lambda value: value == "a"}
+            subject.add_observer(observer)
+
+        subject.notify(name="a")
+        subject.notify(name="b")
+        self.assertEqual(updates, [0, 1, 2, 3, 4, 5, 1, 3, 5])
+
+    def test_observer_with_interest_in_value(self):
+        """Testing interest given by value (instead of a function)."""
+        observer = DefaultObserver()
+        observer.set_interests({"name": "a"})
+        subject = Subject()
+        subject.add_observer(observer)
+        subject.notify(name="a", new=[1, 2])
+        subject.notify(name="b")
+        subject.notify(name=["a"])
+
+        subject.remove_observer(observer)
+        subject.notify(name="a")
+        self.assertEqual(observer.get_count_updates(), 1)
+
+    def test_observers_by_identity(self):
+        """Testing observers being equal (but not identical) registered both."""
+        first, second = DictWrapper({"a": 1}), DictWrapper({"a": 1})
+        subject = Subject()
+        subject.add_observer(first)
+        subject.add_observer(second)
+        self.assertTrue(subject.has_observer(first))
+        self.assertTrue(subject.has_observer(second))
+
+        subject.remove_observer(second)
+        self.assertTrue(subject.has_observer(first))
+        self.assertFalse(subject.has_observer(second))
+        self.assertRaises(ValueError, subject.remove_observer, second)
+
+    def test_remove_observer_while_notifying(self):
+        """Testing observers removing themselves while being notified."""
+        subject = Subject()
+        observers = [DefaultObserver() for _ in range(4)]
+
+        def update(observer, *args, **kwargs):
+            """Record update and unsubscribe."""
+            DefaultObserver.update(observer, *args, **kwargs)
+            subject.remove_observer(observer)
+
+        for observer in observers:
+            observer.update = lambda *args, observer=observer, **kwargs: update(
+                observer, *args, **kwargs
+            )
+            subject.add_observer(observer)
+
+        subject.notify()
+        subject.notify()
+        self.assertEqual([observer.get_count_updates() for observer in observers], [1, 1, 1, 1])
@@ -22,7 +22,15 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
-from responsive.observer import DefaultObserver, DoNothingObserver
+from responsive.data import make_responsive
+from responsive.observer import (
+    DefaultObserver,
+    DoNothingObserver,
+    Observer,
+    RingBufferObserver,
+    ScalarRingBufferObserver,
+)
+from responsive.rate import Scheduler, ThrottleObserver
 from responsive.subject import Subject
 
 
@@ -34,6 +42,27 @@ def test_subject_observer_with_default_observer_performance(benchmark):
     benchmark(subject.notify)
 
 
+def test_subject_observer_with_ring_buffer_observer_performance(benchmark):
+    """Testing notification recorded by a ring buffer (full after a few rounds)."""
+    observer = RingBufferObserver(capacity=1000)
+    subject = Subject()
+    subject.add_observer(observer)
+    benchmark(subject.notify)
+
+
+def test_responsive_data_with_scalar_ring_buffer_observer_performance(benchmark):
+    """Testing changes recorded by an array backed ring buffer."""
+    observer = ScalarRingBufferObserver(capacity=1000)
+    data = make_responsive({"value": 0})
+    data.add_observer(observer)
+
+    def func():
+        """Function for benchmarking."""
+        data.value = 1
+
+    benchmark(func)
+
+
 def test_subject_with_one_observer_with_special_interest_performance(benchmark):
     """Testing advanced notification mechanism."""
     observer = DefaultObserver()
@@ -56,3 +85,157 @@ def test_subject_with_do_nothing_observer_performance(benchmark):
     subject = Subject()
     subject.add_observer(observer)
     benchmark(subject.notify)
+
+
+def test_subject_with_many_observers_with_one_interest_each_performance(benchmark):
+    """Testing notification with 500 observers each interested in another field (by value)."""
+    subject = Subject()
+    for index in range(500):
+        observer = DoNothingObserver()
+        observer.get_interests = lambda index=index: {"name": index}
+        subject.add_observer(observer)
+
+    def func():
+        """Function for benchmarking."""
+        subject.notify(id=0, name=250, old=0, new=1)
+
+    benchmark(func)
+
+
+def test_subject_with_many_observers_interested_in_other_keys_performance(benchmark):
+    """Testing notification with 500 observers interested in keys not in the notification."""
+    subject = Subject()
+    for index in range(500):
+        observer = DoNothingObserver()
+        observer.get_interests = lambda index=index: {f"key{index}": lambda value: True}
+        subject.add_observer(observer)
+
+    def func():
+        """Function for benchmarking."""
+        subject.notify(id=0, name="a", old=0, new=1)
+
+    benchmark(func)
+
+
+def test_subject_with_many_observers_with_one_predicate_each_performance(benchmark):
+    """Testing notification with 500 observers each interested in another field (by function)."""
+    subject = Subject()
+    for index in range(500):
+        observer = DoNothingObserver()
+        observer.get_interests = lambda index=index: {"name": lambda value: value == index}
+        subject.add_observer(observer)
+
+    def func():
+        """Function for benchmarking."""
+        subject.notify(id=0, name=250, old=0, new=1)
+
+    benchmark(func)
+
+
+def test_subject_add_and_remove_observer_with_many_observers_performance(benchmark):
+    """Testing add and remove of an observer with 1000 wrappers registered as observers."""
+    subject = Subject()
+    for index in range(1000):
+        subject.add_observer(make_responsive({"value": index, "values": list(range(100))}))
+    observer = make_responsive({"value": 0, "values": list(range(100))})
+
+    def func():
+        """Function for benchmarking."""
+        subject.add_observer(observer)
+        subject.remove_observer(observer)
+
+    benchmark(func)
+
+
+def create_orders_with_path_observers(count: int) -> object:
+    """Create responsive orders with observers for path patterns.
+
+    Args:
+        count (int): number of orders (with one observer for the status of each)
+
+    Returns:
+        responsive data.
+    """
+    data = make_responsive({"orders": [{"status": "new"} for _ in range(count)]})
+    for index in range(count):
+        data.add_path_observer(("orders", index, "status"), DoNothingObserver())
+    data.add_path_observer("orders[*].status", DoNothingObserver())
+    return data
+
+
+def test_subject_with_many_path_observers_performance(benchmark):
+    """Testing notification with 10000 observers for path patterns (one is matching)."""
+    data = create_orders_with_path_observers(10000)
+    order = data.orders[5000]
+
+    def func():
+        """Function for benchmarking."""
+        order.status = "paid"
+
+    benchmark(func)
+
+
+def test_subject_with_many_path_observers_not_matching_performance(benchmark):
+    """Testing notification with 10000 observers for path patterns (none is matching)."""
+    data = create_orders_with_path_observers(10000)
+    data["other"] = 0
+
+    def func():
+        """Function for benchmarking."""
+        data["other"] = 1
+
+    benchmark(func)
+
+
+def test_subject_with_many_predicate_observers_on_path_performance(benchmark):
+    """Testing notification with 10000 observers filtering the path by function (comparison)."""
+    data = make_responsive({"orders": [{"status": "new"} for _ in range(10000)]})
+    for index in range(10000):
+        observer = DoNothingObserver()
+        observer.get_interests = lambda index=index: {
+            "path": lambda path, index=index: path == ("orders", index, "status")
+        }
+        data.add_observer(observer)
+    order = data.orders[5000]
+
+    def func():
+        """Function for benchmarking."""
+        order.status = "paid"
+
+    benchmark(func)
+
+
+class ExpensiveObserver(Observer):
+    """Observer taking some time for each notification."""
+
+    def update(self, subject, *args, **kwargs):
+        """Summing numbers (instead of e.g. rendering)."""
+        sum(range(10000))
+
+
+def test_hot_field_with_expensive_observer_performance(benchmark):
+    """Testing 1000 writes of a hot field notifying an expensive observer directly."""
+    data = make_responsive({"progress": 0})
+    data.add_observer(ExpensiveObserver())
+
+    def func():
+        """Function for benchmarking."""
+        for value in range(1000):
+            data.progress = value
+
+    benchmark(func)
+
+
+def test_hot_field_with_throttled_expensive_observer_performance(benchmark):
+    """Testing 1000 writes of a hot field notifying an expensive observer throttled."""
+    scheduler = Scheduler()
+    data = make_responsive({"progress": 0})
+    data.add_observer(ThrottleObserver(ExpensiveObserver(), 0.1, scheduler))
+
+    def func():
+        """Function for benchmarking."""
+        for value in range(1000):
+            data.progress = value
+
+    benchmark(func)
+    scheduler.close()